@@ -14,14 +14,12 @@ from os import environ
 from typing import Dict, Any
 
 # Layer imports
-from orcabus_api_tools.workflow import add_comment_to_workflow_run
+from tso500_ctdna_tools.comments import format_comment_with_arn, add_workflow_run_comment
 
 # Globals
 WORKFLOW_NAME_ENV_VAR = "WORKFLOW_NAME"
 REPOSITORY_GITHUB_URL_ENV_VAR = "REPOSITORY_GITHUB_URL"
 COMMENT_AUTHOR = "{workflow_name}-populate-draft-data-service"
-MAX_COMMENT_LENGTH = 1024
-TRUNCATION_SUFFIX = "\n... [truncated, see execution ARN for full detail]"
 
 COMMENT_TEMPLATES = {
     "tags_changed": "Updating draft tags before proceeding to input population.",
@@ -68,20 +66,10 @@ def handler(event: Dict[str, Any], context) -> Dict[str, bool]:
     elif comment_type == "no_change_missing_fields":
         body = body.format(missing_fields_list="\n- (none detected)", repo_url=repo_url)
 
-    footer = f"---\nStep Functions Execution: {execution_arn}"
-
-    full_comment = f"{body}\n{footer}"
-
-    # Enforce 1024 char limit
-    if len(full_comment) > MAX_COMMENT_LENGTH:
-        # Keep the footer, truncate the body
-        available = MAX_COMMENT_LENGTH - len(footer) - len(TRUNCATION_SUFFIX) - 1  # -1 for newline
-        full_comment = f"{body[:available]}{TRUNCATION_SUFFIX}\n{footer}"
-
-    add_comment_to_workflow_run(
-        workflow_run_orcabus_id=workflow_run_id,
-        comment=full_comment,
-        author=author,
+    add_workflow_run_comment(
+        workflow_run_id,
+        format_comment_with_arn(body, execution_arn),
+        author,
     )
 
     return {"commentAdded": True}
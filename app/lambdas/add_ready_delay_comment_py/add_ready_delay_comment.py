@@ -13,16 +13,12 @@ from os import environ
 from typing import Dict, Any
 
 # Layer imports
-from orcabus_api_tools.workflow import (
-    add_comment_to_workflow_run,
-    get_workflow_run_from_portal_run_id
-)
+from orcabus_api_tools.workflow import get_workflow_run_from_portal_run_id
+from tso500_ctdna_tools.comments import format_comment_with_arn, add_workflow_run_comment
 
 # Globals
 WORKFLOW_NAME_ENV_VAR = "WORKFLOW_NAME"
 COMMENT_AUTHOR = "{workflow_name}-ready-to-icav2-wes-service"
-MAX_COMMENT_LENGTH = 1024
-TRUNCATION_SUFFIX = "\n... [truncated, see execution ARN for full detail]"
 
 
 def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
@@ -63,18 +59,10 @@ def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
         "Note: There may be a delay between READY and SUBMITTED due to ORA-to-FASTQ decompression time."
     )
 
-    footer = f"---\nStep Functions Execution: {execution_arn}"
-    full_comment = f"{body}\n{footer}"
-
-    # Enforce 1024 char limit
-    if len(full_comment) > MAX_COMMENT_LENGTH:
-        available = MAX_COMMENT_LENGTH - len(footer) - len(TRUNCATION_SUFFIX) - 1
-        full_comment = f"{body[:available]}{TRUNCATION_SUFFIX}\n{footer}"
-
-    add_comment_to_workflow_run(
-        workflow_run_orcabus_id=workflow_run_id,
-        comment=full_comment,
-        author=author,
+    add_workflow_run_comment(
+        workflow_run_id,
+        format_comment_with_arn(body, execution_arn),
+        author,
     )
 
     return {
@@ -8,15 +8,12 @@ The ICA analysis has failed, we add a comment to the analysis
 from os import environ
 
 # Local imports
-from orcabus_api_tools.workflow import (
-    add_comment_to_workflow_run, get_workflow_run_from_portal_run_id
-)
+from orcabus_api_tools.workflow import get_workflow_run_from_portal_run_id
+from tso500_ctdna_tools.comments import format_comment_with_arn, add_workflow_run_comment
 
 # Globals
 WORKFLOW_NAME_ENV_VAR = "WORKFLOW_NAME"
 COMMENT_AUTHOR = "{WORKFLOW_NAME}-icav2-wes-event-service"
-MAX_COMMENT_LENGTH = 1024
-TRUNCATION_SUFFIX = "\n... [truncated, see execution ARN for full detail]"
 
 
 def handler(event, context):
@@ -43,19 +40,12 @@ def handler(event, context):
 
     # Construct the comment body
     body = f"The workflow has failed with error type '{error_type}', full traceback can be found at '{error_message_uri}'"
-    footer = f"---\nStep Functions Execution: {execution_arn}"
-    full_comment = f"{body}\n{footer}"
-
-    # Enforce 1024 char limit
-    if len(full_comment) > MAX_COMMENT_LENGTH:
-        available = MAX_COMMENT_LENGTH - len(footer) - len(TRUNCATION_SUFFIX) - 1
-        full_comment = f"{body[:available]}{TRUNCATION_SUFFIX}\n{footer}"
 
     # Construct the comment
-    add_comment_to_workflow_run(
-        workflow_run_orcabus_id=workflow_run_id,
-        comment=full_comment,
-        author=COMMENT_AUTHOR.format(
+    add_workflow_run_comment(
+        workflow_run_id,
+        format_comment_with_arn(body, execution_arn),
+        COMMENT_AUTHOR.format(
             WORKFLOW_NAME=environ.get(WORKFLOW_NAME_ENV_VAR)
         )
     )
@@ -18,8 +18,8 @@ from itertools import product
 from orcabus_api_tools.fastq import (
     validate_ntsm_internal,
     validate_ntsm_external,
-    get_fastq_by_rgid
 )
+from tso500_ctdna_tools.fastq import get_fastqs_by_rgid_list
 
 
 def non_duplicate_cross_product(lst):
@@ -40,8 +40,8 @@ def handler(event, context):
     fastq_rgid_list = event.get("fastqRgidList", [])
 
     fastq_set_id_list = list(map(
-        lambda rgid_iter_: get_fastq_by_rgid(rgid_iter_)['fastqSetId'],
-        fastq_rgid_list
+        lambda fastq_iter_: fastq_iter_['fastqSetId'],
+        get_fastqs_by_rgid_list(fastq_rgid_list)
     ))
 
     if len(fastq_set_id_list) == 0:
@@ -4,6 +4,9 @@
 Generate fastq uri by fastq id map
 
 Given fastqIdList and fastqListRows, provide a dict of fastqIds to fileUris
+
+The fastq list rows must all come from the same instrument run, the ORA files are decompressed into a single
+directory using their original file names, which are only unique within a run.
 """
 
 # Standard imports
@@ -11,7 +14,7 @@ from typing import Dict, List
 import typing
 
 # Layer imports
-from orcabus_api_tools.fastq import get_fastq_by_rgid
+from tso500_ctdna_tools.fastq import get_fastq_by_rgid_map
 
 
 # Type hints
@@ -27,11 +30,28 @@ def handler(event, context) -> Dict[str, Dict[str, List[str]]]:
     fastq_id_list: List[str] = event["fastqIdList"]
     fastq_list_rows: List['FastqListRowDict'] = event["fastqListRows"]
 
+    # The same lane and sample number may appear on each instrument run
+    instrument_run_ids = sorted(set(map(
+        lambda fastq_list_row_iter_: fastq_list_row_iter_['rgid'].split('.', 2)[-1],
+        fastq_list_rows
+    )))
+    if len(instrument_run_ids) > 1:
+        raise ValueError(
+            f"Fastq list rows span more than one instrument run ({', '.join(instrument_run_ids)}), "
+            f"readsets topped up on another instrument run are not supported"
+        )
+
+    # Resolve the fastq of each row
+    fastq_by_rgid_map = get_fastq_by_rgid_map(list(map(
+        lambda fastq_list_row_iter_: fastq_list_row_iter_['rgid'],
+        fastq_list_rows
+    )))
+
     # Generate the map
     file_uri_by_fastq_id_map = {}
     for fastq_list_row_iter_ in fastq_list_rows:
         # Match the fastq id
-        fastq_id_iter: str = get_fastq_by_rgid(fastq_list_row_iter_['rgid'])['id']
+        fastq_id_iter: str = fastq_by_rgid_map[fastq_list_row_iter_['rgid']]['id']
         if fastq_id_iter not in fastq_id_list:
             raise ValueError(f"Fastq id {fastq_id_iter} from fastq list rows is not in the provided fastq id list")
 
@@ -12,6 +12,8 @@ This should look something like the following:
 sourceUriList - list of source uris to copy - these will be our fastq list rows
 destinationUri - the location of these files.
 renamingMapList - the list of renaming maps. Required IF the source uri file names don't match the convention needed
+
+The fastq list rows must all come from the same instrument run, the output file names are only unique within a run.
 """
 
 # Standard imports
@@ -59,6 +61,17 @@ def handler(event, context):
     # Get the destination uri by appending the run folder uri with the rglb of the first fastq list row
     destination_uri: str = f"{run_folder_uri}{fastq_list_rows[0]['rglb']}/"
 
+    # The same lane and sample number may appear on each instrument run
+    instrument_run_ids = sorted(set(map(
+        lambda fastq_list_row_iter_: fastq_list_row_iter_['rgid'].split('.', 2)[-1],
+        fastq_list_rows
+    )))
+    if len(instrument_run_ids) > 1:
+        raise ValueError(
+            f"Fastq list rows span more than one instrument run ({', '.join(instrument_run_ids)}), "
+            f"readsets topped up on another instrument run are not supported"
+        )
+
     # Generate the source uri and renaming map list for each fastq list row
     source_uri_list: List[str] = []
     renaming_map_list: List[RenamingMapDict] = []
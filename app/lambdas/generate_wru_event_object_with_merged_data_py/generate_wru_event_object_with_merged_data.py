@@ -2,37 +2,77 @@
 
 """
 Generate a WRU event object with merged data
+
+The new payload is fingerprinted (see tso500_ctdna_tools.payloads) and compared to the fingerprint of the
+existing payload, so the state machine can tell if the payload has changed without a separate comparison step
 """
 
+# Standard imports
+from typing import Dict, Optional
+
 # Layer imports
 from orcabus_api_tools.workflow import (
     get_workflow_run_from_portal_run_id
 )
+from tso500_ctdna_tools.payloads import get_payload_fingerprint
+
+# Globals
+# Payload ids are assigned by the workflow manager, they are not part of the payload contents
+PAYLOAD_ID_KEYS = ["orcabusId", "refId"]
+
+
+def get_existing_payload_fingerprint(workflow_run: Dict) -> Optional[str]:
+    """
+    Get the fingerprint of the existing workflow run payload, or None if the workflow run has no payload yet
+    """
+    existing_payload = workflow_run.get("payload")
+    if not existing_payload:
+        return None
+
+    return get_payload_fingerprint(dict(filter(
+        lambda kv_iter_: kv_iter_[0] not in PAYLOAD_ID_KEYS,
+        existing_payload.items()
+    )))
 
 
 def handler(event, context):
     """
     Generate WRU event object with merged data
-    :param event:
-    :param context:
-    :return:
+
+    Event shape:
+    {
+        "workflowRun": {...},  (optional, the draft event detail, otherwise the workflow run is fetched by portal run id)
+        "portalRunId": "<portal-run-id>",
+        "libraries": [...],
+        "payload": {"version": "...", "data": {...}}
+    }
+
+    Returns:
+    {
+        "workflowRunUpdate": {...},
+        "payloadFingerprint": "sha256:...",
+        "hasChanged": true
+    }
     """
 
     # Get the event inputs
+    workflow_run = event.get("workflowRun", None)
     portal_run_id = event.get("portalRunId", None)
     libraries = event.get("libraries", None)
     payload = event.get("payload", None)
 
-    # Create a copy of the draft workflow run object to update
-    draft_workflow_run = get_workflow_run_from_portal_run_id(
-        portal_run_id=portal_run_id
-    )
+    # The draft event detail already holds the workflow run, only fetch it if it was not provided
+    if workflow_run is None:
+        workflow_run = get_workflow_run_from_portal_run_id(
+            portal_run_id=portal_run_id
+        )
 
     # Make a copy
-    draft_workflow_update = draft_workflow_run.copy()
+    draft_workflow_update = workflow_run.copy()
 
-    # Remove 'currentState' and replace with 'status'
-    draft_workflow_update['status'] = draft_workflow_update.pop('currentState')['status']
+    # Workflow run objects from the api have a 'currentState', replace with 'status'
+    if 'currentState' in draft_workflow_update:
+        draft_workflow_update['status'] = draft_workflow_update.pop('currentState')['status']
 
     # Add in the libraries if provided
     if libraries is not None:
@@ -60,6 +100,11 @@ def handler(event, context):
         "data": new_data_object
     }
 
+    # Compare fingerprints rather than full payloads
+    payload_fingerprint = get_payload_fingerprint(draft_workflow_update["payload"])
+
     return {
-        "workflowRunUpdate": draft_workflow_update
+        "workflowRunUpdate": draft_workflow_update,
+        "payloadFingerprint": payload_fingerprint,
+        "hasChanged": payload_fingerprint != get_existing_payload_fingerprint(workflow_run),
     }
@@ -7,7 +7,7 @@ Given the rgid list, return the fastq ids that are associated with these rgids.
 """
 
 # Layer imports
-from orcabus_api_tools.fastq import get_fastq_by_rgid
+from tso500_ctdna_tools.fastq import get_fastqs_by_rgid_list
 
 
 def handler(event, context):
@@ -22,8 +22,8 @@ def handler(event, context):
 
     # Get the fastq ids
     all_fastq_ids = sorted(list(map(
-        lambda fastq_rgid_iter_: get_fastq_by_rgid(fastq_rgid_iter_)['id'],
-        fastq_rgid_list
+        lambda fastq_iter_: fastq_iter_['id'],
+        get_fastqs_by_rgid_list(fastq_rgid_list)
     )))
 
     return {
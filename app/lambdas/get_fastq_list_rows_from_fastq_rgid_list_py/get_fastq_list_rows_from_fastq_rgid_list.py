@@ -6,7 +6,9 @@ from pathlib import Path
 from urllib.parse import urlparse
 
 # Layer imports
-from orcabus_api_tools.fastq import to_fastq_list_row, get_fastq_by_rgid
+from orcabus_api_tools.fastq import to_fastq_list_row
+from tso500_ctdna_tools.concurrency import map_concurrently
+from tso500_ctdna_tools.fastq import get_fastqs_by_rgid_list
 
 # Globals
 TEST_DATA_BUCKET_NAME_ENV_VAR = "TEST_DATA_BUCKET_NAME"
@@ -33,15 +35,15 @@ def handler(event, context):
 
     # Collect all fastq ids from the rgid list
     all_fastq_ids = sorted(list(map(
-        lambda fastq_rgid_iter_: get_fastq_by_rgid(fastq_rgid_iter_)['id'],
-        fastq_rgid_list
+        lambda fastq_iter_: fastq_iter_['id'],
+        get_fastqs_by_rgid_list(fastq_rgid_list)
     )))
 
     # Test-data will have its own prefix
-    fastq_list_rows = list(map(
+    fastq_list_rows = map_concurrently(
         to_fastq_list_row,
         all_fastq_ids
-    ))
+    )
 
     # Keep the test-data fastq list rows
     # (which are exempt from the requirement of being in a particular project prefix)
@@ -54,7 +56,7 @@ def handler(event, context):
             test_data_fastq_list_rows.append(fastq_list_row_iter)
 
     # Re-collect the test-data fastq list rows with the s3 uri prefix if provided
-    non_test_data_fastq_list_rows = list(map(
+    non_test_data_fastq_list_rows = map_concurrently(
         lambda fastq_id_iter_: to_fastq_list_row(
             fastq_id_iter_,
             **(
@@ -67,7 +69,7 @@ def handler(event, context):
             )
         ),
         non_test_data_fastq_list_ids
-    ))
+    )
 
     # Return the list of fastq list row dicts
     return {
@@ -2,18 +2,40 @@
 
 """
 Get the instrument run id from a fastq id
+
+Given a fastqIdList, the fastqs must all come from the same instrument run, as the run folder handed to
+the dragen tso500 ctdna pipeline (and the RunName of its samplesheet) is named after a single instrument run.
+Readsets topped up on a second instrument run are rejected here, before any inputs are uploaded.
 """
 
+# Layer imports
 from orcabus_api_tools.fastq import get_fastq
+from tso500_ctdna_tools.concurrency import map_concurrently
+
 
 def handler(event, context):
     """
-    Get the instrument run id from a fastq id
+    Get the instrument run id from a fastq id, or the shared instrument run id of a list of fastq ids
     :param event:
     :param context:
     :return:
     """
+    fastq_id_list = event.get("fastqIdList", [event['fastqId']] if 'fastqId' in event else [])
+
+    if len(fastq_id_list) == 0:
+        raise ValueError("fastqId or fastqIdList is required in the event payload")
+
+    instrument_run_ids = sorted(set(map_concurrently(
+        lambda fastq_id_iter_: get_fastq(fastq_id_iter_)['instrumentRunId'],
+        fastq_id_list
+    )))
+
+    if len(instrument_run_ids) > 1:
+        raise ValueError(
+            f"Fastqs span more than one instrument run ({', '.join(instrument_run_ids)}), "
+            f"readsets topped up on another instrument run are not supported"
+        )
 
     return {
-        "instrumentRunId": get_fastq(event['fastqId'])['instrumentRunId'],
+        "instrumentRunId": instrument_run_ids[0],
     }
@@ -6,11 +6,9 @@ Given an ICAv2 project id, get the base uri for that project
 # Standard imports
 from typing import Dict, cast
 
-# Wrapica imports
-from wrapica.storage_configuration import get_s3_key_prefix_by_project_id
-
 # Layer imports
 from icav2_tools import set_icav2_env_vars
+from tso500_ctdna_tools.icav2 import get_cached_s3_key_prefix_by_project_id
 
 
 def handler(event, context) -> Dict[str, str]:
@@ -28,5 +26,5 @@ def handler(event, context) -> Dict[str, str]:
         raise ValueError("projectId is a required input")
 
     return {
-        "s3Uri": cast(str, get_s3_key_prefix_by_project_id(project_id))
+        "s3Uri": cast(str, get_cached_s3_key_prefix_by_project_id(project_id))
     }
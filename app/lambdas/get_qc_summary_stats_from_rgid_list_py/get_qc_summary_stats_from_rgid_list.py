@@ -12,8 +12,8 @@ and average out the insert size estimates.
 from typing import List
 
 # Layer imports
-from orcabus_api_tools.fastq import get_fastq_by_rgid
 from orcabus_api_tools.fastq.models import Fastq
+from tso500_ctdna_tools.fastq import get_fastqs_by_rgid_list
 
 
 def handler(event, context):
@@ -25,10 +25,7 @@ def handler(event, context):
     """
     fastq_rgid_list = event.get("fastqRgidList", [])
 
-    fastq_obj_list: List[Fastq] = list(map(
-        lambda rgid_iter_: get_fastq_by_rgid(rgid_iter_),
-        fastq_rgid_list
-    ))
+    fastq_obj_list: List[Fastq] = get_fastqs_by_rgid_list(fastq_rgid_list)
 
     # Collect and return the qc coverage estimates
     return {
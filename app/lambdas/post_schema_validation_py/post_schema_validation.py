@@ -4,6 +4,9 @@
 Post schema validation for tso500 ctdna workflows
 
 Performs the following steps:
+* Confirm projectId resolves to a valid ICAv2 project with an S3 key prefix (fatal, returns early)
+
+Then, concurrently:
 * Validate engine parameters:
   - Confirm projectId resolves to a valid ICAv2 project
   - Confirm outputUri / logsUri / cacheUri start with the project prefix
@@ -14,33 +17,45 @@ Performs the following steps:
 
 * Validate inputs:
   - Query Filemanager for ALL input URIs (file and folder) to confirm S3 existence
+    (file URIs sharing a prefix are answered by a single listing of that prefix, see FILEMANAGER_EXISTENCE_CHECK_MODE)
   - For URIs not in ref/test/project-prefix, validate ICA project linking
 
-* On failure: write numbered comments to the workflow run record and return {"isValid": false}
+* On failure: write the numbered failures to the workflow run record, packed into as few comments as possible,
+  and return {"isValid": false}
 * On success: return {"isValid": true}
 """
 
 # Imports
 from pathlib import Path
-from typing import Dict, Tuple, List, cast
+from typing import Dict, Tuple, List, Optional, cast
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from os import environ
-from time import sleep
 from urllib.parse import urlparse
 
 # Wrapica imports
-from wrapica.project_data import coerce_data_id_or_uri_to_project_data_obj, get_project_data_obj_by_id
 from libica.openapi.v3 import ApiException
-from wrapica.storage_configuration import get_s3_key_prefix_by_project_id
-from wrapica.project_pipelines import get_project_pipeline_obj
-from wrapica.project import get_project_obj_from_project_id
 
 # Layer imports
 from orcabus_api_tools.filemanager.errors import S3FileNotFoundError
-from orcabus_api_tools.workflow import add_comment_to_workflow_run, get_workflow_run
-from orcabus_api_tools.filemanager import get_s3_object_id_from_s3_uri, list_files_recursively
+from orcabus_api_tools.workflow import get_workflow_run
+from orcabus_api_tools.filemanager import get_s3_object_id_from_s3_uri
 
 from icav2_tools import set_icav2_env_vars
+from tso500_ctdna_tools.icav2 import (
+    get_cached_s3_key_prefix_by_project_id,
+    get_cached_project_obj_from_project_id,
+    get_cached_project_pipeline_obj,
+    get_cached_project_data_obj_from_uri,
+    get_cached_project_data_obj_by_id,
+)
+from tso500_ctdna_tools.concurrency import map_concurrently
+from tso500_ctdna_tools.filemanager import (
+    group_s3_uris_by_parent_prefix, list_s3_keys_under_prefix, has_s3_objects_under_prefix
+)
+from tso500_ctdna_tools.comments import (
+    format_comment_with_arn, pack_comments, add_workflow_run_comment, add_workflow_run_comments
+)
 
 # Globals
 WORKFLOW_NAME_ENV_VAR = "WORKFLOW_NAME"
@@ -50,6 +65,9 @@ REF_DATA_BUCKET_ENV_VAR = "REF_DATA_BUCKET_NAME"
 TEST_BUCKET = environ[TEST_BUCKET_ENV_VAR]
 REF_DATA_BUCKET = environ[REF_DATA_BUCKET_ENV_VAR]
 WORKFLOW_NAME = environ[WORKFLOW_NAME_ENV_VAR]
+# Either 'prefix' (list each shared prefix once) or 'uri' (one lookup per uri)
+FILEMANAGER_EXISTENCE_CHECK_MODE_ENV_VAR = "FILEMANAGER_EXISTENCE_CHECK_MODE"
+FILEMANAGER_EXISTENCE_CHECK_MODE = environ.get(FILEMANAGER_EXISTENCE_CHECK_MODE_ENV_VAR, "prefix")
 COMMENT_AUTHOR = f"{WORKFLOW_NAME}-workflow-validation-service"
 # Midfixes
 ANALYSIS_MIDFIX = "analysis"
@@ -58,23 +76,21 @@ LOGS_MIDFIX = "logs"
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-# Comment formatting constants
-MAX_COMMENT_LENGTH = 1024
-TRUNCATION_SUFFIX = "\n... [truncated, see execution ARN for full detail]"
-
 
-def _format_comment_with_arn(body: str, execution_arn: str) -> str:
-    """
-    Append the execution ARN footer to a comment and enforce the 1024 char limit.
+def get_project_id_failure(project_id: Optional[str]) -> Optional[str]:
     """
-    footer = f"---\nStep Functions Execution: {execution_arn}"
-    full_comment = f"{body}\n{footer}"
+    Confirm the projectId is set and resolves to a valid ICAv2 project.
+    Nothing else can be validated without a valid project, so this failure is fatal.
 
-    if len(full_comment) > MAX_COMMENT_LENGTH:
-        available = MAX_COMMENT_LENGTH - len(footer) - len(TRUNCATION_SUFFIX) - 1
-        full_comment = f"{body[:available]}{TRUNCATION_SUFFIX}\n{footer}"
-
-    return full_comment
+    :return: The failure comment, or None if the project is valid
+    """
+    if project_id is None:
+        return "projectId is not set"
+    try:
+        get_cached_project_obj_from_project_id(project_id)
+    except ApiException:
+        return f"Cannot find project id '{project_id}' — it does not resolve to a valid ICAv2 project"
+    return None
 
 
 def validate_engine_parameters(
@@ -84,16 +100,16 @@ def validate_engine_parameters(
 ) -> Tuple[bool, List[str]]:
     """
     Validate the engine parameters.
+    The projectId is confirmed by the handler (see get_project_id_failure) before this is called.
 
     Checks:
-    1. projectId resolves to a valid ICAv2 project
-    2. outputUri starts with the project's S3 key prefix
-    3. logsUri starts with the project's S3 key prefix
-    4. cacheUri starts with the project's S3 key prefix
-    5. outputUri ends with /<analysis-midfix>/<workflow-name>/<portal-run-id>/
-    6. logsUri ends with /logs/<workflow-name>/<portal-run-id>/
-    7. cacheUri ends with /<portal-run-id>/
-    8. pipelineId is accessible in the project
+    1. outputUri starts with the project's S3 key prefix
+    2. logsUri starts with the project's S3 key prefix
+    3. cacheUri starts with the project's S3 key prefix
+    4. outputUri ends with /<analysis-midfix>/<workflow-name>/<portal-run-id>/
+    5. logsUri ends with /logs/<workflow-name>/<portal-run-id>/
+    6. cacheUri ends with /<portal-run-id>/
+    7. pipelineId is accessible in the project
 
     :param engine_parameters: The engine parameters to validate.
     :param workflow_run_id: The workflow run ID
@@ -105,38 +121,28 @@ def validate_engine_parameters(
     # Get the project id
     project_id = engine_parameters.get("projectId")
 
-    # 1. Validate projectId resolves to a valid ICAv2 project
-    if project_id is None:
-        failures.append("projectId is not set")
-        return False, failures
-    try:
-        get_project_obj_from_project_id(project_id)
-    except ApiException:
-        failures.append(f"Cannot find project id '{project_id}' — it does not resolve to a valid ICAv2 project")
-        return False, failures
-
     # Get URIs
     output_uri = engine_parameters.get("outputUri", "")
     logs_uri = engine_parameters.get("logsUri", "")
     cache_uri = engine_parameters.get("cacheUri", "")
     pipeline_id = engine_parameters.get("pipelineId", "")
 
-    # 2. Validate outputUri starts with project prefix
+    # 1. Validate outputUri starts with project prefix
     if not output_uri.startswith(project_prefix):
         failures.append(f"outputUri '{output_uri}' does not start with the project prefix '{project_prefix}'")
 
-    # 3. Validate logsUri starts with project prefix
+    # 2. Validate logsUri starts with project prefix
     if not logs_uri.startswith(project_prefix):
         failures.append(f"logsUri '{logs_uri}' does not start with the project prefix '{project_prefix}'")
 
-    # 4. Validate cacheUri starts with project prefix
+    # 3. Validate cacheUri starts with project prefix
     if cache_uri and not cache_uri.startswith(project_prefix):
         failures.append(f"cacheUri '{cache_uri}' does not start with the project prefix '{project_prefix}'")
 
     # Get the portal run id from the workflow run id
     portal_run_id = get_workflow_run(workflow_run_id)['portalRunId']
 
-    # 5. Validate outputUri ends with /<analysis-midfix>/<workflow-name>/<portal-run-id>/
+    # 4. Validate outputUri ends with /<analysis-midfix>/<workflow-name>/<portal-run-id>/
     valid_output_suffixes = [
         f"/{midfix}/{WORKFLOW_NAME}/{portal_run_id}/"
         for midfix in ("analysis", "output", "outputs")
@@ -146,19 +152,19 @@ def validate_engine_parameters(
             f"outputUri '{output_uri}' does not end with '/{ANALYSIS_MIDFIX}/{WORKFLOW_NAME}/{portal_run_id}/'"
         )
 
-    # 6. Validate logsUri ends with /logs/<workflow-name>/<portal-run-id>/
+    # 5. Validate logsUri ends with /logs/<workflow-name>/<portal-run-id>/
     if not logs_uri.endswith(f"/{LOGS_MIDFIX}/{WORKFLOW_NAME}/{portal_run_id}/"):
         failures.append(
             f"logsUri '{logs_uri}' does not end with '/{LOGS_MIDFIX}/{WORKFLOW_NAME}/{portal_run_id}/'"
         )
 
-    # 7. Validate cacheUri ends with /<portal-run-id>/
+    # 6. Validate cacheUri ends with /<portal-run-id>/
     if cache_uri and not cache_uri.endswith(f"/{portal_run_id}/"):
         failures.append(f"cacheUri '{cache_uri}' does not end with '/{portal_run_id}/'")
 
-    # 8. Validate pipelineId is accessible in the project
+    # 7. Validate pipelineId is accessible in the project
     try:
-        _ = get_project_pipeline_obj(
+        _ = get_cached_project_pipeline_obj(
             project_id=project_id,
             pipeline_id=pipeline_id,
         )
@@ -170,6 +176,107 @@ def validate_engine_parameters(
     return True, []
 
 
+def get_data_uri_existence_failure(data_uri: str) -> Optional[str]:
+    """
+    Confirm a data uri exists in the Filemanager.
+
+    :param data_uri: A file uri, or a folder uri (ending in /)
+    :return: The failure comment, or None if the data uri exists
+    """
+    # Check if it's a folder URI (ends with /)
+    if data_uri.endswith("/"):
+        # For folder URIs, verify at least 1 file exists under that prefix
+        # We only need the first object, not the full recursive listing
+        parsed = urlparse(data_uri)
+        bucket = parsed.netloc
+        key = str(Path(parsed.path)).lstrip("/") + "/"
+        if not has_s3_objects_under_prefix(bucket, key):
+            return f"Folder URI '{data_uri}' has no files found under that prefix in the Filemanager"
+        return None
+
+    # For file URIs, confirm the file exists
+    try:
+        get_s3_object_id_from_s3_uri(data_uri)
+    except S3FileNotFoundError:
+        return get_data_uri_not_found_failure(data_uri)
+    return None
+
+
+def get_data_uri_not_found_failure(data_uri: str) -> str:
+    return f"Data URI '{data_uri}' cannot be found by the Filemanager, are you sure it exists?"
+
+
+def get_data_uri_existence_failures(data_uris: List[str]) -> List[str]:
+    """
+    Confirm each data uri exists in the Filemanager, returning the failure comments in input order.
+
+    In 'prefix' mode, file uris that share a parent prefix are checked against a single listing of that prefix.
+    Folder uris, lone file uris and prefixes too large to list fall back to a lookup per uri.
+    """
+    failure_by_data_uri: Dict[str, Optional[str]] = {}
+
+    if FILEMANAGER_EXISTENCE_CHECK_MODE == "prefix":
+        shared_prefix_groups = list(filter(
+            lambda prefix_group_iter_: len(prefix_group_iter_[1]) > 1,
+            group_s3_uris_by_parent_prefix(list(filter(
+                lambda data_uri_iter_: not data_uri_iter_.endswith("/"),
+                data_uris
+            ))).items()
+        ))
+        s3_key_sets = map_concurrently(
+            lambda prefix_group_iter_: list_s3_keys_under_prefix(*prefix_group_iter_[0]),
+            shared_prefix_groups
+        )
+        for (_, prefix_data_uris), s3_key_set in zip(shared_prefix_groups, s3_key_sets):
+            if s3_key_set is None:
+                continue
+            for data_uri in prefix_data_uris:
+                failure_by_data_uri[data_uri] = (
+                    None if urlparse(data_uri).path.lstrip("/") in s3_key_set
+                    else get_data_uri_not_found_failure(data_uri)
+                )
+
+    # The remaining lookups are independent, so they are made concurrently
+    remaining_data_uris = list(filter(
+        lambda data_uri_iter_: data_uri_iter_ not in failure_by_data_uri,
+        data_uris
+    ))
+    failure_by_data_uri.update(zip(
+        remaining_data_uris,
+        map_concurrently(get_data_uri_existence_failure, remaining_data_uris)
+    ))
+
+    # Failure comments are returned in input order so they match the serial order
+    return list(filter(
+        lambda failure_iter_: failure_iter_ is not None,
+        map(lambda data_uri_iter_: failure_by_data_uri[data_uri_iter_], data_uris)
+    ))
+
+
+def get_data_uri_project_link_failure(data_uri: str, project_id: str) -> Optional[str]:
+    """
+    Confirm a data uri outside of the project is linked to the project.
+
+    Resolved data objects are cached for the life of a warm container (see tso500_ctdna_tools.icav2),
+    so repeated validations of the same linked data do not hit the ICAv2 API again.
+    Failed lookups are not cached.
+
+    :return: The failure comment, or None if the data uri is linked to the project
+    """
+    # Try get the icav2 object by uri
+    try:
+        project_data_obj = get_cached_project_data_obj_from_uri(data_uri)
+    except ValueError:
+        return f"Data URI '{data_uri}' cannot be found in the project context '{project_id}'"
+
+    # Then try get it in this context
+    try:
+        get_cached_project_data_obj_by_id(project_id, project_data_obj.data.id)
+    except ApiException:
+        return f"Data URI '{data_uri}' exists but is not linked to the project '{project_id}'"
+    return None
+
+
 def validate_inputs(
         inputs: Dict,
         project_id: str,
@@ -210,26 +317,7 @@ def validate_inputs(
         lambda uri: not uri.startswith(f"s3://{REF_DATA_BUCKET}/"),
         data_uris
     ))
-    for data_uri in non_reference_data_uris:
-        # Check if it's a folder URI (ends with /)
-        if data_uri.endswith("/"):
-            # For folder URIs, verify at least 1 file exists under that prefix
-            parsed = urlparse(data_uri)
-            bucket = parsed.netloc
-            key = str(Path(parsed.path)).lstrip("/") + "/"
-            files = list_files_recursively(bucket, key)
-            if not (len(files) > 0):
-                failures.append(
-                    f"Folder URI '{data_uri}' has no files found under that prefix in the Filemanager"
-                )
-        else:
-            # For file URIs, confirm the file exists
-            try:
-                get_s3_object_id_from_s3_uri(data_uri)
-            except S3FileNotFoundError:
-                failures.append(
-                    f"Data URI '{data_uri}' cannot be found by the Filemanager, are you sure it exists?"
-                )
+    failures.extend(get_data_uri_existence_failures(non_reference_data_uris))
 
     # If we already have failures from Phase 1, return them
     if failures:
@@ -246,29 +334,14 @@ def validate_inputs(
         )
     ]
 
-    # Validate each URI is accessible in the project context
-    for data_uri in uris_to_validate:
-        # Try get the icav2 object by uri
-        try:
-            project_data_obj = coerce_data_id_or_uri_to_project_data_obj(
-                data_id_or_uri=data_uri,
-            )
-        except ValueError:
-            failures.append(
-                f"Data URI '{data_uri}' cannot be found in the project context '{project_id}'"
-            )
-            continue
-
-        # Then try get it in this context
-        try:
-            get_project_data_obj_by_id(
-                project_id=project_id,
-                data_id=project_data_obj.data.id
-            )
-        except ApiException:
-            failures.append(
-                f"Data URI '{data_uri}' exists but is not linked to the project '{project_id}'"
-            )
+    # Validate each URI is accessible in the project context, concurrently
+    failures.extend(filter(
+        lambda failure_iter_: failure_iter_ is not None,
+        map_concurrently(
+            lambda data_uri_iter_: get_data_uri_project_link_failure(data_uri_iter_, project_id),
+            uris_to_validate
+        )
+    ))
 
     if failures:
         return False, failures
@@ -317,96 +390,102 @@ def handler(event, context) -> Dict[str, bool]:
     # Get the project prefix
     project_id = engine_parameters.get("projectId")
     if project_id is None:
-        add_comment_to_workflow_run(
-            workflow_run_orcabus_id=workflow_run_id,
-            comment=_format_comment_with_arn(
+        add_workflow_run_comment(
+            workflow_run_id,
+            format_comment_with_arn(
                 "Post schema validation failed: projectId is not set",
                 execution_arn
             ),
-            author=COMMENT_AUTHOR
+            COMMENT_AUTHOR
         )
         return {"isValid": False}
 
     try:
-        project_prefix = get_s3_key_prefix_by_project_id(project_id)
+        project_prefix = get_cached_s3_key_prefix_by_project_id(project_id)
     except ApiException:
-        add_comment_to_workflow_run(
-            workflow_run_orcabus_id=workflow_run_id,
-            comment=_format_comment_with_arn(
+        add_workflow_run_comment(
+            workflow_run_id,
+            format_comment_with_arn(
                 f"Post schema validation failed: cannot resolve S3 key prefix for projectId '{project_id}'",
                 execution_arn
             ),
-            author=COMMENT_AUTHOR
+            COMMENT_AUTHOR
         )
         return {"isValid": False}
 
     if project_prefix is None:
-        add_comment_to_workflow_run(
-            workflow_run_orcabus_id=workflow_run_id,
-            comment=_format_comment_with_arn(
+        add_workflow_run_comment(
+            workflow_run_id,
+            format_comment_with_arn(
                 f"Post schema validation failed: no S3 key prefix configured for projectId '{project_id}'",
                 execution_arn
             ),
-            author=COMMENT_AUTHOR
+            COMMENT_AUTHOR
+        )
+        return {"isValid": False}
+
+    # A project that does not resolve is fatal, there is no point validating anything else
+    project_id_failure = get_project_id_failure(project_id)
+    if project_id_failure is not None:
+        add_workflow_run_comment(
+            workflow_run_id,
+            format_comment_with_arn(
+                f"Post schema validation failed: {project_id_failure}",
+                execution_arn
+            ),
+            COMMENT_AUTHOR
         )
         return {"isValid": False}
 
-    # Collect all failure comments across all validation phases
-    all_failures: List[str] = []
-
-    # Validate engine parameters
-    is_valid, failures = validate_engine_parameters(
-        engine_parameters,
-        workflow_run_id=workflow_run_id,
-        project_prefix=project_prefix,
-    )
-    if not is_valid:
-        all_failures.extend(failures)
-
-    # Only validate inputs if engine parameters are valid
-    # (we need a valid project to check inputs)
-    if is_valid:
-        inputs = payload_data.get("inputs", {})
-        is_valid, failures = validate_inputs(
-            inputs,
+    # The engine parameters and inputs are otherwise independent, so validate them concurrently
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        engine_parameters_future = executor.submit(
+            validate_engine_parameters,
+            engine_parameters,
+            workflow_run_id=workflow_run_id,
+            project_prefix=project_prefix,
+        )
+        inputs_future = executor.submit(
+            validate_inputs,
+            payload_data.get("inputs", {}),
             project_id=project_id,
             project_prefix=project_prefix,
         )
-        if not is_valid:
-            all_failures.extend(failures)
+
+        # Collect all failure comments across all validation phases
+        # Engine parameter failures always come before input failures
+        all_failures: List[str] = []
+        for validation_future in (engine_parameters_future, inputs_future):
+            is_valid, failures = validation_future.result()
+            if not is_valid:
+                all_failures.extend(failures)
 
     # Write failure comments and return
     if all_failures:
         if len(all_failures) == 1:
             # Single failure — write one comment
-            add_comment_to_workflow_run(
-                workflow_run_orcabus_id=workflow_run_id,
-                comment=_format_comment_with_arn(
+            add_workflow_run_comment(
+                workflow_run_id,
+                format_comment_with_arn(
                     f"Post schema validation failed: {all_failures[0]}",
                     execution_arn
                 ),
-                author=COMMENT_AUTHOR
+                COMMENT_AUTHOR
             )
         else:
-            # Multiple failures — write summary then numbered comments
-            add_comment_to_workflow_run(
-                workflow_run_orcabus_id=workflow_run_id,
-                comment=_format_comment_with_arn(
+            # Multiple failures — pack the summary and numbered reasons into as few comments as possible
+            add_workflow_run_comments(
+                workflow_run_id,
+                pack_comments(
                     f"Post schema validation failed for {len(all_failures)} reasons",
+                    list(map(
+                        lambda failure_iter_: f"Reason {failure_iter_[0]} of {len(all_failures)}: {failure_iter_[1]}",
+                        enumerate(all_failures, start=1)
+                    )),
                     execution_arn
                 ),
-                author=COMMENT_AUTHOR
+                COMMENT_AUTHOR
             )
-            for idx, failure_comment in enumerate(all_failures, start=1):
-                add_comment_to_workflow_run(
-                    workflow_run_orcabus_id=workflow_run_id,
-                    comment=_format_comment_with_arn(
-                        f"Reason {idx} of {len(all_failures)}: {failure_comment}",
-                        execution_arn
-                    ),
-                    author=COMMENT_AUTHOR
-                )
-                sleep(1)
 
         return {"isValid": False}
 
@@ -0,0 +1,3 @@
+"""
+Shared helpers for the dragen tso500 ctdna pipeline manager lambdas
+"""
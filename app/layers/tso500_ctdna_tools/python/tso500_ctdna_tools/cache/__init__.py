@@ -0,0 +1,101 @@
+"""
+Warm container caches
+
+Module level state survives between invocations of a warm lambda container,
+so lookups that rarely change can be kept for a short while rather than re-requested every invocation.
+"""
+
+# Standard imports
+import logging
+from collections import OrderedDict
+from functools import wraps
+from threading import Lock
+from time import monotonic
+from typing import Any, Callable, Hashable, Tuple, TypeVar
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+DEFAULT_TTL_SECONDS = 15 * 60
+DEFAULT_MAXSIZE = 1024
+
+R = TypeVar("R")
+
+# Marker for a missing cache entry (None is a legitimate cached value)
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    A thread-safe, size-bounded cache where entries expire ttl_seconds after they are set.
+    Once maxsize is reached, the least recently used entry is evicted.
+    Hits and misses are counted for logging.
+    """
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, maxsize: int = DEFAULT_MAXSIZE):
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Any]]' = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def ttl_memoize(
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        maxsize: int = DEFAULT_MAXSIZE
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """
+    Memoize a function on its (hashable) arguments for ttl_seconds.
+    Exceptions are not cached, so a failed lookup is retried on the next call.
+    Each lookup logs the running hit / miss counts of the cache.
+    The underlying cache is available as func.cache
+    """
+    def decorator(func: Callable[..., R]) -> Callable[..., R]:
+        cache = TTLCache(ttl_seconds=ttl_seconds, maxsize=maxsize)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> R:
+            key = (args, tuple(sorted(kwargs.items())))
+            value = cache.get(key, _MISSING)
+            if value is not _MISSING:
+                logger.info(f"{func.__name__} cache hit (hits={cache.hits}, misses={cache.misses})")
+                return value
+            logger.info(f"{func.__name__} cache miss (hits={cache.hits}, misses={cache.misses})")
+            value = func(*args, **kwargs)
+            cache.set(key, value)
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,173 @@
+"""
+Workflow run comment writer
+
+* Comments are limited to MAX_COMMENT_LENGTH characters, with the step functions execution arn as a footer
+* Many short messages (i.e. validation failures) are packed into as few comments as possible,
+  later comments repeat the header marked as (continued)
+* Comments are rate limited with a token bucket shared across the container (rather than a fixed sleep per comment)
+* Throttled requests (429 / 503) are retried with exponential backoff and full jitter
+"""
+
+# Standard imports
+import logging
+import random
+from os import environ
+from threading import Lock
+from time import monotonic, sleep
+from typing import List
+
+# Layer imports
+from orcabus_api_tools.workflow import add_comment_to_workflow_run
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+MAX_COMMENT_LENGTH = 1024
+TRUNCATION_SUFFIX = "\n... [truncated, see execution ARN for full detail]"
+CONTINUED_SUFFIX = "(continued)"
+
+# Token bucket, allow a short burst of comments, then COMMENT_RATE_PER_SECOND
+COMMENT_RATE_PER_SECOND_ENV_VAR = "COMMENT_RATE_PER_SECOND"
+DEFAULT_COMMENT_RATE_PER_SECOND = 2.0
+COMMENT_BURST_SIZE = 5
+
+# Retries
+RETRYABLE_STATUS_CODES = {429, 503}
+MAX_COMMENT_ATTEMPTS = 5
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket, acquire blocks until a token is available
+    """
+    def __init__(self, rate_per_second: float, capacity: int):
+        self.rate_per_second = rate_per_second
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last_refill = monotonic()
+        self._lock = Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate_per_second)
+            self._last_refill = now
+            self._tokens -= 1
+            wait_seconds = max(-self._tokens / self.rate_per_second, 0)
+        if wait_seconds > 0:
+            sleep(wait_seconds)
+
+
+COMMENT_TOKEN_BUCKET = TokenBucket(
+    rate_per_second=float(environ.get(COMMENT_RATE_PER_SECOND_ENV_VAR, DEFAULT_COMMENT_RATE_PER_SECOND)),
+    capacity=COMMENT_BURST_SIZE,
+)
+
+
+def get_comment_footer(execution_arn: str) -> str:
+    return f"---\nStep Functions Execution: {execution_arn}"
+
+
+def truncate_comment(comment: str) -> str:
+    """
+    Enforce the MAX_COMMENT_LENGTH char limit on a comment without a footer
+    """
+    if len(comment) <= MAX_COMMENT_LENGTH:
+        return comment
+    return f"{comment[:MAX_COMMENT_LENGTH - len(TRUNCATION_SUFFIX)]}{TRUNCATION_SUFFIX}"
+
+
+def format_comment_with_arn(body: str, execution_arn: str) -> str:
+    """
+    Append the execution ARN footer to a comment and enforce the MAX_COMMENT_LENGTH char limit.
+    The footer is always kept, the body is truncated if necessary.
+    """
+    footer = get_comment_footer(execution_arn)
+    full_comment = f"{body}\n{footer}"
+
+    if len(full_comment) > MAX_COMMENT_LENGTH:
+        # Keep the footer, truncate the body (-1 for the newline)
+        available = MAX_COMMENT_LENGTH - len(footer) - len(TRUNCATION_SUFFIX) - 1
+        full_comment = f"{body[:available]}{TRUNCATION_SUFFIX}\n{footer}"
+
+    return full_comment
+
+
+def pack_comments(
+        header: str,
+        lines: List[str],
+        execution_arn: str
+) -> List[str]:
+    """
+    Pack a header and a list of lines into as few comments as possible.
+    Later comments start with the header marked as (continued), so each comment can be read on its own.
+    Each comment carries the execution ARN footer, a single line too long for a comment on its own is truncated.
+    """
+    footer = get_comment_footer(execution_arn)
+    # Room for the body, less the newline joining the body and the footer
+    max_body_length = MAX_COMMENT_LENGTH - len(footer) - 1
+    continued_header = f"{header} {CONTINUED_SUFFIX}" if header else ""
+
+    def join_lines(body_: str, line_: str) -> str:
+        return f"{body_}\n{line_}" if body_ else line_
+
+    bodies: List[str] = []
+    body = header
+    for line in lines:
+        # A comment always takes at least one line, even if that line will be truncated
+        if body in (header, continued_header) or len(join_lines(body, line)) <= max_body_length:
+            body = join_lines(body, line)
+            continue
+        bodies.append(body)
+        body = join_lines(continued_header, line)
+    if body:
+        bodies.append(body)
+
+    return list(map(
+        lambda body_iter_: format_comment_with_arn(body_iter_, execution_arn),
+        bodies
+    ))
+
+
+def is_retryable_error(error: Exception) -> bool:
+    return getattr(getattr(error, "response", None), "status_code", None) in RETRYABLE_STATUS_CODES
+
+
+def add_workflow_run_comment(
+        workflow_run_id: str,
+        comment: str,
+        author: str
+):
+    """
+    Add a comment to the workflow run, rate limited, retrying throttled requests with jitter
+    """
+    for attempt in range(1, MAX_COMMENT_ATTEMPTS + 1):
+        COMMENT_TOKEN_BUCKET.acquire()
+        try:
+            add_comment_to_workflow_run(
+                workflow_run_orcabus_id=workflow_run_id,
+                comment=comment,
+                author=author,
+            )
+            return
+        except Exception as error:
+            if not is_retryable_error(error) or attempt == MAX_COMMENT_ATTEMPTS:
+                raise
+            retry_delay = random.uniform(0, min(RETRY_MAX_DELAY_SECONDS, RETRY_BASE_DELAY_SECONDS * 2 ** attempt))
+            logger.warning(f"Comment request was throttled (attempt {attempt}), retrying in {retry_delay:.2f}s")
+            sleep(retry_delay)
+
+
+def add_workflow_run_comments(
+        workflow_run_id: str,
+        comments: List[str],
+        author: str
+):
+    """
+    Add a list of comments to the workflow run, in order
+    """
+    for comment in comments:
+        add_workflow_run_comment(workflow_run_id, comment, author)
@@ -0,0 +1,51 @@
+"""
+Bounded concurrency helpers
+
+Most of our lambdas spend their time waiting on the Filemanager, Fastq manager or ICAv2 APIs,
+so the calls are fanned out over a thread pool rather than made one at a time.
+"""
+
+# Standard imports
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from os import environ
+from typing import Callable, Iterable, List, Optional, TypeVar
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+MAX_WORKERS_ENV_VAR = "MAX_CONCURRENT_REQUESTS"
+DEFAULT_MAX_WORKERS = 16
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def get_max_workers() -> int:
+    """
+    Get the concurrency limit, may be overridden by the MAX_CONCURRENT_REQUESTS env var
+    """
+    return max(int(environ.get(MAX_WORKERS_ENV_VAR, DEFAULT_MAX_WORKERS)), 1)
+
+
+def map_concurrently(
+        func: Callable[[T], R],
+        items: Iterable[T],
+        max_workers: Optional[int] = None
+) -> List[R]:
+    """
+    Apply func to each item with at most max_workers calls in flight.
+
+    Results are returned in the same order as the items, the first exception raised by func is re-raised.
+    A single item (or a max_workers of 1) is run in the calling thread.
+    """
+    items = list(items)
+    if max_workers is None:
+        max_workers = get_max_workers()
+
+    if len(items) <= 1 or max_workers <= 1:
+        return list(map(func, items))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(func, items))
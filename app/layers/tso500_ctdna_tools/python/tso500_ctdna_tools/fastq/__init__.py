@@ -0,0 +1,69 @@
+"""
+Bulk rgid to fastq lookups
+
+The same rgids are resolved by several lambdas in each workflow run, and often more than once within a lambda.
+Repeated rgids are coalesced into a single request, the remaining rgids are resolved concurrently
+(see ..concurrency), and each fastq is memoized for the life of a warm container (up to its ttl).
+Callers are handed a deep copy of the memoized fastq, so modifying a result never changes the cache.
+
+The ttl is kept short as the fastq qc is added after the fastq is created.
+
+Requires orcabus_api_tools (provided by the orcabus api tools layer)
+"""
+
+# Standard imports
+import typing
+from copy import deepcopy
+from typing import Dict, List
+
+# Layer imports
+from orcabus_api_tools.fastq import get_fastq_by_rgid
+
+# Local imports
+from ..cache import ttl_memoize
+from ..concurrency import map_concurrently
+
+# Type hints
+if typing.TYPE_CHECKING:
+    from orcabus_api_tools.fastq.models import Fastq
+
+# Globals
+FASTQ_CACHE_TTL_SECONDS = 5 * 60
+FASTQ_CACHE_MAXSIZE = 4096
+
+
+@ttl_memoize(ttl_seconds=FASTQ_CACHE_TTL_SECONDS, maxsize=FASTQ_CACHE_MAXSIZE)
+def _get_memoized_fastq_by_rgid(rgid: str) -> 'Fastq':
+    # Shared by every caller in the container, never hand this object out directly
+    return get_fastq_by_rgid(rgid)
+
+
+def get_cached_fastq_by_rgid(rgid: str) -> 'Fastq':
+    """
+    Get the fastq for an rgid, a copy of the memoized fastq is returned
+    """
+    return deepcopy(_get_memoized_fastq_by_rgid(rgid))
+
+
+def get_fastq_by_rgid_map(rgid_list: List[str]) -> Dict[str, 'Fastq']:
+    """
+    Resolve each unique rgid in the list to its fastq, keyed by rgid in order of first appearance.
+    Each fastq is a copy of the memoized fastq
+    """
+    unique_rgid_list = list(dict.fromkeys(rgid_list))
+    return dict(zip(
+        unique_rgid_list,
+        map(deepcopy, map_concurrently(_get_memoized_fastq_by_rgid, unique_rgid_list))
+    ))
+
+
+def get_fastqs_by_rgid_list(rgid_list: List[str]) -> List['Fastq']:
+    """
+    Resolve a list of rgids to their fastqs, in the same order as the rgid list.
+    Repeated rgids are given their own copy of the fastq
+    """
+    fastq_by_rgid_map = get_fastq_by_rgid_map(rgid_list)
+    return list(map(
+        lambda rgid_iter_: deepcopy(fastq_by_rgid_map[rgid_iter_]),
+        rgid_list
+    ))
@@ -0,0 +1,92 @@
+"""
+Bulk Filemanager existence queries
+
+The fastq files of a readset usually share a single S3 prefix, so rather than asking the Filemanager
+about each file individually, we list each prefix once and answer existence by set membership.
+
+For folders, we only need to know that at least one object exists,
+so we ask for a single row rather than paging through the whole folder.
+"""
+
+# Standard imports
+import logging
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+# Layer imports
+from orcabus_api_tools.filemanager import get_file_manager_request
+from orcabus_api_tools.filemanager.globals import S3_LIST_ENDPOINT
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+# Prefixes with more objects than this are not listed, the caller should fall back to per-uri lookups
+MAX_PREFIX_LISTING_SIZE = 1000
+
+
+def get_bucket_and_parent_prefix_from_s3_uri(s3_uri: str) -> Tuple[str, str]:
+    """
+    Get the bucket and the parent 'directory' of a file uri, i.e. s3://bucket/a/b/c.txt -> (bucket, a/b/)
+    Files at the root of the bucket have an empty parent prefix, i.e. s3://bucket/c.txt -> (bucket, '')
+    """
+    s3_obj = urlparse(s3_uri)
+    parent_prefix = s3_obj.path.lstrip("/").rpartition("/")[0]
+    return s3_obj.netloc, f"{parent_prefix}/" if parent_prefix else ""
+
+
+def group_s3_uris_by_parent_prefix(s3_uris: List[str]) -> Dict[Tuple[str, str], List[str]]:
+    """
+    Group file uris by their bucket and parent prefix, in order of first appearance
+    """
+    s3_uris_by_parent_prefix: Dict[Tuple[str, str], List[str]] = {}
+    for s3_uri in s3_uris:
+        s3_uris_by_parent_prefix.setdefault(get_bucket_and_parent_prefix_from_s3_uri(s3_uri), []).append(s3_uri)
+    return s3_uris_by_parent_prefix
+
+
+def list_s3_keys_under_prefix(
+        bucket: str,
+        prefix: str,
+        max_listing_size: int = MAX_PREFIX_LISTING_SIZE
+) -> Optional[Set[str]]:
+    """
+    List the current keys under a prefix in a single Filemanager request.
+
+    :return: The set of keys, or None if the prefix holds more than max_listing_size objects
+    """
+    response = get_file_manager_request(
+        S3_LIST_ENDPOINT,
+        params={
+            "bucket": bucket,
+            "key": f"{prefix}*",
+            "currentState": "true",
+            "rowsPerPage": max_listing_size,
+        }
+    )
+
+    # Only trust the listing if it all fit on the first page
+    if (
+            response.get("links", {}).get("next") is not None or
+            response.get("pagination", {}).get("count", 0) > max_listing_size
+    ):
+        logger.info(f"More than {max_listing_size} objects under s3://{bucket}/{prefix}, not using the listing")
+        return None
+
+    return set(map(lambda s3_obj_iter_: s3_obj_iter_["key"], response.get("results", [])))
+
+
+def has_s3_objects_under_prefix(bucket: str, prefix: str) -> bool:
+    """
+    Check that at least one current object exists under the prefix, requesting a single row only
+    """
+    response = get_file_manager_request(
+        S3_LIST_ENDPOINT,
+        params={
+            "bucket": bucket,
+            "key": f"{prefix}*",
+            "currentState": "true",
+            "rowsPerPage": 1,
+        }
+    )
+    return len(response.get("results", [])) > 0
@@ -0,0 +1,57 @@
+"""
+Cached ICAv2 lookups
+
+Project metadata (the project itself, its storage prefix and its pipelines) changes perhaps once a quarter,
+and resolved data objects do not change between DRAFT re-populations,
+so these lookups are memoized for the life of a warm container (up to their ttl).
+
+Requires wrapica (provided by the icav2 tools layer)
+"""
+
+# Standard imports
+import typing
+from typing import Optional
+
+# Wrapica imports
+from wrapica.project import get_project_obj_from_project_id
+from wrapica.project_data import coerce_data_id_or_uri_to_project_data_obj, get_project_data_obj_by_id
+from wrapica.project_pipelines import get_project_pipeline_obj
+from wrapica.storage_configuration import get_s3_key_prefix_by_project_id
+
+# Local imports
+from ..cache import ttl_memoize
+
+# Type hints
+if typing.TYPE_CHECKING:
+    from libica.openapi.v3.models import Project, ProjectData, ProjectPipeline
+
+# Globals
+PROJECT_METADATA_CACHE_TTL_SECONDS = 60 * 60
+PROJECT_METADATA_CACHE_MAXSIZE = 64
+ICAV2_DATA_CACHE_TTL_SECONDS = 10 * 60
+ICAV2_DATA_CACHE_MAXSIZE = 4096
+
+
+@ttl_memoize(ttl_seconds=PROJECT_METADATA_CACHE_TTL_SECONDS, maxsize=PROJECT_METADATA_CACHE_MAXSIZE)
+def get_cached_s3_key_prefix_by_project_id(project_id: str) -> Optional[str]:
+    return get_s3_key_prefix_by_project_id(project_id)
+
+
+@ttl_memoize(ttl_seconds=PROJECT_METADATA_CACHE_TTL_SECONDS, maxsize=PROJECT_METADATA_CACHE_MAXSIZE)
+def get_cached_project_obj_from_project_id(project_id: str) -> 'Project':
+    return get_project_obj_from_project_id(project_id)
+
+
+@ttl_memoize(ttl_seconds=PROJECT_METADATA_CACHE_TTL_SECONDS, maxsize=PROJECT_METADATA_CACHE_MAXSIZE)
+def get_cached_project_pipeline_obj(project_id: str, pipeline_id: str) -> 'ProjectPipeline':
+    return get_project_pipeline_obj(project_id=project_id, pipeline_id=pipeline_id)
+
+
+@ttl_memoize(ttl_seconds=ICAV2_DATA_CACHE_TTL_SECONDS, maxsize=ICAV2_DATA_CACHE_MAXSIZE)
+def get_cached_project_data_obj_from_uri(data_uri: str) -> 'ProjectData':
+    return coerce_data_id_or_uri_to_project_data_obj(data_id_or_uri=data_uri)
+
+
+@ttl_memoize(ttl_seconds=ICAV2_DATA_CACHE_TTL_SECONDS, maxsize=ICAV2_DATA_CACHE_MAXSIZE)
+def get_cached_project_data_obj_by_id(project_id: str, data_id: str) -> 'ProjectData':
+    return get_project_data_obj_by_id(project_id=project_id, data_id=data_id)
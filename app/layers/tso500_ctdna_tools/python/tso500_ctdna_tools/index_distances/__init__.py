@@ -0,0 +1,167 @@
+"""
+Index pair distances of the samples on each lane
+
+BCLConvert assigns a read to a sample if both the i7 and the i5 index are within the mismatch tolerance.
+Two samples are therefore separable if either their i7 or their i5 indexes are far enough apart,
+so the distance of a pair of samples is the larger of the i7 and the i5 hamming distances.
+
+A pair of samples collides if a single read could be within the mismatch tolerance of both,
+that is, if the pair distance is no more than twice the number of allowed mismatches.
+
+Requires numpy (packaged with the lambda, the layer itself is pure python)
+"""
+
+# Standard imports
+import logging
+import typing
+from typing import Dict, List, Optional, Tuple, TypedDict
+
+# Third party imports
+import numpy as np
+
+# Type hints
+if typing.TYPE_CHECKING:
+    from orcabus_api_tools.fastq.models import FastqListRowDict
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+# BCLConvert allows one mismatch per index by default (BarcodeMismatchesIndex1 / BarcodeMismatchesIndex2)
+BARCODE_MISMATCHES = 1
+# Evenly spaced index kits can have many pairs at the minimum distance, only report the first few
+MAX_CLOSEST_SAMPLE_PAIRS = 10
+
+
+class IndexPairDistanceDict(TypedDict):
+    sampleIdA: str
+    sampleIdB: str
+    distance: int
+
+
+class LaneIndexDistancesDict(TypedDict):
+    instrumentRunId: str
+    lane: str
+    minDistance: int
+    closestSamplePairs: List[IndexPairDistanceDict]
+    collisions: List[IndexPairDistanceDict]
+
+
+def encode_index_sequences(index_list: List[str]) -> np.ndarray:
+    """
+    Encode a list of index sequences as an (n_indexes, index_length) uint8 array.
+
+    Shorter sequences are right-padded with null bytes, so a padded position only matches another padded position.
+    """
+    index_length = max(map(len, index_list))
+    return np.frombuffer(
+        "".join(map(lambda index_iter_: index_iter_.ljust(index_length, "\0"), index_list)).encode("ascii"),
+        dtype=np.uint8
+    ).reshape(len(index_list), index_length)
+
+
+def get_hamming_distance_matrix(index_list: List[str]) -> np.ndarray:
+    """
+    Get the pairwise hamming distance matrix of a list of index sequences
+    """
+    encoded_indexes = encode_index_sequences(index_list)
+    distance_matrix = np.zeros((len(index_list), len(index_list)), dtype=np.uint8)
+    # Broadcast one position at a time, this keeps the intermediate arrays at n x n rather than n x n x length
+    for position_column in encoded_indexes.T:
+        distance_matrix += position_column[:, np.newaxis] != position_column[np.newaxis, :]
+    return distance_matrix
+
+
+def get_index_pair_distance_matrix(i7_index_list: List[str], i5_index_list: List[str]) -> np.ndarray:
+    """
+    Get the pairwise index pair distance matrix, the larger of the i7 and the i5 hamming distances
+    """
+    return np.maximum(
+        get_hamming_distance_matrix(i7_index_list),
+        get_hamming_distance_matrix(i5_index_list),
+    )
+
+
+def get_index_distances(
+        fastq_list_rows: List['FastqListRowDict'],
+        barcode_mismatches: int = BARCODE_MISMATCHES,
+        max_closest_sample_pairs: int = MAX_CLOSEST_SAMPLE_PAIRS
+) -> List[LaneIndexDistancesDict]:
+    """
+    For each lane of each instrument run, get the minimum index pair distance of the samples on the lane,
+    the closest pairs of samples and any pairs of samples that collide at the BCLConvert mismatch tolerance.
+
+    Distances are computed on the sequenced indexes (from the rgid), lanes with a single sample are not reported.
+    """
+    # (sample id, i7 index, i5 index) for each fastq list row, keyed by instrument run id and lane
+    index_pairs_by_lane: Dict[Tuple[str, str], List[Tuple[str, str, str]]] = {}
+    for fastq_list_row_iter_ in fastq_list_rows:
+        indexes, lane, instrument_run_id = fastq_list_row_iter_["rgid"].split('.', 2)
+        index_1, index_2 = indexes.split('+')
+        index_pairs_by_lane.setdefault((instrument_run_id, lane), []).append(
+            (fastq_list_row_iter_["rgsm"], index_1, index_2)
+        )
+
+    index_distances: List[LaneIndexDistancesDict] = []
+    for (instrument_run_id, lane), index_pairs in sorted(
+            index_pairs_by_lane.items(), key=lambda lane_iter_: (lane_iter_[0][0], int(lane_iter_[0][1]))
+    ):
+        if len(index_pairs) < 2:
+            continue
+
+        sample_ids, i7_index_list, i5_index_list = map(list, zip(*index_pairs))
+        distance_matrix = get_index_pair_distance_matrix(i7_index_list, i5_index_list)
+
+        # Only consider each pair once
+        upper_triangle = np.triu(np.ones_like(distance_matrix, dtype=bool), k=1)
+        min_distance = int(distance_matrix[upper_triangle].min())
+
+        def get_index_pair_distances(
+                pair_mask: np.ndarray,
+                max_pairs: Optional[int] = None
+        ) -> List[IndexPairDistanceDict]:
+            return list(map(
+                lambda sample_idx_pair_iter_: {
+                    "sampleIdA": sample_ids[sample_idx_pair_iter_[0]],
+                    "sampleIdB": sample_ids[sample_idx_pair_iter_[1]],
+                    "distance": int(distance_matrix[sample_idx_pair_iter_[0], sample_idx_pair_iter_[1]]),
+                },
+                np.argwhere(upper_triangle & pair_mask)[:max_pairs]
+            ))
+
+        logger.info(f"Minimum index pair distance on lane {lane} of {instrument_run_id} is {min_distance}")
+        index_distances.append({
+            "instrumentRunId": instrument_run_id,
+            "lane": lane,
+            "minDistance": min_distance,
+            "closestSamplePairs": get_index_pair_distances(
+                distance_matrix == min_distance, max_pairs=max_closest_sample_pairs
+            ),
+            "collisions": get_index_pair_distances(distance_matrix <= 2 * barcode_mismatches),
+        })
+
+    return index_distances
+
+
+def check_index_collisions(
+        index_distances: List[LaneIndexDistancesDict],
+        barcode_mismatches: int = BARCODE_MISMATCHES
+):
+    """
+    Confirm the samples on each lane can be separated at the BCLConvert mismatch tolerance
+
+    :raises ValueError: if any pair of samples on a lane collide
+    """
+    collisions = [
+        f"lane {lane_index_distances['lane']} of {lane_index_distances['instrumentRunId']}: "
+        f"{collision['sampleIdA']} / {collision['sampleIdB']} (distance {collision['distance']})"
+        for lane_index_distances in index_distances
+        for collision in lane_index_distances['collisions']
+    ]
+
+    if collisions:
+        logger.error(f"Index collisions found: {'; '.join(collisions)}")
+        raise ValueError(
+            f"Found {len(collisions)} index collisions at {barcode_mismatches} barcode mismatches: "
+            f"{'; '.join(collisions)}"
+        )
@@ -0,0 +1,41 @@
+"""
+Payload fingerprints
+
+Payloads are serialised to a canonical JSON string (sorted keys, no whitespace, integral floats written as integers)
+so that two payloads with the same contents always have the same sha256 fingerprint,
+regardless of key order or whether a number went through a float on the way.
+"""
+
+# Standard imports
+import json
+from hashlib import sha256
+from typing import Any
+
+# Globals
+FINGERPRINT_PREFIX = "sha256:"
+
+
+def normalise_payload(payload: Any) -> Any:
+    """
+    Write integral floats (i.e. 1.0) as integers, bools are left as is
+    """
+    if isinstance(payload, dict):
+        return {key: normalise_payload(value) for key, value in payload.items()}
+    if isinstance(payload, (list, tuple)):
+        return list(map(normalise_payload, payload))
+    if isinstance(payload, float) and payload.is_integer():
+        return int(payload)
+    return payload
+
+
+def get_canonical_json(payload: Any) -> str:
+    return json.dumps(
+        normalise_payload(payload),
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def get_payload_fingerprint(payload: Any) -> str:
+    return FINGERPRINT_PREFIX + sha256(get_canonical_json(payload).encode()).hexdigest()
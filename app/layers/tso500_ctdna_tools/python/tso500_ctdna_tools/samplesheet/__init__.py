@@ -0,0 +1,23 @@
+"""
+Samplesheet caching and upload helpers
+"""
+
+from .cache import (
+    get_samplesheet_cache_key,
+    LocalFileSamplesheetCache,
+)
+from .store import (
+    SamplesheetFileDict,
+    SamplesheetStore,
+    LocalSamplesheetStore,
+    upload_samplesheet,
+)
+
+__all__ = [
+    "get_samplesheet_cache_key",
+    "LocalFileSamplesheetCache",
+    "SamplesheetFileDict",
+    "SamplesheetStore",
+    "LocalSamplesheetStore",
+    "upload_samplesheet",
+]
@@ -0,0 +1,95 @@
+"""
+Content-addressed cache for rendered samplesheets
+
+The cache key is a sha256 over the sorted (rgid, rgsm) pairs and
+whether V3 index ids are supported by the workflow version.
+The pairs are hashed together, as the rgsm is the Sample_ID given to the index pair of the rgid.
+The rgid already encodes the index pair, lane and instrument run id, so two
+workflow runs with the same key will always render the same samplesheet.
+"""
+
+# Standard imports
+import json
+import logging
+import os
+from hashlib import sha256
+from pathlib import Path
+from shutil import copyfileobj
+from tempfile import NamedTemporaryFile
+from typing import List, Optional, TextIO, Union
+import typing
+
+if typing.TYPE_CHECKING:
+    from orcabus_api_tools.fastq.models import FastqListRowDict
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+# The lambda only has write access to /tmp, which persists between warm invocations
+DEFAULT_SAMPLESHEET_CACHE_DIR = Path("/tmp") / "samplesheet_cache"
+SAMPLESHEET_CACHE_DIR_ENV_VAR = "SAMPLESHEET_CACHE_DIR"
+SAMPLESHEET_CACHE_SUFFIX = ".csv"
+
+
+def get_samplesheet_cache_key(
+        fastq_list_rows: List['FastqListRowDict'],
+        v3_indexes_supported: bool
+) -> str:
+    """
+    Get the cache key for a set of fastq list rows and the V3 index support decision
+    """
+    return sha256(
+        json.dumps(
+            {
+                "rgidRgsmPairs": sorted(map(
+                    lambda fastq_list_row_iter_: (fastq_list_row_iter_['rgid'], fastq_list_row_iter_['rgsm']),
+                    fastq_list_rows
+                )),
+                "v3IndexesSupported": v3_indexes_supported,
+            },
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode()
+    ).hexdigest()
+
+
+class LocalFileSamplesheetCache:
+    """
+    Samplesheet cache backed by a local directory, one file per cache key
+    """
+    def __init__(self, cache_dir: Optional[Path] = None):
+        if cache_dir is None:
+            cache_dir = Path(os.environ.get(SAMPLESHEET_CACHE_DIR_ENV_VAR, DEFAULT_SAMPLESHEET_CACHE_DIR))
+        self.cache_dir = Path(cache_dir)
+
+    def _get_cache_path(self, cache_key: str) -> Path:
+        return self.cache_dir / (cache_key + SAMPLESHEET_CACHE_SUFFIX)
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """
+        Return the cached samplesheet string or None if the key has not been seen
+        """
+        try:
+            samplesheet_str = self._get_cache_path(cache_key).read_text()
+        except FileNotFoundError:
+            return None
+        logger.info(f"Samplesheet cache hit for key {cache_key}")
+        return samplesheet_str
+
+    def put(self, cache_key: str, samplesheet_str_or_stream: Union[str, TextIO]):
+        """
+        Write the samplesheet to the cache.
+        Written to a temporary file first, then moved into place so a concurrent reader
+        never sees a partially written samplesheet.
+        A stream is rewound afterwards so it can still be uploaded
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile("w", dir=self.cache_dir, suffix=".tmp", delete=False) as tmp_h:
+            if isinstance(samplesheet_str_or_stream, str):
+                tmp_h.write(samplesheet_str_or_stream)
+            else:
+                samplesheet_str_or_stream.seek(0)
+                copyfileobj(samplesheet_str_or_stream, tmp_h)
+                samplesheet_str_or_stream.seek(0)
+        os.replace(tmp_h.name, self._get_cache_path(cache_key))
@@ -0,0 +1,193 @@
+"""
+Overwrite-in-place samplesheet upload
+
+The upload logic is written against a small store interface so that it can be run against ICAv2
+(see upload.Icav2SamplesheetStore) or against a local directory (LocalSamplesheetStore).
+
+1. If a samplesheet already exists with the same size and checksum, nothing is written
+2. Otherwise, the existing samplesheet is deleted and we poll (with bounded backoff) until the deletion is visible
+3. The new samplesheet is then written
+"""
+
+# Standard imports
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+from hashlib import md5, sha256
+from io import StringIO
+from pathlib import Path
+from shutil import copyfileobj
+from tempfile import NamedTemporaryFile
+from threading import Timer
+from time import sleep
+from typing import Optional, TextIO, Tuple, TypedDict, Union
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+SAMPLESHEET_BASENAME = 'SampleSheet.csv'
+# Poll for the deletion of an existing samplesheet at 0.25, 0.5, 1, 2, 2, ... seconds (~10 seconds in total)
+DELETION_POLL_INITIAL_INTERVAL_SECONDS = 0.25
+DELETION_POLL_MAX_INTERVAL_SECONDS = 2
+DELETION_POLL_MAX_ATTEMPTS = 8
+# Single part uploads have the md5 of the file contents as the etag, multipart etags contain a '-'
+MD5_ETAG_REGEX = re.compile(r"^[0-9a-f]{32}$")
+# Samplesheet streams are hashed a chunk at a time
+DIGEST_CHUNK_SIZE = 64 * 1024
+
+
+class SamplesheetFileDict(TypedDict):
+    fileId: str
+    fileUri: str
+    fileSizeInBytes: Optional[int]
+    eTag: Optional[str]
+
+
+class SamplesheetStore(ABC):
+    """
+    Interface for a directory that holds a single SampleSheet.csv
+    """
+    @abstractmethod
+    def get_samplesheet_file(self) -> Optional[SamplesheetFileDict]:
+        pass
+
+    @abstractmethod
+    def read_samplesheet_file(self, samplesheet_file: SamplesheetFileDict) -> str:
+        pass
+
+    @abstractmethod
+    def delete_samplesheet_file(self, samplesheet_file: SamplesheetFileDict):
+        pass
+
+    @abstractmethod
+    def write_samplesheet_file(self, samplesheet_stream: TextIO) -> str:
+        pass
+
+
+def get_samplesheet_stream_size_and_digests(samplesheet_stream: TextIO) -> Tuple[int, str, str]:
+    """
+    Get the size in bytes, md5 and sha256 hex digests of a samplesheet stream in a single chunked pass.
+    The stream is rewound afterwards so it can still be uploaded
+    """
+    size_in_bytes = 0
+    md5_hash = md5()
+    sha256_hash = sha256()
+    samplesheet_stream.seek(0)
+    for chunk in iter(lambda: samplesheet_stream.read(DIGEST_CHUNK_SIZE), ""):
+        chunk_bytes = chunk.encode()
+        size_in_bytes += len(chunk_bytes)
+        md5_hash.update(chunk_bytes)
+        sha256_hash.update(chunk_bytes)
+    samplesheet_stream.seek(0)
+    return size_in_bytes, md5_hash.hexdigest(), sha256_hash.hexdigest()
+
+
+def is_samplesheet_file_unchanged(
+        store: SamplesheetStore,
+        samplesheet_file: SamplesheetFileDict,
+        samplesheet_stream: TextIO
+) -> bool:
+    """
+    Compare the existing samplesheet file to the new samplesheet.
+    The size and etag are compared first, the existing file contents are only read
+    if the etag cannot be used as a checksum (i.e. multipart uploads)
+    """
+    size_in_bytes, md5_digest, sha256_digest = get_samplesheet_stream_size_and_digests(samplesheet_stream)
+
+    if samplesheet_file['fileSizeInBytes'] is not None and samplesheet_file['fileSizeInBytes'] != size_in_bytes:
+        return False
+
+    e_tag = (samplesheet_file['eTag'] or "").strip('"')
+    if MD5_ETAG_REGEX.match(e_tag):
+        return e_tag == md5_digest
+
+    return sha256(store.read_samplesheet_file(samplesheet_file).encode()).hexdigest() == sha256_digest
+
+
+def wait_for_samplesheet_deletion(store: SamplesheetStore):
+    """
+    Poll until the store no longer returns the samplesheet file
+
+    :raises TimeoutError: if the samplesheet is still present after DELETION_POLL_MAX_ATTEMPTS
+    """
+    poll_interval = DELETION_POLL_INITIAL_INTERVAL_SECONDS
+    for _ in range(DELETION_POLL_MAX_ATTEMPTS):
+        if store.get_samplesheet_file() is None:
+            return
+        sleep(poll_interval)
+        poll_interval = min(poll_interval * 2, DELETION_POLL_MAX_INTERVAL_SECONDS)
+
+    if store.get_samplesheet_file() is not None:
+        raise TimeoutError("Existing samplesheet was deleted but is still present, cannot write the new samplesheet")
+
+
+def upload_samplesheet(
+        store: SamplesheetStore,
+        samplesheet_str_or_stream: Union[str, TextIO]
+) -> str:
+    """
+    Write the samplesheet to the store, replacing any existing samplesheet, and return the samplesheet file uri
+    """
+    if isinstance(samplesheet_str_or_stream, str):
+        samplesheet_str_or_stream = StringIO(samplesheet_str_or_stream)
+
+    samplesheet_file = store.get_samplesheet_file()
+    if samplesheet_file is not None:
+        # Reruns generate the same samplesheet, no need to replace it if the contents are identical
+        if is_samplesheet_file_unchanged(store, samplesheet_file, samplesheet_str_or_stream):
+            logger.info("Existing samplesheet has the same size and checksum, skipping upload")
+            return samplesheet_file['fileUri']
+
+        # Delete existing samplesheet
+        store.delete_samplesheet_file(samplesheet_file)
+        wait_for_samplesheet_deletion(store)
+
+    return store.write_samplesheet_file(samplesheet_str_or_stream)
+
+
+class LocalSamplesheetStore(SamplesheetStore):
+    """
+    Local directory stand-in for an ICAv2 cache directory.
+
+    Deletions can be delayed by delete_latency_seconds to mimic the eventual consistency of ICAv2,
+    writes go through a temporary file and are then moved into place
+    """
+    def __init__(self, cache_dir: Path, delete_latency_seconds: float = 0):
+        self.cache_dir = Path(cache_dir)
+        self.delete_latency_seconds = delete_latency_seconds
+
+    @property
+    def samplesheet_path(self) -> Path:
+        return self.cache_dir / SAMPLESHEET_BASENAME
+
+    def get_samplesheet_file(self) -> Optional[SamplesheetFileDict]:
+        try:
+            samplesheet_bytes = self.samplesheet_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return {
+            "fileId": str(self.samplesheet_path),
+            "fileUri": self.samplesheet_path.as_uri(),
+            "fileSizeInBytes": len(samplesheet_bytes),
+            "eTag": md5(samplesheet_bytes).hexdigest(),
+        }
+
+    def read_samplesheet_file(self, samplesheet_file: SamplesheetFileDict) -> str:
+        return Path(samplesheet_file['fileId']).read_text()
+
+    def delete_samplesheet_file(self, samplesheet_file: SamplesheetFileDict):
+        if self.delete_latency_seconds:
+            Timer(self.delete_latency_seconds, Path(samplesheet_file['fileId']).unlink).start()
+        else:
+            Path(samplesheet_file['fileId']).unlink()
+
+    def write_samplesheet_file(self, samplesheet_stream: TextIO) -> str:
+        if self.samplesheet_path.exists():
+            raise FileExistsError(f"{self.samplesheet_path} already exists")
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile("w", dir=self.cache_dir, suffix=".tmp", delete=False) as tmp_h:
+            copyfileobj(samplesheet_stream, tmp_h)
+        os.replace(tmp_h.name, self.samplesheet_path)
+        return self.samplesheet_path.as_uri()
@@ -0,0 +1,82 @@
+"""
+Upload a rendered samplesheet into the cache directory of a workflow run
+
+Kept separate from the store module as it requires wrapica (provided by the icav2 tools layer)
+
+ICAv2 has no rename, so the new samplesheet cannot be written to a temporary name and moved over the
+existing one. Instead, an unchanged samplesheet is left in place and a changed samplesheet is deleted,
+then written once the deletion is visible (see store.upload_samplesheet).
+"""
+
+# Standard imports
+from pathlib import Path
+from typing import Optional, TextIO, Union
+
+# Wrapica imports
+from wrapica.project_data import (
+    write_icav2_file_contents, convert_uri_to_project_data_obj,
+    convert_project_data_obj_to_uri, get_project_data_obj_by_id,
+    get_project_data_obj_from_project_id_and_path, delete_project_data,
+    read_icav2_file_contents_to_string
+)
+
+# Local imports
+from .store import SAMPLESHEET_BASENAME, SamplesheetFileDict, SamplesheetStore, upload_samplesheet
+
+
+class Icav2SamplesheetStore(SamplesheetStore):
+    """
+    The SampleSheet.csv in an ICAv2 cache directory
+    """
+    def __init__(self, cache_uri: str):
+        cache_project_data_obj = convert_uri_to_project_data_obj(
+            cache_uri,
+            create_data_if_not_found=True
+        )
+        self.project_id = cache_project_data_obj.project_id
+        self.samplesheet_path = Path(cache_project_data_obj.data.details.path) / SAMPLESHEET_BASENAME
+
+    def get_samplesheet_file(self) -> Optional[SamplesheetFileDict]:
+        try:
+            samplesheet_obj = get_project_data_obj_from_project_id_and_path(
+                project_id=self.project_id,
+                data_path=self.samplesheet_path,
+                data_type="FILE",
+                create_data_if_not_found=False
+            )
+        except FileNotFoundError:
+            return None
+
+        return {
+            "fileId": samplesheet_obj.data.id,
+            "fileUri": convert_project_data_obj_to_uri(samplesheet_obj),
+            "fileSizeInBytes": getattr(samplesheet_obj.data.details, "file_size_in_bytes", None),
+            "eTag": getattr(samplesheet_obj.data.details, "object_e_tag", None),
+        }
+
+    def read_samplesheet_file(self, samplesheet_file: SamplesheetFileDict) -> str:
+        return read_icav2_file_contents_to_string(self.project_id, samplesheet_file['fileId'])
+
+    def delete_samplesheet_file(self, samplesheet_file: SamplesheetFileDict):
+        delete_project_data(self.project_id, samplesheet_file['fileId'])
+
+    def write_samplesheet_file(self, samplesheet_stream: TextIO) -> str:
+        samplesheet_file_id = write_icav2_file_contents(
+            project_id=self.project_id,
+            data_path=self.samplesheet_path,
+            file_stream_or_path=samplesheet_stream
+        )
+        return convert_project_data_obj_to_uri(
+            get_project_data_obj_by_id(self.project_id, samplesheet_file_id)
+        )
+
+
+def upload_samplesheet_to_cache_uri(
+        cache_uri: str,
+        samplesheet_str_or_stream: Union[str, TextIO]
+) -> str:
+    """
+    Write the samplesheet (a string or a stream) to <cache_uri>/SampleSheet.csv
+    and return the uri of the samplesheet file.
+    """
+    return upload_samplesheet(Icav2SamplesheetStore(cache_uri), samplesheet_str_or_stream)
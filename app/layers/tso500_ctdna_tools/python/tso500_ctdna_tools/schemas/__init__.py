@@ -0,0 +1,443 @@
+"""
+Draft schema provider
+
+The complete-data-draft schema is compiled into a validator that is kept for the life of the warm container.
+
+Schemas are resolved according to SCHEMA_RESOLUTION_MODE:
+* packaged (default): load the schema from PACKAGED_SCHEMAS_DIR (the app/event-schemas directory),
+  the registry is only consulted for payload versions that are not packaged.
+  The registry schemas are deployed from the same files, so packaged schemas are never refreshed
+* packaged-with-refresh: as above, but after SCHEMA_CACHE_TTL_SECONDS check the registry for a newer schema
+* registry: always resolve the schema through SSM and the EventBridge schema registry
+
+* Validators are cached per payload version
+* After SCHEMA_CACHE_TTL_SECONDS the schema version in SSM is re-checked,
+  the schema is only re-downloaded and re-compiled if the version has changed
+* Payloads are validated as in-memory dicts, no need to round-trip through json
+
+validate_payload walks the payload once and returns the validity, the first error (for comments)
+and the missing / invalid field paths together.
+
+With SCHEMA_VALIDATION_MODE=incremental (the default), payloads are validated subtree by subtree
+(see IncrementalPayloadValidator). The errors for each subtree are cached by a digest of its contents,
+so re-validating an updated payload only re-checks the subtrees that have changed.
+"""
+
+# Standard imports
+import json
+import logging
+import re
+import typing
+from collections import deque
+from copy import copy
+from hashlib import sha256
+from functools import lru_cache
+from os import environ
+from pathlib import Path
+from threading import Lock
+from time import monotonic
+from typing import Any, Dict, Iterator, List, Optional, Sequence, TypedDict, Union
+
+import boto3
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import ValidationError, best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+# Layer imports
+from ..cache import TTLCache
+
+# Type checking imports
+if typing.TYPE_CHECKING:
+    from mypy_boto3_schemas import SchemasClient
+    from mypy_boto3_ssm import SSMClient
+
+# Logging
+logger = logging.getLogger(__name__)
+
+# Globals
+SSM_REGISTRY_NAME_ENV_VAR = "SSM_REGISTRY_NAME"
+SSM_SCHEMA_PATH_ENV_VAR = "SSM_SCHEMA_PATH"
+SCHEMA_CACHE_TTL_SECONDS_ENV_VAR = "SCHEMA_CACHE_TTL_SECONDS"
+DEFAULT_SCHEMA_CACHE_TTL_SECONDS = 5 * 60
+SCHEMA_RESOLUTION_MODE_ENV_VAR = "SCHEMA_RESOLUTION_MODE"
+PACKAGED_SCHEMAS_DIR_ENV_VAR = "PACKAGED_SCHEMAS_DIR"
+# Layout of the packaged schemas directory, <schema-name>/<payload-version>/<schema-name>-schema.json
+DRAFT_SCHEMA_NAME = "complete-data-draft"
+PAYLOAD_VERSION_REGEX = re.compile(r"^\d{4}\.\d{2}\.\d{2}$")
+
+PACKAGED_RESOLUTION_MODE = "packaged"
+PACKAGED_WITH_REFRESH_RESOLUTION_MODE = "packaged-with-refresh"
+REGISTRY_RESOLUTION_MODE = "registry"
+SCHEMA_RESOLUTION_MODES = [
+    PACKAGED_RESOLUTION_MODE,
+    PACKAGED_WITH_REFRESH_RESOLUTION_MODE,
+    REGISTRY_RESOLUTION_MODE,
+]
+
+SCHEMA_VALIDATION_MODE_ENV_VAR = "SCHEMA_VALIDATION_MODE"
+FULL_VALIDATION_MODE = "full"
+INCREMENTAL_VALIDATION_MODE = "incremental"
+SCHEMA_VALIDATION_MODES = [
+    FULL_VALIDATION_MODE,
+    INCREMENTAL_VALIDATION_MODE,
+]
+SUBTREE_CACHE_MAXSIZE = 4096
+
+# Keywords whose result depends on sibling keywords or on other parts of the instance,
+# schema nodes containing any of these are validated as a whole rather than split into subtrees
+NON_DECOMPOSABLE_KEYWORDS = {
+    "additionalProperties", "patternProperties", "unevaluatedProperties", "dependentSchemas",
+    "prefixItems", "unevaluatedItems", "contains", "if", "$dynamicRef", "$id",
+}
+
+
+class SchemaValidatorCacheEntry(TypedDict):
+    validator: Validator
+    incrementalValidator: 'IncrementalPayloadValidator'
+    isPackaged: bool
+    schemaVersion: Optional[str]
+    checkedAt: float
+
+
+class PayloadValidationResult(TypedDict):
+    isValid: bool
+    firstError: Optional[ValidationError]
+    missingFields: List[str]
+
+
+def get_subtree_digest(instance: Any) -> str:
+    """
+    Digest of a payload subtree.
+    Keys are not sorted, the order of properties can change the order validation errors are found in
+    """
+    return sha256(
+        json.dumps(instance, separators=(",", ":"), ensure_ascii=False, default=str).encode()
+    ).hexdigest()
+
+
+def prefix_validation_errors(
+        validation_errors: Sequence[ValidationError],
+        path_prefix: Union[str, int]
+) -> List[ValidationError]:
+    """
+    Copy the validation errors of a subtree with the path of the subtree prepended,
+    the originals are kept as is since they may be cached
+    """
+    prefixed_validation_errors = []
+    for validation_error in validation_errors:
+        prefixed_validation_error = copy(validation_error)
+        prefixed_validation_error.path = prefixed_validation_error.relative_path = deque(
+            [path_prefix, *validation_error.relative_path]
+        )
+        prefixed_validation_errors.append(prefixed_validation_error)
+    return prefixed_validation_errors
+
+
+class IncrementalPayloadValidator:
+    """
+    Validate a payload subtree by subtree, caching the errors of each subtree by the digest of its contents.
+
+    Schema nodes are split on their $ref (local refs only), properties and items keywords,
+    other keywords are checked against the node as a whole.
+    Errors are found in the same order, with the same paths, as a full validation so best_match picks the same error,
+    only the schema_path of errors found through a $ref differs.
+    """
+    def __init__(self, validator: Validator, maxsize: int = SUBTREE_CACHE_MAXSIZE):
+        self.validator = validator
+        self.schema = validator.schema
+        self.subtree_cache = TTLCache(ttl_seconds=get_schema_cache_ttl_seconds(), maxsize=maxsize)
+
+    def iter_errors(self, instance: Any) -> Iterator[ValidationError]:
+        hits, misses = self.subtree_cache.hits, self.subtree_cache.misses
+        validation_errors = self.get_subtree_errors(instance, self.schema)
+        logger.info(
+            f"Incremental validation subtree cache hits={self.subtree_cache.hits - hits}, "
+            f"misses={self.subtree_cache.misses - misses}"
+        )
+        return iter(validation_errors)
+
+    def resolve_local_ref(self, ref: str) -> Optional[Union[Dict, bool]]:
+        if not ref.startswith("#"):
+            return None
+        schema_node = self.schema
+        for ref_part in filter(lambda ref_part_iter_: ref_part_iter_, ref[1:].split("/")):
+            ref_part = ref_part.replace("~1", "/").replace("~0", "~")
+            if not isinstance(schema_node, dict) or ref_part not in schema_node:
+                return None
+            schema_node = schema_node[ref_part]
+        return schema_node
+
+    def is_decomposable(self, schema_node: Union[Dict, bool]) -> bool:
+        return isinstance(schema_node, dict) and NON_DECOMPOSABLE_KEYWORDS.isdisjoint(schema_node)
+
+    def get_keyword_errors(self, instance: Any, schema_node: Dict, keyword: str) -> List[ValidationError]:
+        keyword_schema = {keyword: schema_node[keyword]}
+        validation_errors = list(self.validator.descend(instance, keyword_schema))
+        for validation_error in validation_errors:
+            # Report the whole node as the error schema, as a full validation would
+            if validation_error.schema is keyword_schema:
+                validation_error.schema = schema_node
+        return validation_errors
+
+    def get_subtree_errors(self, instance: Any, schema_node: Union[Dict, bool]) -> List[ValidationError]:
+        """
+        Get the errors for an instance subtree, with paths relative to the subtree
+        """
+        cache_key = (id(schema_node), get_subtree_digest(instance))
+        validation_errors = self.subtree_cache.get(cache_key)
+        if validation_errors is not None:
+            return validation_errors
+
+        if not self.is_decomposable(schema_node):
+            validation_errors = list(self.validator.descend(instance, schema_node))
+        else:
+            validation_errors = []
+            for keyword, keyword_value in schema_node.items():
+                if keyword == "$ref" and self.resolve_local_ref(keyword_value) is not None:
+                    validation_errors.extend(
+                        self.get_subtree_errors(instance, self.resolve_local_ref(keyword_value))
+                    )
+                elif keyword == "properties" and self.validator.is_type(instance, "object"):
+                    for property_name, property_schema in keyword_value.items():
+                        if property_name not in instance:
+                            continue
+                        validation_errors.extend(prefix_validation_errors(
+                            self.get_subtree_errors(instance[property_name], property_schema),
+                            property_name
+                        ))
+                elif keyword == "items" and self.validator.is_type(instance, "array"):
+                    for index, item in enumerate(instance):
+                        validation_errors.extend(prefix_validation_errors(
+                            self.get_subtree_errors(item, keyword_value),
+                            index
+                        ))
+                else:
+                    validation_errors.extend(self.get_keyword_errors(instance, schema_node, keyword))
+
+        self.subtree_cache.set(cache_key, validation_errors)
+        return validation_errors
+
+
+_SCHEMA_VALIDATOR_CACHE: Dict[str, SchemaValidatorCacheEntry] = {}
+_SCHEMA_VALIDATOR_CACHE_LOCK = Lock()
+
+
+def get_schema_cache_ttl_seconds() -> float:
+    return float(environ.get(SCHEMA_CACHE_TTL_SECONDS_ENV_VAR, DEFAULT_SCHEMA_CACHE_TTL_SECONDS))
+
+
+def get_schema_resolution_mode() -> str:
+    schema_resolution_mode = environ.get(SCHEMA_RESOLUTION_MODE_ENV_VAR, PACKAGED_RESOLUTION_MODE)
+    if schema_resolution_mode not in SCHEMA_RESOLUTION_MODES:
+        raise ValueError(
+            f"Unknown {SCHEMA_RESOLUTION_MODE_ENV_VAR} '{schema_resolution_mode}', "
+            f"expected one of {', '.join(SCHEMA_RESOLUTION_MODES)}"
+        )
+    return schema_resolution_mode
+
+
+def get_schema_validation_mode() -> str:
+    schema_validation_mode = environ.get(SCHEMA_VALIDATION_MODE_ENV_VAR, INCREMENTAL_VALIDATION_MODE)
+    if schema_validation_mode not in SCHEMA_VALIDATION_MODES:
+        raise ValueError(
+            f"Unknown {SCHEMA_VALIDATION_MODE_ENV_VAR} '{schema_validation_mode}', "
+            f"expected one of {', '.join(SCHEMA_VALIDATION_MODES)}"
+        )
+    return schema_validation_mode
+
+
+def get_packaged_schema_path(payload_version: str) -> Optional[Path]:
+    """
+    Get the path to the packaged schema for the payload version, or None if it is not packaged
+    """
+    packaged_schemas_dir = environ.get(PACKAGED_SCHEMAS_DIR_ENV_VAR)
+    if packaged_schemas_dir is None or not PAYLOAD_VERSION_REGEX.match(payload_version):
+        return None
+
+    packaged_schema_path = (
+        Path(packaged_schemas_dir) / DRAFT_SCHEMA_NAME / payload_version / f"{DRAFT_SCHEMA_NAME}-schema.json"
+    )
+    if not packaged_schema_path.is_file():
+        return None
+    return packaged_schema_path
+
+
+@lru_cache(maxsize=None)
+def get_ssm_client() -> 'SSMClient':
+    return boto3.client("ssm")
+
+
+@lru_cache(maxsize=None)
+def get_schemas_client() -> 'SchemasClient':
+    return boto3.client("schemas")
+
+
+def get_ssm_parameter_value(parameter_name: str) -> str:
+    response = get_ssm_client().get_parameter(Name=parameter_name, WithDecryption=True)
+    return response["Parameter"]["Value"]
+
+
+def get_schema_parameter(payload_version: str) -> Dict[str, str]:
+    """
+    Get the registry name, schema name and schema version for a payload version
+    """
+    return json.loads(get_ssm_parameter_value(
+        str(Path(environ[SSM_SCHEMA_PATH_ENV_VAR]) / payload_version)
+    ))
+
+
+def get_schema_from_registry(
+        registry_name: str,
+        schema_name: str,
+        schema_version: Optional[str] = None
+) -> Dict:
+    describe_schema_kwargs = {
+        "RegistryName": registry_name,
+        "SchemaName": schema_name,
+    }
+    if schema_version is not None:
+        describe_schema_kwargs["SchemaVersion"] = schema_version
+
+    return json.loads(get_schemas_client().describe_schema(**describe_schema_kwargs)["Content"])
+
+
+def compile_schema_validator(schema: Dict) -> Validator:
+    """
+    Check the schema and build its validator, jsonschema.validate does this on every call
+    """
+    validator_cls = validator_for(schema, default=Draft202012Validator)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+def get_registry_schema_validator(
+        payload_version: str,
+        cache_entry: Optional[SchemaValidatorCacheEntry]
+) -> SchemaValidatorCacheEntry:
+    """
+    Check the schema version in SSM, only re-download and re-compile the schema if the version has changed
+    """
+    schema_parameter = get_schema_parameter(payload_version)
+    schema_version = schema_parameter.get("schemaVersion")
+
+    if cache_entry is not None and cache_entry['schemaVersion'] == schema_version:
+        logger.info(f"Schema for payload version {payload_version} is unchanged, keeping the cached validator")
+        return {
+            **cache_entry,
+            "checkedAt": monotonic(),
+        }
+
+    logger.info(f"Compiling registry schema validator for payload version {payload_version}")
+    validator = compile_schema_validator(
+        get_schema_from_registry(
+            registry_name=(
+                schema_parameter.get("registryName") or
+                get_ssm_parameter_value(environ[SSM_REGISTRY_NAME_ENV_VAR])
+            ),
+            schema_name=schema_parameter["schemaName"],
+            schema_version=schema_version,
+        )
+    )
+
+    return {
+        "validator": validator,
+        "incrementalValidator": IncrementalPayloadValidator(validator),
+        "isPackaged": False,
+        "schemaVersion": schema_version,
+        "checkedAt": monotonic(),
+    }
+
+
+def get_validator_from_cache_entry(
+        cache_entry: SchemaValidatorCacheEntry
+) -> Union[Validator, IncrementalPayloadValidator]:
+    if get_schema_validation_mode() == INCREMENTAL_VALIDATION_MODE:
+        return cache_entry['incrementalValidator']
+    return cache_entry['validator']
+
+
+def get_draft_schema_validator(payload_version: str) -> Union[Validator, IncrementalPayloadValidator]:
+    """
+    Get the compiled validator for the payload version,
+    or its incremental wrapper if SCHEMA_VALIDATION_MODE is incremental
+    """
+    schema_resolution_mode = get_schema_resolution_mode()
+
+    with _SCHEMA_VALIDATOR_CACHE_LOCK:
+        cache_entry = _SCHEMA_VALIDATOR_CACHE.get(payload_version)
+
+    if cache_entry is not None:
+        # Packaged schemas ship with the code, there is nothing to refresh
+        if cache_entry['isPackaged'] and schema_resolution_mode == PACKAGED_RESOLUTION_MODE:
+            return get_validator_from_cache_entry(cache_entry)
+        if monotonic() - cache_entry['checkedAt'] < get_schema_cache_ttl_seconds():
+            return get_validator_from_cache_entry(cache_entry)
+
+    packaged_schema_path = (
+        get_packaged_schema_path(payload_version)
+        if schema_resolution_mode != REGISTRY_RESOLUTION_MODE and cache_entry is None
+        else None
+    )
+
+    if packaged_schema_path is not None:
+        logger.info(f"Compiling packaged schema validator for payload version {payload_version}")
+        validator = compile_schema_validator(json.loads(packaged_schema_path.read_text()))
+        cache_entry = {
+            "validator": validator,
+            "incrementalValidator": IncrementalPayloadValidator(validator),
+            "isPackaged": True,
+            "schemaVersion": None,
+            "checkedAt": monotonic(),
+        }
+    else:
+        cache_entry = get_registry_schema_validator(payload_version, cache_entry)
+
+    with _SCHEMA_VALIDATOR_CACHE_LOCK:
+        _SCHEMA_VALIDATOR_CACHE[payload_version] = cache_entry
+
+    return get_validator_from_cache_entry(cache_entry)
+
+
+def get_missing_field_paths(validation_error: ValidationError) -> List[str]:
+    """
+    Get the dotted field paths for a validation error,
+    required errors list each missing property, other errors (type, pattern, etc.) list the invalid field
+    """
+    path = ".".join(map(str, validation_error.absolute_path))
+
+    if validation_error.validator == "required":
+        return list(map(
+            lambda missing_prop_iter_: f"{path}.{missing_prop_iter_}" if path else missing_prop_iter_,
+            filter(
+                lambda missing_prop_iter_: missing_prop_iter_ not in validation_error.instance,
+                validation_error.validator_value
+            )
+        ))
+
+    if path:
+        return [f"{path} ({validation_error.message[:50]})"]
+
+    return []
+
+
+def validate_payload(
+        validator: Union[Validator, IncrementalPayloadValidator],
+        instance: Dict
+) -> PayloadValidationResult:
+    """
+    Validate the payload in a single pass, returning the validity,
+    the most relevant error and the deduplicated missing field paths
+    """
+    validation_errors = list(validator.iter_errors(instance))
+
+    missing_fields: List[str] = []
+    for validation_error in validation_errors:
+        missing_fields.extend(get_missing_field_paths(validation_error))
+
+    return {
+        "isValid": len(validation_errors) == 0,
+        "firstError": best_match(validation_errors),
+        # Remove duplicates, keeping the order the errors were found in
+        "missingFields": list(dict.fromkeys(missing_fields)),
+    }
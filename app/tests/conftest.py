@@ -0,0 +1,61 @@
+"""
+Make the tso500 ctdna tools layer importable, as it is at /opt/python in the lambda runtime
+
+Tests marked as benchmarks compare wall-clock timings, so are skipped unless pytest is run with --run-benchmarks
+"""
+
+# Standard imports
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Callable
+
+# Third party imports
+import pytest
+
+# Globals
+TSO500_CTDNA_TOOLS_LAYER_DIR = Path(__file__).parent.parent / "layers" / "tso500_ctdna_tools" / "python"
+LAMBDAS_DIR = Path(__file__).parent.parent / "lambdas"
+
+sys.path.insert(0, str(TSO500_CTDNA_TOOLS_LAYER_DIR))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-benchmarks", action="store_true", default=False,
+        help="Run the tests marked as benchmarks, these assert on wall-clock timings"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: compares wall-clock timings, skipped without --run-benchmarks")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--run-benchmarks"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="Benchmarks only run with --run-benchmarks")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(scope="session")
+def import_lambda() -> Callable[[str], ModuleType]:
+    """
+    Import a lambda module by name, i.e. import_lambda("post_schema_validation").
+    The test is skipped if the lambda's dependencies (packaged with the lambda or its layers) cannot be imported
+    """
+    def _import_lambda(lambda_name: str) -> ModuleType:
+        spec = importlib.util.spec_from_file_location(
+            lambda_name, LAMBDAS_DIR / f"{lambda_name}_py" / f"{lambda_name}.py"
+        )
+        module = importlib.util.module_from_spec(spec)
+        try:
+            spec.loader.exec_module(module)
+        except ImportError as error:
+            pytest.skip(f"Could not import the {lambda_name} lambda: {error}")
+        return module
+
+    return _import_lambda
@@ -0,0 +1,178 @@
+"""
+Workflow run comment writer, the comment length limit, packing and retries of throttled requests
+"""
+
+# Standard imports
+from typing import Dict, List
+
+# Third party imports
+import pytest
+
+# Requires the orcabus api tools layer
+pytest.importorskip("orcabus_api_tools")
+
+# Layer imports
+from tso500_ctdna_tools import comments
+from tso500_ctdna_tools.comments import (
+    CONTINUED_SUFFIX,
+    MAX_COMMENT_ATTEMPTS,
+    MAX_COMMENT_LENGTH,
+    TRUNCATION_SUFFIX,
+    format_comment_with_arn,
+    get_comment_footer,
+    pack_comments,
+)
+
+# Globals
+EXECUTION_ARN = (
+    "arn:aws:states:ap-southeast-2:123456789012:execution:"
+    "tso500ctdna-validateDraftDataSfn:0b7c3f0e-1a2b-4c3d-8e9f-0a1b2c3d4e5f"
+)
+HEADER = "Post schema validation failed for 60 reasons"
+WORKFLOW_RUN_ID = "wfr.01JJ4TZJ6T3M2ZQ8V6W8K5N1XB"
+
+
+class ResponseError(Exception):
+    """
+    Stand-in for a failed request, with the status code on the response
+    """
+    def __init__(self, status_code: int):
+        super().__init__(f"{status_code} Error")
+        self.response = type("Response", (), {"status_code": status_code})()
+
+
+@pytest.fixture
+def comment_requests(monkeypatch):
+    """
+    Queue the errors raised by the next comment requests, every request is recorded
+    """
+    errors: List[Exception] = []
+    requests: List[Dict] = []
+    sleeps: List[float] = []
+
+    def add_comment_to_workflow_run(**kwargs):
+        requests.append(kwargs)
+        if errors:
+            raise errors.pop(0)
+
+    monkeypatch.setattr(comments, "add_comment_to_workflow_run", add_comment_to_workflow_run)
+    monkeypatch.setattr(comments, "sleep", sleeps.append)
+    monkeypatch.setattr(comments.COMMENT_TOKEN_BUCKET, "acquire", lambda: None)
+    return errors, requests, sleeps
+
+
+def get_lines(num_lines: int) -> List[str]:
+    return list(map(
+        lambda iter_: f"Could not find s3://primary-bucket/primary/L24{iter_:05d}_R1_001.fastq.ora",
+        range(num_lines)
+    ))
+
+
+def test_short_comment_is_unchanged():
+    assert format_comment_with_arn("Draft data is valid", EXECUTION_ARN) == (
+        f"Draft data is valid\n{get_comment_footer(EXECUTION_ARN)}"
+    )
+
+
+def test_long_comment_keeps_the_footer():
+    comment = format_comment_with_arn("A" * 2 * MAX_COMMENT_LENGTH, EXECUTION_ARN)
+
+    assert len(comment) == MAX_COMMENT_LENGTH
+    assert comment.endswith(f"{TRUNCATION_SUFFIX}\n{get_comment_footer(EXECUTION_ARN)}")
+
+
+def test_lines_that_fit_a_single_comment():
+    assert pack_comments(HEADER, get_lines(3), EXECUTION_ARN) == [
+        "\n".join([HEADER, *get_lines(3), get_comment_footer(EXECUTION_ARN)])
+    ]
+
+
+def test_lines_are_packed_across_several_comments():
+    lines = get_lines(60)
+
+    packed_comments = pack_comments(HEADER, lines, EXECUTION_ARN)
+
+    assert len(packed_comments) > 1
+    packed_lines = []
+    for comment_iter, comment in enumerate(packed_comments):
+        assert len(comment) <= MAX_COMMENT_LENGTH
+        assert TRUNCATION_SUFFIX not in comment
+        comment_lines = comment.split("\n")
+        # Later comments repeat the header, so each can be read on its own
+        assert comment_lines[0] == (HEADER if comment_iter == 0 else f"{HEADER} {CONTINUED_SUFFIX}")
+        assert "\n".join(comment_lines[-2:]) == get_comment_footer(EXECUTION_ARN)
+        packed_lines.extend(comment_lines[1:-2])
+    # Every line once, in order
+    assert packed_lines == lines
+
+    # As few comments as possible, the first line of each later comment did not fit the comment before it
+    for comment, next_comment in zip(packed_comments, packed_comments[1:]):
+        assert len(comment) + len(next_comment.split("\n")[1]) + 1 > MAX_COMMENT_LENGTH
+
+
+def test_single_over_long_line_is_truncated():
+    over_long_line = f"Could not find {'s3://primary-bucket/' * 100}"
+    lines = [*get_lines(2), over_long_line, *get_lines(2)]
+
+    packed_comments = pack_comments(HEADER, lines, EXECUTION_ARN)
+
+    assert len(packed_comments) == 3
+    # The over long line takes a comment of its own, truncated, with the footer kept
+    assert packed_comments[1].startswith(f"{HEADER} {CONTINUED_SUFFIX}\nCould not find s3://primary-bucket/")
+    assert len(packed_comments[1]) == MAX_COMMENT_LENGTH
+    assert packed_comments[1].endswith(f"{TRUNCATION_SUFFIX}\n{get_comment_footer(EXECUTION_ARN)}")
+    # The lines after it are not lost
+    assert packed_comments[2] == "\n".join([
+        f"{HEADER} {CONTINUED_SUFFIX}", *get_lines(2), get_comment_footer(EXECUTION_ARN)
+    ])
+
+
+def test_throttled_comment_is_retried(comment_requests):
+    errors, requests, sleeps = comment_requests
+    errors.extend([ResponseError(429), ResponseError(503)])
+
+    comments.add_workflow_run_comment(WORKFLOW_RUN_ID, "Draft data is valid", "tso500ctdna")
+
+    assert len(requests) == 3
+    assert requests[-1] == {
+        "workflow_run_orcabus_id": WORKFLOW_RUN_ID,
+        "comment": "Draft data is valid",
+        "author": "tso500ctdna",
+    }
+    # Full jitter, each delay is at most the exponential backoff of its attempt
+    assert len(sleeps) == 2
+    assert all(
+        0 <= delay <= comments.RETRY_BASE_DELAY_SECONDS * 2 ** attempt
+        for attempt, delay in enumerate(sleeps, start=1)
+    )
+
+
+def test_throttled_comment_gives_up(comment_requests):
+    errors, requests, sleeps = comment_requests
+    errors.extend([ResponseError(429)] * MAX_COMMENT_ATTEMPTS)
+
+    with pytest.raises(ResponseError, match="429"):
+        comments.add_workflow_run_comment(WORKFLOW_RUN_ID, "Draft data is valid", "tso500ctdna")
+
+    assert len(requests) == MAX_COMMENT_ATTEMPTS
+    assert len(sleeps) == MAX_COMMENT_ATTEMPTS - 1
+
+
+def test_other_errors_are_not_retried(comment_requests):
+    errors, requests, sleeps = comment_requests
+    errors.append(ResponseError(400))
+
+    with pytest.raises(ResponseError, match="400"):
+        comments.add_workflow_run_comment(WORKFLOW_RUN_ID, "Draft data is valid", "tso500ctdna")
+
+    assert len(requests) == 1
+    assert sleeps == []
+
+
+def test_comments_are_added_in_order(comment_requests):
+    _, requests, _ = comment_requests
+    packed_comments = pack_comments(HEADER, get_lines(60), EXECUTION_ARN)
+
+    comments.add_workflow_run_comments(WORKFLOW_RUN_ID, packed_comments, "tso500ctdna")
+
+    assert list(map(lambda request_iter_: request_iter_["comment"], requests)) == packed_comments
@@ -0,0 +1,90 @@
+"""
+Bounded concurrency helper, against a stand-in for an API call with a fixed latency
+
+The wall-clock comparison with serial calls is a benchmark, run with --run-benchmarks
+"""
+
+# Standard imports
+from threading import Lock
+from time import perf_counter, sleep
+
+# Third party imports
+import pytest
+
+# Layer imports
+from tso500_ctdna_tools import concurrency
+from tso500_ctdna_tools.concurrency import get_max_workers, map_concurrently
+
+# Globals
+SIMULATED_LATENCY_SECONDS = 0.05
+
+
+class SlowExistenceCheck:
+    """
+    Stand-in for a Filemanager lookup, every call takes SIMULATED_LATENCY_SECONDS
+    """
+    def __init__(self):
+        self._lock = Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, data_uri: str):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        sleep(SIMULATED_LATENCY_SECONDS)
+        with self._lock:
+            self.in_flight -= 1
+        # Every third uri is missing
+        if int(data_uri.rsplit("_", 1)[-1]) % 3 == 0:
+            return f"Could not find {data_uri}"
+        return None
+
+
+def get_data_uris(num_uris: int):
+    return list(map(lambda iter_: f"s3://bucket/sample_{iter_}", range(num_uris)))
+
+
+def test_results_are_in_input_order():
+    data_uris = get_data_uris(32)
+
+    assert map_concurrently(SlowExistenceCheck(), data_uris) == list(map(
+        lambda iter_: f"Could not find s3://bucket/sample_{iter_}" if iter_ % 3 == 0 else None,
+        range(32)
+    ))
+
+
+def test_first_exception_is_raised():
+    def check(data_uri: str):
+        raise ValueError(data_uri)
+
+    with pytest.raises(ValueError):
+        map_concurrently(check, get_data_uris(4))
+
+
+def test_max_workers_env_var(monkeypatch):
+    monkeypatch.setenv(concurrency.MAX_WORKERS_ENV_VAR, "4")
+    existence_check = SlowExistenceCheck()
+
+    map_concurrently(existence_check, get_data_uris(16))
+
+    assert get_max_workers() == 4
+    assert existence_check.max_in_flight == 4
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("num_uris", [16, 32])
+def test_wall_time_against_serial(num_uris, monkeypatch):
+    monkeypatch.delenv(concurrency.MAX_WORKERS_ENV_VAR, raising=False)
+    data_uris = get_data_uris(num_uris)
+    serial_seconds = num_uris * SIMULATED_LATENCY_SECONDS
+
+    start_time = perf_counter()
+    map_concurrently(SlowExistenceCheck(), data_uris)
+    concurrent_seconds = perf_counter() - start_time
+
+    print(f"{num_uris} uris, serial {serial_seconds:.2f} s, concurrent {concurrent_seconds:.2f} s")
+    # One call latency per batch of DEFAULT_MAX_WORKERS uris, with generous headroom for thread start up
+    num_batches = -(-num_uris // concurrency.DEFAULT_MAX_WORKERS)
+    assert concurrent_seconds < num_batches * SIMULATED_LATENCY_SECONDS * 3
+    assert concurrent_seconds * 4 < serial_seconds
@@ -0,0 +1,44 @@
+"""
+Memoized rgid to fastq lookups
+"""
+
+# Third party imports
+import pytest
+
+# Requires the orcabus api tools layer
+pytest.importorskip("orcabus_api_tools")
+
+# Layer imports
+from tso500_ctdna_tools import fastq
+
+
+@pytest.fixture
+def fastq_api(monkeypatch):
+    calls = []
+
+    def get_fastq_by_rgid(rgid):
+        calls.append(rgid)
+        return {"id": f"fqr.{rgid}", "qc": {"insertSizeEstimate": 150}}
+
+    monkeypatch.setattr(fastq, "get_fastq_by_rgid", get_fastq_by_rgid)
+    fastq._get_memoized_fastq_by_rgid.cache.clear()
+    yield calls
+    fastq._get_memoized_fastq_by_rgid.cache.clear()
+
+
+def test_repeated_rgids_are_requested_once(fastq_api):
+    fastq_list = fastq.get_fastqs_by_rgid_list(["AAAA.1", "CCCC.1", "AAAA.1"])
+
+    assert list(map(lambda fastq_iter_: fastq_iter_["id"], fastq_list)) == ["fqr.AAAA.1", "fqr.CCCC.1", "fqr.AAAA.1"]
+    assert sorted(fastq_api) == ["AAAA.1", "CCCC.1"]
+
+
+def test_results_do_not_share_the_cached_fastq(fastq_api):
+    fastq_list = fastq.get_fastqs_by_rgid_list(["AAAA.1", "AAAA.1"])
+    fastq_list[0]["qc"]["insertSizeEstimate"] = 0
+    fastq.get_cached_fastq_by_rgid("AAAA.1")["qc"] = None
+    fastq.get_fastq_by_rgid_map(["AAAA.1"])["AAAA.1"]["id"] = None
+
+    assert fastq_list[1]["qc"]["insertSizeEstimate"] == 150
+    assert fastq.get_cached_fastq_by_rgid("AAAA.1") == {"id": "fqr.AAAA.1", "qc": {"insertSizeEstimate": 150}}
+    assert fastq_api == ["AAAA.1"]
@@ -0,0 +1,139 @@
+"""
+Bulk Filemanager existence queries, against canned Filemanager list responses
+"""
+
+# Standard imports
+from typing import Dict, List, Optional
+
+# Third party imports
+import pytest
+
+# Requires the orcabus api tools layer
+pytest.importorskip("orcabus_api_tools")
+
+# Layer imports
+from tso500_ctdna_tools import filemanager
+
+# Globals
+BUCKET = "primary-bucket"
+PREFIX = "primary/241024_A00130_0336_BHW7MVDSXC/20250611c473883f/L2401531/"
+
+
+def get_list_response(keys: List[str], count: Optional[int] = None, next_link: Optional[str] = None) -> Dict:
+    return {
+        "links": {"previous": None, "next": next_link},
+        "pagination": {"count": len(keys) if count is None else count, "page": 1, "rowsPerPage": len(keys)},
+        "results": list(map(lambda key_iter_: {"bucket": BUCKET, "key": key_iter_}, keys)),
+    }
+
+
+@pytest.fixture
+def list_responses(monkeypatch):
+    """
+    Queue the responses to the next Filemanager list requests, the request params are recorded
+    """
+    responses: List[Dict] = []
+    requests: List[Dict] = []
+
+    def get_file_manager_request(endpoint: str, params: Dict) -> Dict:
+        requests.append(params)
+        return responses.pop(0)
+
+    monkeypatch.setattr(filemanager, "get_file_manager_request", get_file_manager_request)
+    return responses, requests
+
+
+def test_group_s3_uris_by_parent_prefix():
+    assert filemanager.group_s3_uris_by_parent_prefix([
+        f"s3://{BUCKET}/{PREFIX}L2401531_S1_L001_R1_001.fastq.gz",
+        f"s3://other-bucket/{PREFIX}L2401531_S1_L001_R1_001.fastq.gz",
+        f"s3://{BUCKET}/{PREFIX}L2401531_S1_L001_R2_001.fastq.gz",
+        f"s3://{BUCKET}/L2401531_R1_001.fastq.gz",
+    ]) == {
+        (BUCKET, PREFIX): [
+            f"s3://{BUCKET}/{PREFIX}L2401531_S1_L001_R1_001.fastq.gz",
+            f"s3://{BUCKET}/{PREFIX}L2401531_S1_L001_R2_001.fastq.gz",
+        ],
+        ("other-bucket", PREFIX): [f"s3://other-bucket/{PREFIX}L2401531_S1_L001_R1_001.fastq.gz"],
+        (BUCKET, ""): [f"s3://{BUCKET}/L2401531_R1_001.fastq.gz"],
+    }
+
+
+def test_listing_that_fits_a_single_page(list_responses):
+    responses, requests = list_responses
+    keys = [f"{PREFIX}L2401531_S1_L00{lane}_R{read}_001.fastq.gz" for lane in [1, 2] for read in [1, 2]]
+    responses.append(get_list_response(keys))
+
+    assert filemanager.list_s3_keys_under_prefix(BUCKET, PREFIX, max_listing_size=4) == set(keys)
+    assert requests == [{
+        "bucket": BUCKET,
+        "key": f"{PREFIX}*",
+        "currentState": "true",
+        "rowsPerPage": 4,
+    }]
+
+
+def test_empty_listing(list_responses):
+    responses, _ = list_responses
+    responses.append(get_list_response([]))
+
+    # An empty prefix is a valid listing, every uri under it is missing
+    assert filemanager.list_s3_keys_under_prefix(BUCKET, PREFIX) == set()
+
+
+@pytest.mark.parametrize(
+    "count,next_link",
+    [
+        # A next page, whatever the count says
+        (None, f"https://file.example.com/api/v1/s3?bucket={BUCKET}&page=2"),
+        # More objects than fit on the page, even without a next link
+        (5, None),
+        (1001, None),
+    ]
+)
+def test_listing_that_overflows_is_not_used(list_responses, count, next_link):
+    responses, requests = list_responses
+    keys = [f"{PREFIX}L2401531_S1_L00{lane}_R1_001.fastq.gz" for lane in [1, 2, 3, 4]]
+    responses.append(get_list_response(keys, count=count, next_link=next_link))
+
+    # The caller falls back to a lookup per uri
+    assert filemanager.list_s3_keys_under_prefix(BUCKET, PREFIX, max_listing_size=4) is None
+    assert len(requests) == 1
+
+
+def test_listing_without_links_or_pagination(list_responses):
+    responses, _ = list_responses
+    responses.append({"results": [{"bucket": BUCKET, "key": f"{PREFIX}L2401531_S1_L001_R1_001.fastq.gz"}]})
+
+    assert filemanager.list_s3_keys_under_prefix(BUCKET, PREFIX) == {f"{PREFIX}L2401531_S1_L001_R1_001.fastq.gz"}
+
+
+@pytest.mark.parametrize(
+    "keys,has_s3_objects",
+    [
+        ([f"{PREFIX}L2401531_R1_001.fastq.ora"], True),
+        ([], False),
+    ]
+)
+def test_folder_probe_requests_a_single_row(list_responses, keys, has_s3_objects):
+    responses, requests = list_responses
+    # The count is of every object under the prefix, only the first row is returned
+    responses.append(get_list_response(
+        keys, count=250 if keys else 0,
+        next_link=f"https://file.example.com/api/v1/s3?bucket={BUCKET}&page=2" if keys else None
+    ))
+
+    assert filemanager.has_s3_objects_under_prefix(BUCKET, PREFIX) is has_s3_objects
+    assert requests == [{
+        "bucket": BUCKET,
+        "key": f"{PREFIX}*",
+        "currentState": "true",
+        "rowsPerPage": 1,
+    }]
+
+
+def test_folder_probe_without_results(list_responses):
+    responses, _ = list_responses
+    responses.append({"links": {"next": None}, "pagination": {"count": 0}})
+
+    assert filemanager.has_s3_objects_under_prefix(BUCKET, PREFIX) is False
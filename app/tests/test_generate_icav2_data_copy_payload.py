@@ -0,0 +1,67 @@
+"""
+ICAv2 data copy payload for gzip compressed fastqs
+"""
+
+# Third party imports
+import pytest
+
+# Globals
+RUN_FOLDER_URI = "s3://pipeline-cache-bucket/cache/dragen-tso500-ctdna/20250101abcd1234/241024_A00130_0336_BHW7MVDSXC/"
+PRIMARY_DATA_PREFIX = "s3://primary-data-bucket/primary"
+
+
+@pytest.fixture(scope="module")
+def data_copy_lambda(import_lambda):
+    return import_lambda("generate_icav2_data_copy_payload")
+
+
+def get_fastq_list_row(lane: int, sample_number: int, instrument_run_id: str = "241024_A00130_0336_BHW7MVDSXC"):
+    fastq_prefix = f"{PRIMARY_DATA_PREFIX}/{instrument_run_id}/L2401531_S{sample_number}_L00{lane}"
+    return {
+        "rgid": f"CTGAAGCT+TCAGAGCC.{lane}.{instrument_run_id}",
+        "rgsm": "L2401531",
+        "rglb": "L2401531",
+        "lane": lane,
+        "read1FileUri": f"{fastq_prefix}_R1_001.fastq.gz",
+        "read2FileUri": f"{fastq_prefix}_R2_001.fastq.gz",
+    }
+
+
+def test_single_instrument_run(data_copy_lambda):
+    data_copy_payload = data_copy_lambda.handler(
+        {
+            "fastqListRows": [get_fastq_list_row(1, 7), get_fastq_list_row(2, 7)],
+            "runFolderUri": RUN_FOLDER_URI,
+        },
+        None
+    )["dataCopyPayload"]
+
+    assert data_copy_payload["destinationUri"] == f"{RUN_FOLDER_URI}L2401531/"
+    assert data_copy_payload["sourceUriList"] == list(map(
+        lambda renaming_map_iter_: renaming_map_iter_["sourceUri"],
+        data_copy_payload["renamingMapList"]
+    ))
+    assert list(map(
+        lambda renaming_map_iter_: renaming_map_iter_["outputFileName"],
+        data_copy_payload["renamingMapList"]
+    )) == [
+        "L2401531_S7_L001_R1_001.fastq.gz",
+        "L2401531_S7_L001_R2_001.fastq.gz",
+        "L2401531_S7_L002_R1_001.fastq.gz",
+        "L2401531_S7_L002_R2_001.fastq.gz",
+    ]
+
+
+def test_multiple_instrument_runs_are_rejected(data_copy_lambda):
+    # The same lane and sample number on each run would be copied to the same output file name
+    with pytest.raises(ValueError, match="more than one instrument run"):
+        data_copy_lambda.handler(
+            {
+                "fastqListRows": [
+                    get_fastq_list_row(1, 1),
+                    get_fastq_list_row(1, 1, instrument_run_id="250101_A01052_0100_AHXXXXDSXC"),
+                ],
+                "runFolderUri": RUN_FOLDER_URI,
+            },
+            None
+        )
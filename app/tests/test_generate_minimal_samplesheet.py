@@ -0,0 +1,160 @@
+"""
+Samplesheet generation from fastq list rows
+"""
+
+# Standard imports
+from typing import Dict, List
+
+# Third party imports
+import pytest
+
+# Globals
+INSTRUMENT_RUN_ID = "241024_A00130_0336_BHW7MVDSXC"
+TOP_UP_INSTRUMENT_RUN_ID = "250101_A01052_0100_AHXXXXDSXC"
+V2_INDEX_LENGTH = 10
+
+
+@pytest.fixture(scope="module")
+def samplesheet_lambda(import_lambda):
+    return import_lambda("generate_minimal_samplesheet_from_fastq_id_list")
+
+
+def get_fastq_list_rows(
+        samplesheet_lambda,
+        num_samples: int,
+        lanes: List[int],
+        instrument_run_id: str = INSTRUMENT_RUN_ID
+) -> List[Dict]:
+    """
+    One row per sample per lane, using the first num_samples indexes of the V2 kit (i5 reverse complemented)
+    """
+    valid_indexes = samplesheet_lambda.get_cttso_valid_indexes_by_index_length()[V2_INDEX_LENGTH][:num_samples]
+    return [
+        {
+            "rgid": f"{index_dict['index']}+{index_dict['index2_rev']}.{lane}.{instrument_run_id}",
+            "rgsm": f"L24{sample_iter:05d}",
+        }
+        for sample_iter, index_dict in enumerate(valid_indexes)
+        for lane in lanes
+    ]
+
+
+def test_build_samplesheet(samplesheet_lambda):
+    samplesheet = samplesheet_lambda.build_samplesheet(get_fastq_list_rows(samplesheet_lambda, 3, [1, 2]))
+
+    assert samplesheet["header"]["run_name"] == INSTRUMENT_RUN_ID
+    assert samplesheet["bclconvert_settings"] == samplesheet_lambda.V2_BCLCONVERT_SETTINGS
+    assert list(map(
+        lambda bclconvert_data_row_iter_: (bclconvert_data_row_iter_["lane"], bclconvert_data_row_iter_["sample_id"]),
+        samplesheet["bclconvert_data"]
+    )) == [
+        ("1", "L2400000"), ("1", "L2400001"), ("1", "L2400002"),
+        ("2", "L2400000"), ("2", "L2400001"), ("2", "L2400002"),
+    ]
+    # One TSO500L row per sample, not one per lane
+    assert list(map(
+        lambda tso500l_data_row_iter_: tso500l_data_row_iter_["sample_id"],
+        samplesheet["tso500l_data"]
+    )) == ["L2400000", "L2400001", "L2400002"]
+
+
+def test_build_samplesheet_ignores_row_order(samplesheet_lambda):
+    fastq_list_rows = get_fastq_list_rows(samplesheet_lambda, 8, [1, 2, 3, 4])
+
+    assert (
+        samplesheet_lambda.build_samplesheet(fastq_list_rows) ==
+        samplesheet_lambda.build_samplesheet(list(reversed(fastq_list_rows)))
+    )
+
+
+def test_build_samplesheet_rejects_multiple_instrument_runs(samplesheet_lambda):
+    # A library topped up on a second flowcell
+    fastq_list_rows = (
+        get_fastq_list_rows(samplesheet_lambda, 3, [1, 2]) +
+        get_fastq_list_rows(samplesheet_lambda, 3, [1], instrument_run_id=TOP_UP_INSTRUMENT_RUN_ID)
+    )
+
+    with pytest.raises(
+            ValueError,
+            match=f"more than one instrument run \\({INSTRUMENT_RUN_ID}, {TOP_UP_INSTRUMENT_RUN_ID}\\)"
+    ):
+        samplesheet_lambda.build_samplesheet(fastq_list_rows)
+
+
+@pytest.fixture
+def samplesheet_handler(samplesheet_lambda, monkeypatch, tmp_path):
+    """
+    The handler, without the ICAv2 environment and with the samplesheet cache in a temporary directory
+    """
+    monkeypatch.setattr(samplesheet_lambda, "set_icav2_env_vars", lambda: None)
+    monkeypatch.setattr(
+        samplesheet_lambda, "get_samplesheet_cache",
+        lambda: samplesheet_lambda.LocalFileSamplesheetCache(tmp_path)
+    )
+    return lambda event: samplesheet_lambda.handler(event, None)
+
+
+def test_handler_batch_mode(samplesheet_lambda, samplesheet_handler):
+    # Two groups of three samples, sharing lanes 1 and 2 of the instrument run
+    fastq_list_rows = get_fastq_list_rows(samplesheet_lambda, 6, [1, 2])
+    fastq_list_rows_by_group = {
+        "20250101abcd1234": fastq_list_rows[:6],
+        "20250101efgh5678": fastq_list_rows[6:],
+    }
+
+    response = samplesheet_handler({
+        "workflowVersion": "2.6.0",
+        "samplesheetGroups": {
+            group_id: {"fastqListRows": group_fastq_list_rows}
+            for group_id, group_fastq_list_rows in fastq_list_rows_by_group.items()
+        },
+    })
+
+    # One samplesheet per group, the same as generating each group on its own
+    assert list(response["samplesheetStrByGroup"].keys()) == list(fastq_list_rows_by_group.keys())
+    for group_id, group_fastq_list_rows in fastq_list_rows_by_group.items():
+        assert response["samplesheetStrByGroup"][group_id] == samplesheet_handler({
+            "workflowVersion": "2.6.0",
+            "fastqListRows": group_fastq_list_rows,
+        })["samplesheetStr"]
+    assert "L2400003" not in response["samplesheetStrByGroup"]["20250101abcd1234"]
+    assert "L2400000" not in response["samplesheetStrByGroup"]["20250101efgh5678"]
+
+    # The index distances are over the samples of both groups on each shared lane
+    assert response["indexDistances"] == samplesheet_lambda.get_index_distances(fastq_list_rows)
+    assert list(map(lambda lane_iter_: lane_iter_["lane"], response["indexDistances"])) == ["1", "2"]
+    # The closest pair on each lane is one sample from each group, closer than any pair within a group
+    for lane_index_distances in response["indexDistances"]:
+        assert lane_index_distances["closestSamplePairs"] == [
+            {"sampleIdA": "L2400002", "sampleIdB": "L2400004", "distance": 6},
+        ]
+    assert all(
+        lane_index_distances["minDistance"] > 6
+        for group_fastq_list_rows in fastq_list_rows_by_group.values()
+        for lane_index_distances in samplesheet_lambda.get_index_distances(group_fastq_list_rows)
+    )
+
+
+def test_handler_batch_mode_finds_collisions_across_groups(samplesheet_lambda, samplesheet_handler):
+    # The second group reuses the indexes of the first on the same lane, each group on its own is fine
+    group_a_fastq_list_rows = get_fastq_list_rows(samplesheet_lambda, 3, [1])
+    group_b_fastq_list_rows = list(map(
+        lambda fastq_list_row_iter_: {
+            **fastq_list_row_iter_,
+            "rgsm": fastq_list_row_iter_["rgsm"].replace("L24", "L25"),
+        },
+        group_a_fastq_list_rows
+    ))
+    event = {
+        "workflowVersion": "2.6.0",
+        "samplesheetGroups": {
+            "20250101abcd1234": {"fastqListRows": group_a_fastq_list_rows},
+            "20250101efgh5678": {"fastqListRows": group_b_fastq_list_rows},
+        },
+    }
+
+    assert samplesheet_handler(event)["indexDistances"][0]["collisions"][0] == {
+        "sampleIdA": "L2400000", "sampleIdB": "L2500000", "distance": 0,
+    }
+    with pytest.raises(ValueError, match="L2400000 / L2500000"):
+        samplesheet_handler({**event, "failOnIndexCollisions": True})
@@ -0,0 +1,40 @@
+"""
+Instrument run id of the fastqs of a workflow run
+"""
+
+# Third party imports
+import pytest
+
+# Globals
+INSTRUMENT_RUN_ID_BY_FASTQ_ID = {
+    "fqr.01JABC000001": "241024_A00130_0336_BHW7MVDSXC",
+    "fqr.01JABC000002": "241024_A00130_0336_BHW7MVDSXC",
+    "fqr.01JABC000003": "250101_A01052_0100_AHXXXXDSXC",
+}
+
+
+@pytest.fixture
+def instrument_run_id_lambda(import_lambda, monkeypatch):
+    module = import_lambda("get_instrument_run_id_from_fastq_id")
+    monkeypatch.setattr(
+        module, "get_fastq",
+        lambda fastq_id: {"id": fastq_id, "instrumentRunId": INSTRUMENT_RUN_ID_BY_FASTQ_ID[fastq_id]}
+    )
+    return module
+
+
+def test_single_fastq_id(instrument_run_id_lambda):
+    assert instrument_run_id_lambda.handler({"fastqId": "fqr.01JABC000003"}, None) == {
+        "instrumentRunId": "250101_A01052_0100_AHXXXXDSXC"
+    }
+
+
+def test_fastq_id_list(instrument_run_id_lambda):
+    assert instrument_run_id_lambda.handler({"fastqIdList": ["fqr.01JABC000001", "fqr.01JABC000002"]}, None) == {
+        "instrumentRunId": "241024_A00130_0336_BHW7MVDSXC"
+    }
+
+
+def test_multiple_instrument_runs_are_rejected(instrument_run_id_lambda):
+    with pytest.raises(ValueError, match="more than one instrument run"):
+        instrument_run_id_lambda.handler({"fastqIdList": list(INSTRUMENT_RUN_ID_BY_FASTQ_ID)}, None)
@@ -0,0 +1,235 @@
+"""
+Index pair distances of the samples on each lane
+
+Checks the vectorised distances against a pairwise scan, and that the pairwise scan is slower
+for a full instrument run (384 samples on each lane).
+"""
+
+# Standard imports
+import random
+from itertools import combinations
+from time import perf_counter
+from typing import Dict, List
+
+# Third party imports
+import pytest
+
+# Requires numpy (packaged with the samplesheet lambda)
+pytest.importorskip("numpy")
+
+# Layer imports
+from tso500_ctdna_tools.index_distances import (
+    MAX_CLOSEST_SAMPLE_PAIRS,
+    check_index_collisions,
+    encode_index_sequences,
+    get_hamming_distance_matrix,
+    get_index_distances,
+)
+
+# Globals
+INSTRUMENT_RUN_ID = "241024_A00130_0336_BHW7MVDSXC"
+NUM_BENCHMARK_SAMPLES = 384
+NUM_BENCHMARK_LANES = 4
+MIN_SPEEDUP = 10
+
+
+def get_fastq_list_row(
+        sample_id: str,
+        index_1: str,
+        index_2: str,
+        lane: int = 1,
+        instrument_run_id: str = INSTRUMENT_RUN_ID
+) -> Dict:
+    return {
+        "rgid": f"{index_1}+{index_2}.{lane}.{instrument_run_id}",
+        "rgsm": sample_id,
+    }
+
+
+def get_random_fastq_list_rows(num_samples: int, lanes: List[int], index_length: int = 10) -> List[Dict]:
+    rng = random.Random(num_samples)
+    index_pairs = [
+        ("".join(rng.choices("ACGT", k=index_length)), "".join(rng.choices("ACGT", k=index_length)))
+        for _ in range(num_samples)
+    ]
+    return [
+        get_fastq_list_row(f"L24{sample_iter:05d}", index_1, index_2, lane)
+        for lane in lanes
+        for sample_iter, (index_1, index_2) in enumerate(index_pairs)
+    ]
+
+
+def get_hamming_distance(index_a: str, index_b: str) -> int:
+    # Shorter indexes are padded, so every extra base counts as a mismatch
+    return sum(
+        base_a != base_b
+        for base_a, base_b in zip(
+            index_a.ljust(max(len(index_a), len(index_b)), "\0"),
+            index_b.ljust(max(len(index_a), len(index_b)), "\0")
+        )
+    )
+
+
+def get_index_distances_by_pairwise_scan(fastq_list_rows: List[Dict], barcode_mismatches: int = 1) -> List[Dict]:
+    index_pairs_by_lane: Dict[tuple, List[tuple]] = {}
+    for fastq_list_row in fastq_list_rows:
+        indexes, lane, instrument_run_id = fastq_list_row["rgid"].split(".", 2)
+        index_pairs_by_lane.setdefault((instrument_run_id, lane), []).append(
+            (fastq_list_row["rgsm"], *indexes.split("+"))
+        )
+
+    index_distances = []
+    for (instrument_run_id, lane), index_pairs in sorted(
+            index_pairs_by_lane.items(), key=lambda lane_iter_: (lane_iter_[0][0], int(lane_iter_[0][1]))
+    ):
+        if len(index_pairs) < 2:
+            continue
+        pair_distances = [
+            {
+                "sampleIdA": sample_a,
+                "sampleIdB": sample_b,
+                "distance": max(get_hamming_distance(i7_a, i7_b), get_hamming_distance(i5_a, i5_b)),
+            }
+            for (sample_a, i7_a, i5_a), (sample_b, i7_b, i5_b) in combinations(index_pairs, 2)
+        ]
+        min_distance = min(map(lambda pair_iter_: pair_iter_["distance"], pair_distances))
+        index_distances.append({
+            "instrumentRunId": instrument_run_id,
+            "lane": lane,
+            "minDistance": min_distance,
+            "closestSamplePairs": list(filter(
+                lambda pair_iter_: pair_iter_["distance"] == min_distance, pair_distances
+            ))[:MAX_CLOSEST_SAMPLE_PAIRS],
+            "collisions": list(filter(
+                lambda pair_iter_: pair_iter_["distance"] <= 2 * barcode_mismatches, pair_distances
+            )),
+        })
+    return index_distances
+
+
+def test_mixed_length_indexes_are_padded():
+    encoded_indexes = encode_index_sequences(["ACGTACGT", "ACGTACGTAC", "ACGTACGTAC"])
+
+    assert encoded_indexes.shape == (3, 10)
+    assert bytes(encoded_indexes[0]) == b"ACGTACGT\0\0"
+
+    # The extra bases of the longer index are mismatches, a padded position only matches another padded position
+    assert get_hamming_distance_matrix(["ACGTACGT", "ACGTACGTAC", "ACGTACGT"]).tolist() == [
+        [0, 2, 0],
+        [2, 0, 2],
+        [0, 2, 0],
+    ]
+
+
+def test_pair_distance_is_the_larger_of_the_i7_and_i5_distances():
+    fastq_list_rows = [
+        get_fastq_list_row("L2400001", "AAAAAAAA", "CCCCCCCC"),
+        # Same i7 index, the i5 index separates the samples
+        get_fastq_list_row("L2400002", "AAAAAAAA", "GGGGGCCC"),
+        # i7 distance 3 from L2400001, i5 distance 1
+        get_fastq_list_row("L2400003", "AAAAATTT", "CCCCCCCG"),
+    ]
+
+    index_distances = get_index_distances(fastq_list_rows)
+
+    assert index_distances[0]["minDistance"] == 3
+    assert index_distances[0]["closestSamplePairs"] == [
+        {"sampleIdA": "L2400001", "sampleIdB": "L2400003", "distance": 3},
+    ]
+    assert index_distances == get_index_distances_by_pairwise_scan(fastq_list_rows)
+
+
+@pytest.mark.parametrize(
+    "barcode_mismatches,i7_index_b,is_collision",
+    [
+        (1, "AAAAAATT", True),  # Distance 2, a read one mismatch from each could match either sample
+        (1, "AAAAATTT", False),  # Distance 3
+        (0, "AAAAAAAT", False),  # Distance 1 with no mismatches allowed
+        (2, "AAAATTTT", True),  # Distance 4
+        (2, "AAATTTTT", False),  # Distance 5
+    ]
+)
+def test_collision_threshold_is_twice_the_barcode_mismatches(barcode_mismatches, i7_index_b, is_collision):
+    index_distances = get_index_distances(
+        [
+            get_fastq_list_row("L2400001", "AAAAAAAA", "CCCCCCCC"),
+            get_fastq_list_row("L2400002", i7_index_b, "CCCCCCCC"),
+        ],
+        barcode_mismatches=barcode_mismatches
+    )
+
+    assert bool(index_distances[0]["collisions"]) is is_collision
+    if is_collision:
+        with pytest.raises(ValueError, match="L2400001 / L2400002"):
+            check_index_collisions(index_distances, barcode_mismatches=barcode_mismatches)
+    else:
+        check_index_collisions(index_distances, barcode_mismatches=barcode_mismatches)
+
+
+def test_closest_sample_pairs_are_capped():
+    # Each index has a single T at its own position, so every pair is at distance 2
+    num_samples = 12
+    fastq_list_rows = [
+        get_fastq_list_row(
+            f"L24{sample_iter:05d}",
+            "A" * sample_iter + "T" + "A" * (num_samples - sample_iter - 1),
+            "CCCCCCCC"
+        )
+        for sample_iter in range(num_samples)
+    ]
+
+    index_distances = get_index_distances(fastq_list_rows)
+
+    assert index_distances[0]["minDistance"] == 2
+    assert len(index_distances[0]["closestSamplePairs"]) == MAX_CLOSEST_SAMPLE_PAIRS
+    # Collisions are never capped
+    assert len(index_distances[0]["collisions"]) == num_samples * (num_samples - 1) // 2
+    assert len(get_index_distances(fastq_list_rows, max_closest_sample_pairs=3)[0]["closestSamplePairs"]) == 3
+
+
+def test_lanes_are_reported_per_instrument_run():
+    index_distances = get_index_distances([
+        get_fastq_list_row("L2400001", "AAAAAAAA", "CCCCCCCC", lane=10),
+        get_fastq_list_row("L2400002", "TTTTTTTT", "GGGGGGGG", lane=10),
+        get_fastq_list_row("L2400001", "AAAAAAAA", "CCCCCCCC", lane=2),
+        get_fastq_list_row("L2400002", "TTTTTTTT", "GGGGGGGG", lane=2),
+        # A single sample on a lane has nothing to be compared against
+        get_fastq_list_row("L2400003", "AAAAAAAA", "CCCCCCCC", lane=3),
+        # The same indexes on another instrument run do not collide
+        get_fastq_list_row(
+            "L2400003", "AAAAAAAA", "CCCCCCCC", lane=2, instrument_run_id="250101_A01052_0100_AHXXXXDSXC"
+        ),
+    ])
+
+    assert list(map(
+        lambda lane_iter_: (lane_iter_["instrumentRunId"], lane_iter_["lane"]),
+        index_distances
+    )) == [(INSTRUMENT_RUN_ID, "2"), (INSTRUMENT_RUN_ID, "10")]
+    check_index_collisions(index_distances)
+
+
+def test_matches_pairwise_scan():
+    fastq_list_rows = get_random_fastq_list_rows(48, lanes=[1, 2], index_length=6)
+
+    assert get_index_distances(fastq_list_rows) == get_index_distances_by_pairwise_scan(fastq_list_rows)
+
+
+@pytest.mark.benchmark
+def test_full_instrument_run_is_faster_than_pairwise_scan():
+    fastq_list_rows = get_random_fastq_list_rows(
+        NUM_BENCHMARK_SAMPLES, lanes=list(range(1, NUM_BENCHMARK_LANES + 1))
+    )
+
+    start_time = perf_counter()
+    expected_index_distances = get_index_distances_by_pairwise_scan(fastq_list_rows)
+    pairwise_scan_seconds = perf_counter() - start_time
+
+    start_time = perf_counter()
+    index_distances = get_index_distances(fastq_list_rows)
+    vectorised_seconds = perf_counter() - start_time
+
+    assert index_distances == expected_index_distances
+    assert pairwise_scan_seconds / vectorised_seconds >= MIN_SPEEDUP, (
+        f"{NUM_BENCHMARK_SAMPLES} samples x {NUM_BENCHMARK_LANES} lanes: "
+        f"pairwise scan {pairwise_scan_seconds:.3f}s, vectorised {vectorised_seconds:.3f}s"
+    )
@@ -0,0 +1,113 @@
+"""
+Payload fingerprints
+
+Checks that comparing fingerprints agrees with DeepDiff on whether a payload has changed,
+and that the fingerprint comparison is faster (a benchmark, run with --run-benchmarks).
+"""
+
+# Standard imports
+from copy import deepcopy
+from time import perf_counter
+
+# Third party imports
+import pytest
+
+# Layer imports
+from tso500_ctdna_tools.payloads import get_payload_fingerprint
+
+# Globals
+NUM_FASTQ_LIST_ROWS = 150
+BENCHMARK_REPEATS = 5
+MIN_SPEEDUP = 3
+
+
+def get_payload(num_fastq_list_rows: int = NUM_FASTQ_LIST_ROWS):
+    return {
+        "version": "2024.07.01",
+        "data": {
+            "tags": {"libraryId": "L2401531", "subjectId": "SBJ00001"},
+            "inputs": {
+                "fastqListRows": list(map(
+                    lambda iter_: {
+                        "rgid": f"CTGAAGCT+TCAGAGCC.{iter_ % 4 + 1}.241024_A00130_0336_BHW7MVDSXC",
+                        "rgsm": "L2401531",
+                        "rglb": "L2401531",
+                        "lane": iter_ % 4 + 1,
+                        "read1FileUri": f"s3://bucket/primary/L2401531_S{iter_}_R1_001.fastq.ora",
+                        "read2FileUri": f"s3://bucket/primary/L2401531_S{iter_}_R2_001.fastq.ora",
+                        "insertSizeEstimate": 150.0,
+                    },
+                    range(num_fastq_list_rows)
+                )),
+            },
+            "engineParameters": {"projectId": "ea19a3f5-6c19-47e1-9a26-fb8d8d3f4d1b", "pipelineId": None},
+        },
+    }
+
+
+def get_changed_payload(payload):
+    changed_payload = deepcopy(payload)
+    changed_payload["data"]["inputs"]["fastqListRows"][-1]["read2FileUri"] += ".bak"
+    return changed_payload
+
+
+def get_reordered_payload(payload):
+    # Same contents, keys in reverse order and integral floats as ints (i.e. after a round trip through another service)
+    def reorder(value):
+        if isinstance(value, dict):
+            return {key: reorder(value[key]) for key in reversed(list(value))}
+        if isinstance(value, list):
+            return list(map(reorder, value))
+        if isinstance(value, float) and value.is_integer():
+            return int(value)
+        return value
+    return reorder(payload)
+
+
+def test_fingerprint_ignores_key_order_and_integral_floats():
+    payload = get_payload()
+
+    assert get_payload_fingerprint(payload) == get_payload_fingerprint(get_reordered_payload(payload))
+    assert get_payload_fingerprint(payload) != get_payload_fingerprint(get_changed_payload(payload))
+    assert get_payload_fingerprint({"value": True}) != get_payload_fingerprint({"value": 1})
+
+
+@pytest.mark.parametrize(
+    "get_new_payload, has_changed",
+    [
+        (deepcopy, False),
+        (get_reordered_payload, False),
+        (get_changed_payload, True),
+    ]
+)
+def test_has_changed_agrees_with_deepdiff(get_new_payload, has_changed):
+    deepdiff = pytest.importorskip("deepdiff")
+    old_payload = get_payload()
+    new_payload = get_new_payload(old_payload)
+
+    assert (get_payload_fingerprint(old_payload) != get_payload_fingerprint(new_payload)) is has_changed
+    assert bool(deepdiff.DeepDiff(old_payload, new_payload, ignore_numeric_type_changes=True)) is has_changed
+
+
+@pytest.mark.benchmark
+def test_fingerprint_is_faster_than_deepdiff():
+    deepdiff = pytest.importorskip("deepdiff")
+    old_payload = get_payload()
+    new_payload = get_changed_payload(old_payload)
+
+    start_time = perf_counter()
+    for _ in range(BENCHMARK_REPEATS):
+        bool(deepdiff.DeepDiff(old_payload, new_payload, ignore_numeric_type_changes=True))
+    deepdiff_seconds = perf_counter() - start_time
+
+    start_time = perf_counter()
+    for _ in range(BENCHMARK_REPEATS):
+        get_payload_fingerprint(old_payload) != get_payload_fingerprint(new_payload)
+    fingerprint_seconds = perf_counter() - start_time
+
+    print(
+        f"{NUM_FASTQ_LIST_ROWS} rows, "
+        f"DeepDiff {deepdiff_seconds / BENCHMARK_REPEATS * 1e3:.1f} ms, "
+        f"fingerprint {fingerprint_seconds / BENCHMARK_REPEATS * 1e3:.1f} ms"
+    )
+    assert fingerprint_seconds * MIN_SPEEDUP < deepdiff_seconds
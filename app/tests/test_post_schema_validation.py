@@ -0,0 +1,301 @@
+"""
+Input validation in the post schema validation lambda, against a fake Filemanager and ICAv2
+
+The failure comments must match those of the serial, per-uri validation (the baseline) word for word
+and in the same order, whichever Filemanager existence check mode is used.
+"""
+
+# Standard imports
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Set
+
+# Third party imports
+import pytest
+
+# Globals
+TEST_BUCKET = "test-data-bucket"
+REF_DATA_BUCKET = "ref-data-bucket"
+WORKFLOW_NAME = "dragen-tso500-ctdna"
+PROJECT_ID = "ea19a3f5-6c19-47e1-9a26-fb8d8d3f4d1b"
+PROJECT_PREFIX = "s3://project-bucket/byob-icav2/development/"
+PRIMARY_PREFIX = "s3://primary-bucket/primary/241024_A00130_0336_BHW7MVDSXC/20250611c473883f/L2401531/"
+EXISTENCE_CHECK_MODES = ["prefix", "uri"]
+
+
+class FakeFilemanager:
+    """
+    The current S3 objects known to the Filemanager, counting each request
+    """
+    def __init__(self, s3_uris: Set[str], s3_file_not_found_error_cls: type):
+        self.s3_uris = s3_uris
+        self.s3_file_not_found_error_cls = s3_file_not_found_error_cls
+        self.list_requests: List[Dict] = []
+        self.lookup_requests: List[str] = []
+
+    def get_file_manager_request(self, endpoint: str, params: Dict) -> Dict:
+        self.list_requests.append(params)
+        s3_uri_prefix = f"s3://{params['bucket']}/{params['key'].rstrip('*')}"
+        keys = sorted(
+            s3_uri.split("/", 3)[3]
+            for s3_uri in self.s3_uris
+            if s3_uri.startswith(s3_uri_prefix)
+        )
+        rows_per_page = int(params["rowsPerPage"])
+        return {
+            "links": {"next": "https://file.example.com/api/v1/s3?page=2" if len(keys) > rows_per_page else None},
+            "pagination": {"count": len(keys), "page": 1, "rowsPerPage": rows_per_page},
+            "results": list(map(
+                lambda key_iter_: {"bucket": params["bucket"], "key": key_iter_},
+                keys[:rows_per_page]
+            )),
+        }
+
+    def get_s3_object_id_from_s3_uri(self, s3_uri: str) -> str:
+        self.lookup_requests.append(s3_uri)
+        if s3_uri not in self.s3_uris:
+            raise self.s3_file_not_found_error_cls(s3_uri=s3_uri)
+        return f"s3obj.{abs(hash(s3_uri))}"
+
+
+def get_baseline_existence_failure(data_uri: str, s3_uris: Set[str]) -> Optional[str]:
+    """
+    The failure comment of the baseline serial existence check
+    """
+    if data_uri.endswith("/"):
+        if not any(s3_uri.startswith(data_uri) for s3_uri in s3_uris):
+            return f"Folder URI '{data_uri}' has no files found under that prefix in the Filemanager"
+        return None
+    if data_uri not in s3_uris:
+        return f"Data URI '{data_uri}' cannot be found by the Filemanager, are you sure it exists?"
+    return None
+
+
+def get_fastq_list_row(read_1_file_uri: str, read_2_file_uri: Optional[str]) -> Dict:
+    return {
+        "rgid": "CTGAAGCT+TCAGAGCC.1.241024_A00130_0336_BHW7MVDSXC",
+        "rgsm": "L2401531",
+        "rglb": "L2401531",
+        "lane": 1,
+        "read1FileUri": read_1_file_uri,
+        "read2FileUri": read_2_file_uri,
+    }
+
+
+@pytest.fixture
+def post_schema_validation_lambda(import_lambda, monkeypatch):
+    # Read at import time
+    monkeypatch.setenv("TEST_DATA_BUCKET_NAME", TEST_BUCKET)
+    monkeypatch.setenv("REF_DATA_BUCKET_NAME", REF_DATA_BUCKET)
+    monkeypatch.setenv("WORKFLOW_NAME", WORKFLOW_NAME)
+    return import_lambda("post_schema_validation")
+
+
+@pytest.fixture
+def filemanager(post_schema_validation_lambda, monkeypatch):
+    from tso500_ctdna_tools import filemanager as filemanager_tools
+
+    fake_filemanager = FakeFilemanager(
+        {
+            # Lanes 1 and 2 in full, lane 3 is missing its R2 file
+            *(
+                f"{PRIMARY_PREFIX}L2401531_S1_L00{lane}_R{read}_001.fastq.gz"
+                for lane in [1, 2]
+                for read in [1, 2]
+            ),
+            f"{PRIMARY_PREFIX}L2401531_S1_L003_R1_001.fastq.gz",
+            f"s3://{TEST_BUCKET}/fastqs/L2401531_R1_001.fastq.gz",
+            f"s3://{TEST_BUCKET}/fastqs/L2401531_R2_001.fastq.gz",
+            f"s3://{TEST_BUCKET}/ora/L2401531/L2401531_R1_001.fastq.ora",
+            f"{PROJECT_PREFIX}fastqs/L2401531_R1_001.fastq.gz",
+            f"{PROJECT_PREFIX}fastqs/L2401531_R2_001.fastq.gz",
+            "s3://linked-bucket/fastqs/L2401531_R1_001.fastq.gz",
+            "s3://linked-bucket/fastqs/L2401531_R2_001.fastq.gz",
+            "s3://unlinked-bucket/fastqs/L2401531_R1_001.fastq.gz",
+            "s3://unknown-bucket/fastqs/L2401531_R1_001.fastq.gz",
+        },
+        post_schema_validation_lambda.S3FileNotFoundError
+    )
+    monkeypatch.setattr(filemanager_tools, "get_file_manager_request", fake_filemanager.get_file_manager_request)
+    monkeypatch.setattr(
+        post_schema_validation_lambda, "get_s3_object_id_from_s3_uri", fake_filemanager.get_s3_object_id_from_s3_uri
+    )
+    return fake_filemanager
+
+
+@pytest.fixture
+def icav2(post_schema_validation_lambda, monkeypatch):
+    def get_project_data_obj_from_uri(data_uri: str):
+        if data_uri.startswith("s3://unknown-bucket/"):
+            raise ValueError(f"Could not find {data_uri}")
+        return SimpleNamespace(data=SimpleNamespace(id=f"fil.{data_uri}"))
+
+    def get_project_data_obj_by_id(project_id: str, data_id: str):
+        if data_id.startswith("fil.s3://unlinked-bucket/"):
+            raise post_schema_validation_lambda.ApiException(status=404, reason="Not Found")
+        return SimpleNamespace(data=SimpleNamespace(id=data_id))
+
+    monkeypatch.setattr(
+        post_schema_validation_lambda, "get_cached_project_data_obj_from_uri", get_project_data_obj_from_uri
+    )
+    monkeypatch.setattr(
+        post_schema_validation_lambda, "get_cached_project_data_obj_by_id", get_project_data_obj_by_id
+    )
+
+
+def validate_inputs(post_schema_validation_lambda, fastq_list_rows: List[Dict]):
+    return post_schema_validation_lambda.validate_inputs(
+        {"sampleName": "L2401531", "fastqListRows": fastq_list_rows},
+        project_id=PROJECT_ID,
+        project_prefix=PROJECT_PREFIX,
+    )
+
+
+@pytest.mark.parametrize("existence_check_mode", EXISTENCE_CHECK_MODES)
+def test_existence_failures_match_baseline(
+        post_schema_validation_lambda, filemanager, icav2, monkeypatch, existence_check_mode
+):
+    monkeypatch.setattr(post_schema_validation_lambda, "FILEMANAGER_EXISTENCE_CHECK_MODE", existence_check_mode)
+    fastq_list_rows = [
+        get_fastq_list_row(
+            f"{PRIMARY_PREFIX}L2401531_S1_L00{lane}_R1_001.fastq.gz",
+            f"{PRIMARY_PREFIX}L2401531_S1_L00{lane}_R2_001.fastq.gz",
+        )
+        for lane in [1, 2, 3, 4]
+    ] + [
+        # A lone file, not in the Filemanager
+        get_fastq_list_row(f"s3://{TEST_BUCKET}/missing/L2401531_R1_001.fastq.gz", None),
+        # Reference data is not indexed by the Filemanager, so is never checked
+        get_fastq_list_row(f"s3://{REF_DATA_BUCKET}/fastqs/L2401531_R1_001.fastq.gz", None),
+        # Folders only need a single object under them
+        get_fastq_list_row(f"s3://{TEST_BUCKET}/ora/L2401531/", f"s3://{TEST_BUCKET}/ora/L2401532/"),
+    ]
+
+    is_valid, failures = validate_inputs(post_schema_validation_lambda, fastq_list_rows)
+
+    expected_failures = list(filter(
+        lambda failure_iter_: failure_iter_ is not None,
+        map(
+            lambda data_uri_iter_: get_baseline_existence_failure(data_uri_iter_, filemanager.s3_uris),
+            filter(
+                lambda data_uri_iter_: data_uri_iter_ and not data_uri_iter_.startswith(f"s3://{REF_DATA_BUCKET}/"),
+                (
+                    data_uri
+                    for fastq_list_row in fastq_list_rows
+                    for data_uri in (fastq_list_row["read1FileUri"], fastq_list_row["read2FileUri"])
+                )
+            )
+        )
+    ))
+    assert is_valid is False
+    assert failures == expected_failures
+    assert failures == [
+        f"Data URI '{PRIMARY_PREFIX}L2401531_S1_L003_R2_001.fastq.gz' cannot be found by the Filemanager, "
+        f"are you sure it exists?",
+        f"Data URI '{PRIMARY_PREFIX}L2401531_S1_L004_R1_001.fastq.gz' cannot be found by the Filemanager, "
+        f"are you sure it exists?",
+        f"Data URI '{PRIMARY_PREFIX}L2401531_S1_L004_R2_001.fastq.gz' cannot be found by the Filemanager, "
+        f"are you sure it exists?",
+        f"Data URI 's3://{TEST_BUCKET}/missing/L2401531_R1_001.fastq.gz' cannot be found by the Filemanager, "
+        f"are you sure it exists?",
+        f"Folder URI 's3://{TEST_BUCKET}/ora/L2401532/' has no files found under that prefix in the Filemanager",
+    ]
+
+    # Every non reference uri is checked exactly once, either by a listing or by a lookup
+    if existence_check_mode == "prefix":
+        assert filemanager.lookup_requests == [f"s3://{TEST_BUCKET}/missing/L2401531_R1_001.fastq.gz"]
+        assert len(filemanager.list_requests) == 3
+    else:
+        assert len(filemanager.lookup_requests) == 9
+        assert len(filemanager.list_requests) == 2
+    # Folder probes ask for a single row
+    assert list(map(
+        lambda params_iter_: params_iter_["rowsPerPage"],
+        filter(lambda params_iter_: params_iter_["key"].startswith("ora/"), filemanager.list_requests)
+    )) == [1, 1]
+
+
+def test_prefix_too_large_to_list_falls_back_to_lookups(
+        post_schema_validation_lambda, filemanager, icav2, monkeypatch
+):
+    from tso500_ctdna_tools import filemanager as filemanager_tools
+
+    monkeypatch.setattr(post_schema_validation_lambda, "FILEMANAGER_EXISTENCE_CHECK_MODE", "prefix")
+    monkeypatch.setattr(
+        post_schema_validation_lambda, "list_s3_keys_under_prefix",
+        lambda bucket, prefix: filemanager_tools.list_s3_keys_under_prefix(bucket, prefix, max_listing_size=2)
+    )
+    fastq_list_rows = [
+        get_fastq_list_row(
+            f"{PRIMARY_PREFIX}L2401531_S1_L00{lane}_R1_001.fastq.gz",
+            f"{PRIMARY_PREFIX}L2401531_S1_L00{lane}_R2_001.fastq.gz",
+        )
+        for lane in [1, 2, 3]
+    ]
+
+    is_valid, failures = validate_inputs(post_schema_validation_lambda, fastq_list_rows)
+
+    assert is_valid is False
+    assert failures == [
+        f"Data URI '{PRIMARY_PREFIX}L2401531_S1_L003_R2_001.fastq.gz' cannot be found by the Filemanager, "
+        f"are you sure it exists?",
+    ]
+    assert len(filemanager.list_requests) == 1
+    assert len(filemanager.lookup_requests) == 6
+
+
+@pytest.mark.parametrize("existence_check_mode", EXISTENCE_CHECK_MODES)
+def test_project_link_failures_match_baseline(
+        post_schema_validation_lambda, filemanager, icav2, monkeypatch, existence_check_mode
+):
+    monkeypatch.setattr(post_schema_validation_lambda, "FILEMANAGER_EXISTENCE_CHECK_MODE", existence_check_mode)
+    fastq_list_rows = [
+        # Test data, project data and reference data do not need to be linked
+        get_fastq_list_row(
+            f"s3://{TEST_BUCKET}/fastqs/L2401531_R1_001.fastq.gz",
+            f"s3://{TEST_BUCKET}/fastqs/L2401531_R2_001.fastq.gz",
+        ),
+        get_fastq_list_row(
+            f"{PROJECT_PREFIX}fastqs/L2401531_R1_001.fastq.gz",
+            f"{PROJECT_PREFIX}fastqs/L2401531_R2_001.fastq.gz",
+        ),
+        get_fastq_list_row(f"s3://{REF_DATA_BUCKET}/fastqs/L2401531_R1_001.fastq.gz", None),
+        get_fastq_list_row(
+            "s3://linked-bucket/fastqs/L2401531_R1_001.fastq.gz",
+            "s3://linked-bucket/fastqs/L2401531_R2_001.fastq.gz",
+        ),
+        get_fastq_list_row(
+            "s3://unknown-bucket/fastqs/L2401531_R1_001.fastq.gz",
+            "s3://unlinked-bucket/fastqs/L2401531_R1_001.fastq.gz",
+        ),
+    ]
+
+    is_valid, failures = validate_inputs(post_schema_validation_lambda, fastq_list_rows)
+
+    assert is_valid is False
+    assert failures == [
+        f"Data URI 's3://unknown-bucket/fastqs/L2401531_R1_001.fastq.gz' "
+        f"cannot be found in the project context '{PROJECT_ID}'",
+        f"Data URI 's3://unlinked-bucket/fastqs/L2401531_R1_001.fastq.gz' "
+        f"exists but is not linked to the project '{PROJECT_ID}'",
+    ]
+
+
+@pytest.mark.parametrize("existence_check_mode", EXISTENCE_CHECK_MODES)
+def test_valid_inputs(post_schema_validation_lambda, filemanager, icav2, monkeypatch, existence_check_mode):
+    monkeypatch.setattr(post_schema_validation_lambda, "FILEMANAGER_EXISTENCE_CHECK_MODE", existence_check_mode)
+
+    assert validate_inputs(
+        post_schema_validation_lambda,
+        [
+            get_fastq_list_row(
+                f"{PRIMARY_PREFIX}L2401531_S1_L00{lane}_R1_001.fastq.gz",
+                f"{PRIMARY_PREFIX}L2401531_S1_L00{lane}_R2_001.fastq.gz",
+            )
+            for lane in [1, 2]
+        ] + [
+            get_fastq_list_row(
+                "s3://linked-bucket/fastqs/L2401531_R1_001.fastq.gz",
+                "s3://linked-bucket/fastqs/L2401531_R2_001.fastq.gz",
+            ),
+        ]
+    ) == (True, [])
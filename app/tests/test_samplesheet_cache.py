@@ -0,0 +1,46 @@
+"""
+Samplesheet cache keys
+"""
+
+# Layer imports
+from tso500_ctdna_tools.samplesheet import LocalFileSamplesheetCache, get_samplesheet_cache_key
+
+# Globals
+RGID_A = "CTGAAGCT+TCAGAGCC.1.241024_A00130_0336_BHW7MVDSXC"
+RGID_G = "GAACTGAGCG+CGCTCCACGA.1.241024_A00130_0336_BHW7MVDSXC"
+
+
+def get_fastq_list_rows(*rgid_rgsm_pairs):
+    return list(map(
+        lambda rgid_rgsm_pair_iter_: {"rgid": rgid_rgsm_pair_iter_[0], "rgsm": rgid_rgsm_pair_iter_[1]},
+        rgid_rgsm_pairs
+    ))
+
+
+def test_cache_key_ignores_row_order():
+    assert (
+        get_samplesheet_cache_key(get_fastq_list_rows((RGID_A, "L1"), (RGID_G, "L2")), False) ==
+        get_samplesheet_cache_key(get_fastq_list_rows((RGID_G, "L2"), (RGID_A, "L1")), False)
+    )
+
+
+def test_cache_key_keeps_rgid_rgsm_pairing():
+    assert (
+        get_samplesheet_cache_key(get_fastq_list_rows((RGID_A, "L1"), (RGID_G, "L2")), False) !=
+        get_samplesheet_cache_key(get_fastq_list_rows((RGID_A, "L2"), (RGID_G, "L1")), False)
+    )
+
+
+def test_cache_key_includes_v3_index_support():
+    fastq_list_rows = get_fastq_list_rows((RGID_A, "L1"))
+
+    assert get_samplesheet_cache_key(fastq_list_rows, False) != get_samplesheet_cache_key(fastq_list_rows, True)
+
+
+def test_cache_round_trip(tmp_path):
+    samplesheet_cache = LocalFileSamplesheetCache(tmp_path)
+    cache_key = get_samplesheet_cache_key(get_fastq_list_rows((RGID_A, "L1")), False)
+
+    assert samplesheet_cache.get(cache_key) is None
+    samplesheet_cache.put(cache_key, "[Header]\nFileFormatVersion,2\n")
+    assert samplesheet_cache.get(cache_key) == "[Header]\nFileFormatVersion,2\n"
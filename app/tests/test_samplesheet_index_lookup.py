@@ -0,0 +1,81 @@
+"""
+ctTSO index kit lookups in the samplesheet generator
+
+Checks the hash-indexed lookups against a linear scan of the kit tables (the previous implementation),
+and that the lookups are faster than the scan over every sequence in the kits (a benchmark, run with --run-benchmarks).
+"""
+
+# Standard imports
+from time import perf_counter
+from typing import Dict, List, Optional
+
+# Third party imports
+import pytest
+
+# Globals
+BENCHMARK_REPEATS = 20
+MIN_SPEEDUP = 5
+
+
+@pytest.fixture(scope="module")
+def samplesheet_lambda(import_lambda):
+    return import_lambda("generate_minimal_samplesheet_from_fastq_id_list")
+
+
+def get_index_id_by_linear_scan(valid_indexes: List[Dict[str, str]], index_str: str, index_type: str) -> Optional[str]:
+    return next(
+        (index_dict["index_id"] for index_dict in valid_indexes if index_dict.get(index_type) == index_str),
+        None
+    )
+
+
+def get_kit_sequences(samplesheet_lambda) -> List[tuple]:
+    return [
+        (valid_indexes, index_dict[index_type], index_type)
+        for valid_indexes in samplesheet_lambda.get_cttso_valid_indexes_by_index_length().values()
+        for index_dict in valid_indexes
+        for index_type in samplesheet_lambda.CTTSO_INDEX_TYPES
+        if index_type in index_dict
+    ]
+
+
+def test_lookup_matches_linear_scan(samplesheet_lambda):
+    kit_sequences = get_kit_sequences(samplesheet_lambda)
+    assert kit_sequences
+
+    for valid_indexes, index_str, index_type in kit_sequences:
+        assert (
+            samplesheet_lambda.get_cttso_index_id_from_index(index_str, index_type) ==
+            get_index_id_by_linear_scan(valid_indexes, index_str, index_type)
+        )
+
+
+def test_lookup_unknown_index(samplesheet_lambda):
+    index_length = next(iter(samplesheet_lambda.get_cttso_valid_indexes_by_index_length()))
+
+    with pytest.raises(ValueError):
+        samplesheet_lambda.get_cttso_index_id_from_index("N" * index_length, "index")
+    assert samplesheet_lambda.get_cttso_index_id_from_index("N" * (index_length + 1), "index") is None
+
+
+@pytest.mark.benchmark
+def test_lookup_is_faster_than_linear_scan(samplesheet_lambda):
+    kit_sequences = get_kit_sequences(samplesheet_lambda)
+
+    start_time = perf_counter()
+    for _ in range(BENCHMARK_REPEATS):
+        for valid_indexes, index_str, index_type in kit_sequences:
+            get_index_id_by_linear_scan(valid_indexes, index_str, index_type)
+    linear_scan_seconds = perf_counter() - start_time
+
+    start_time = perf_counter()
+    for _ in range(BENCHMARK_REPEATS):
+        for _valid_indexes, index_str, index_type in kit_sequences:
+            samplesheet_lambda.get_cttso_index_id_from_index(index_str, index_type)
+    lookup_seconds = perf_counter() - start_time
+
+    print(
+        f"{len(kit_sequences) * BENCHMARK_REPEATS} lookups, "
+        f"linear scan {linear_scan_seconds * 1e3:.1f} ms, lookup {lookup_seconds * 1e3:.1f} ms"
+    )
+    assert lookup_seconds * MIN_SPEEDUP < linear_scan_seconds
@@ -0,0 +1,103 @@
+"""
+Overwrite-in-place samplesheet upload against the local ICAv2 stand-in
+"""
+
+# Standard imports
+from io import StringIO
+
+# Third party imports
+import pytest
+
+# Layer imports
+from tso500_ctdna_tools.samplesheet import store
+from tso500_ctdna_tools.samplesheet.store import (
+    SAMPLESHEET_BASENAME,
+    LocalSamplesheetStore,
+    SamplesheetStore,
+    upload_samplesheet,
+)
+
+# Globals
+SAMPLESHEET_STR = "[Header]\nFileFormatVersion,2\nRunName,241024_A00130_0336_BHW7MVDSXC\n"
+UPDATED_SAMPLESHEET_STR = "[Header]\nFileFormatVersion,2\nRunName,250101_A01052_0100_AHXXXXDSXC\n"
+
+
+class CountingLocalSamplesheetStore(LocalSamplesheetStore):
+    """
+    Count the deletes and writes made against the store
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.num_deletes = 0
+        self.num_writes = 0
+
+    def delete_samplesheet_file(self, samplesheet_file):
+        self.num_deletes += 1
+        super().delete_samplesheet_file(samplesheet_file)
+
+    def write_samplesheet_file(self, samplesheet_stream):
+        self.num_writes += 1
+        return super().write_samplesheet_file(samplesheet_stream)
+
+
+@pytest.fixture
+def fast_deletion_polling(monkeypatch):
+    monkeypatch.setattr(store, "DELETION_POLL_INITIAL_INTERVAL_SECONDS", 0.01)
+    monkeypatch.setattr(store, "DELETION_POLL_MAX_INTERVAL_SECONDS", 0.05)
+
+
+def test_store_interface_is_abstract():
+    with pytest.raises(TypeError):
+        SamplesheetStore()
+
+
+def test_upload_new_samplesheet(tmp_path):
+    samplesheet_store = CountingLocalSamplesheetStore(tmp_path)
+
+    samplesheet_uri = upload_samplesheet(samplesheet_store, SAMPLESHEET_STR)
+
+    assert samplesheet_uri == (tmp_path / SAMPLESHEET_BASENAME).as_uri()
+    assert (tmp_path / SAMPLESHEET_BASENAME).read_text() == SAMPLESHEET_STR
+    assert (samplesheet_store.num_deletes, samplesheet_store.num_writes) == (0, 1)
+
+
+def test_unchanged_samplesheet_is_skipped(tmp_path):
+    (tmp_path / SAMPLESHEET_BASENAME).write_text(SAMPLESHEET_STR)
+    samplesheet_store = CountingLocalSamplesheetStore(tmp_path)
+
+    samplesheet_uri = upload_samplesheet(samplesheet_store, StringIO(SAMPLESHEET_STR))
+
+    assert samplesheet_uri == (tmp_path / SAMPLESHEET_BASENAME).as_uri()
+    assert (samplesheet_store.num_deletes, samplesheet_store.num_writes) == (0, 0)
+
+
+def test_changed_samplesheet_is_replaced(tmp_path):
+    (tmp_path / SAMPLESHEET_BASENAME).write_text(SAMPLESHEET_STR)
+    samplesheet_store = CountingLocalSamplesheetStore(tmp_path)
+
+    upload_samplesheet(samplesheet_store, UPDATED_SAMPLESHEET_STR)
+
+    assert (tmp_path / SAMPLESHEET_BASENAME).read_text() == UPDATED_SAMPLESHEET_STR
+    assert (samplesheet_store.num_deletes, samplesheet_store.num_writes) == (1, 1)
+
+
+def test_delayed_deletion_is_polled(tmp_path, fast_deletion_polling):
+    (tmp_path / SAMPLESHEET_BASENAME).write_text(SAMPLESHEET_STR)
+    samplesheet_store = CountingLocalSamplesheetStore(tmp_path, delete_latency_seconds=0.1)
+
+    upload_samplesheet(samplesheet_store, UPDATED_SAMPLESHEET_STR)
+
+    assert (tmp_path / SAMPLESHEET_BASENAME).read_text() == UPDATED_SAMPLESHEET_STR
+    assert (samplesheet_store.num_deletes, samplesheet_store.num_writes) == (1, 1)
+
+
+def test_deletion_timeout(tmp_path, fast_deletion_polling, monkeypatch):
+    monkeypatch.setattr(store, "DELETION_POLL_MAX_ATTEMPTS", 3)
+    (tmp_path / SAMPLESHEET_BASENAME).write_text(SAMPLESHEET_STR)
+    samplesheet_store = CountingLocalSamplesheetStore(tmp_path, delete_latency_seconds=1)
+
+    with pytest.raises(TimeoutError):
+        upload_samplesheet(samplesheet_store, UPDATED_SAMPLESHEET_STR)
+
+    # The new samplesheet is never written over the existing one
+    assert samplesheet_store.num_writes == 0
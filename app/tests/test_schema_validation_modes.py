@@ -0,0 +1,153 @@
+"""
+Incremental and full validation of draft payloads against the packaged schema
+
+The incremental validator must report the same missing fields and the same best match error
+(message and path) as a full Draft202012Validator run, on the first run and on repeat runs
+where subtree errors come from the cache.
+"""
+
+# Standard imports
+import json
+from copy import deepcopy
+from pathlib import Path
+
+# Third party imports
+import pytest
+from jsonschema import Draft202012Validator
+
+# Requires boto3 (provided by the lambda runtime)
+pytest.importorskip("boto3")
+
+# Layer imports
+from tso500_ctdna_tools.schemas import IncrementalPayloadValidator, validate_payload
+
+# Globals
+PACKAGED_SCHEMA_PATH = (
+    Path(__file__).parent.parent / "event-schemas" / "complete-data-draft" / "2025.07.29" /
+    "complete-data-draft-schema.json"
+)
+NUM_FASTQ_LIST_ROWS = 8
+
+
+def get_valid_payload():
+    return {
+        "inputs": {
+            "sampleName": "L2401531",
+            "fastqListRows": list(map(
+                lambda iter_: {
+                    "rgid": f"CTGAAGCT+TCAGAGCC.{iter_ + 1}.241024_A00130_0336_BHW7MVDSXC",
+                    "rglb": "L2401531",
+                    "rgsm": "L2401531",
+                    "lane": iter_ + 1,
+                    "read1FileUri": f"s3://bucket/primary/L2401531_S7_L00{iter_ + 1}_R1_001.fastq.gz",
+                    "read2FileUri": f"s3://bucket/primary/L2401531_S7_L00{iter_ + 1}_R2_001.fastq.gz",
+                },
+                range(NUM_FASTQ_LIST_ROWS)
+            )),
+        },
+        "tags": {
+            "libraryId": "L2401531",
+            "fastqRgidList": list(map(
+                lambda iter_: f"CTGAAGCT+TCAGAGCC.{iter_ + 1}.241024_A00130_0336_BHW7MVDSXC",
+                range(NUM_FASTQ_LIST_ROWS)
+            )),
+        },
+        "engineParameters": {
+            "projectId": "ea19a3f5-6c19-47e1-9a26-fb8d8d3f4d1b",
+            "pipelineId": "a7f4c1a6-6a0e-4f3b-9f6f-2e5c0d3b1a11",
+            "outputUri": "s3://bucket/analysis/cttsov2/20241024abcd1234/",
+            "cacheUri": "s3://bucket/cache/cttsov2/20241024abcd1234/",
+        },
+    }
+
+
+def with_change(change):
+    payload = get_valid_payload()
+    change(payload)
+    return payload
+
+
+PAYLOADS = {
+    "valid": get_valid_payload(),
+    # Missing fields
+    "missing-top-level": with_change(lambda payload: payload.pop("tags")),
+    "missing-nested": with_change(lambda payload: payload["engineParameters"].pop("cacheUri")),
+    "missing-in-array-item": with_change(
+        lambda payload: payload["inputs"]["fastqListRows"][3].pop("read2FileUri")
+    ),
+    "missing-several": with_change(lambda payload: (
+        payload["inputs"]["fastqListRows"][0].pop("rgid"),
+        payload["inputs"]["fastqListRows"][5].pop("lane"),
+        payload["engineParameters"].pop("pipelineId"),
+    )),
+    # Typed fields
+    "wrong-type": with_change(lambda payload: payload["inputs"]["fastqListRows"][2].update({"lane": "2"})),
+    "null-field": with_change(lambda payload: payload["engineParameters"].update({"pipelineId": None})),
+    "pattern-through-ref": with_change(
+        lambda payload: payload["engineParameters"].update({"outputUri": "s3://bucket/analysis"})
+    ),
+    # Arrays
+    "array-not-an-array": with_change(lambda payload: payload["inputs"].update({"fastqListRows": {}})),
+    "array-item-wrong-type": with_change(lambda payload: payload["tags"]["fastqRgidList"].append(1)),
+    "array-item-not-an-object": with_change(lambda payload: payload["inputs"]["fastqListRows"].insert(1, "rgid")),
+    "array-empty": with_change(lambda payload: payload["inputs"].update({"fastqListRows": []})),
+    # Root
+    "root-empty": {},
+    "root-list": [],
+    "root-string": "inputs",
+    "root-null": None,
+}
+
+
+@pytest.fixture(scope="module")
+def full_validator():
+    return Draft202012Validator(json.loads(PACKAGED_SCHEMA_PATH.read_text()))
+
+
+def get_comparable_result(validator, payload):
+    validation_result = validate_payload(validator, payload)
+    first_error = validation_result["firstError"]
+    return {
+        "isValid": validation_result["isValid"],
+        "missingFields": validation_result["missingFields"],
+        "firstErrorMessage": first_error.message if first_error is not None else None,
+        "firstErrorJsonPath": first_error.json_path if first_error is not None else None,
+    }
+
+
+@pytest.mark.parametrize("payload_name", PAYLOADS)
+def test_incremental_matches_full_validation(full_validator, payload_name):
+    incremental_validator = IncrementalPayloadValidator(full_validator)
+    expected_result = get_comparable_result(full_validator, PAYLOADS[payload_name])
+
+    # First run
+    assert get_comparable_result(incremental_validator, PAYLOADS[payload_name]) == expected_result
+    misses = incremental_validator.subtree_cache.misses
+
+    # Repeat run, every subtree is a cache hit
+    assert get_comparable_result(incremental_validator, deepcopy(PAYLOADS[payload_name])) == expected_result
+    assert incremental_validator.subtree_cache.misses == misses
+
+
+def test_incremental_matches_full_validation_across_payloads(full_validator):
+    # One validator shared by every payload, as in a warm container where the payload is updated between runs
+    incremental_validator = IncrementalPayloadValidator(full_validator)
+
+    for payload_name in [*PAYLOADS, *reversed(PAYLOADS)]:
+        assert (
+            get_comparable_result(incremental_validator, PAYLOADS[payload_name]) ==
+            get_comparable_result(full_validator, PAYLOADS[payload_name])
+        ), payload_name
+
+
+def test_errors_are_reported_in_full_validation_order(full_validator):
+    incremental_validator = IncrementalPayloadValidator(full_validator)
+
+    for payload_name in PAYLOADS:
+        assert list(map(
+            lambda validation_error_iter_: (validation_error_iter_.json_path, validation_error_iter_.message),
+            incremental_validator.iter_errors(PAYLOADS[payload_name])
+        )) == list(map(
+            lambda validation_error_iter_: (validation_error_iter_.json_path, validation_error_iter_.message),
+            full_validator.iter_errors(PAYLOADS[payload_name])
+        )), payload_name
@@ -0,0 +1,368 @@
+"""
+Draft schema validator caching and resolution, against fake SSM and schema registry clients
+"""
+
+# Standard imports
+import json
+from pathlib import Path
+
+# Third party imports
+import jsonschema
+import pytest
+
+# Requires boto3 (provided by the lambda runtime)
+pytest.importorskip("boto3")
+
+# Layer imports
+from tso500_ctdna_tools import schemas
+
+# Globals
+PACKAGED_SCHEMAS_DIR = Path(__file__).parent.parent / "event-schemas"
+PACKAGED_PAYLOAD_VERSION = "2025.07.29"
+SSM_REGISTRY_NAME = "/orcabus/workflows/dragen-tso500-ctdna/schema-registry"
+SSM_SCHEMA_PATH = "/orcabus/workflows/dragen-tso500-ctdna/schemas/complete-data-draft"
+REGISTRY_NAME = "orcabus.workflows"
+SCHEMA_NAME = "orcabus.workflows@DragenTso500CtdnaCompleteDataDraft"
+SCHEMA_CACHE_TTL_SECONDS = 300
+
+
+class FakeRegistry:
+    """
+    The SSM parameters and schema registry the schemas are resolved through, counting each request
+    """
+    def __init__(self):
+        self.schema_version = "1"
+        self.schema = json.loads((
+            PACKAGED_SCHEMAS_DIR / schemas.DRAFT_SCHEMA_NAME / PACKAGED_PAYLOAD_VERSION /
+            f"{schemas.DRAFT_SCHEMA_NAME}-schema.json"
+        ).read_text())
+        self.get_parameter_calls = []
+        self.describe_schema_calls = []
+
+    def get_parameter(self, Name, WithDecryption):
+        self.get_parameter_calls.append(Name)
+        if Name == SSM_REGISTRY_NAME:
+            value = REGISTRY_NAME
+        else:
+            value = json.dumps({
+                "schemaName": SCHEMA_NAME,
+                "schemaVersion": self.schema_version,
+            })
+        return {"Parameter": {"Name": Name, "Value": value}}
+
+    def describe_schema(self, **kwargs):
+        self.describe_schema_calls.append(kwargs)
+        return {"Content": json.dumps(self.schema)}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    fake_registry = FakeRegistry()
+    monkeypatch.setattr(schemas, "get_ssm_client", lambda: fake_registry)
+    monkeypatch.setattr(schemas, "get_schemas_client", lambda: fake_registry)
+    monkeypatch.setenv(schemas.SSM_REGISTRY_NAME_ENV_VAR, SSM_REGISTRY_NAME)
+    monkeypatch.setenv(schemas.SSM_SCHEMA_PATH_ENV_VAR, SSM_SCHEMA_PATH)
+    monkeypatch.setenv(schemas.SCHEMA_CACHE_TTL_SECONDS_ENV_VAR, str(SCHEMA_CACHE_TTL_SECONDS))
+    monkeypatch.setenv(schemas.PACKAGED_SCHEMAS_DIR_ENV_VAR, str(PACKAGED_SCHEMAS_DIR))
+    monkeypatch.setenv(schemas.SCHEMA_VALIDATION_MODE_ENV_VAR, schemas.FULL_VALIDATION_MODE)
+    monkeypatch.setattr(schemas, "_SCHEMA_VALIDATOR_CACHE", {})
+    return fake_registry
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr(schemas, "monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def compiled_schemas(monkeypatch):
+    compiled_schema_list = []
+    compile_schema_validator = schemas.compile_schema_validator
+
+    def _compile_schema_validator(schema):
+        compiled_schema_list.append(schema)
+        return compile_schema_validator(schema)
+
+    monkeypatch.setattr(schemas, "compile_schema_validator", _compile_schema_validator)
+    return compiled_schema_list
+
+
+def test_registry_validator_is_cached_within_ttl(monkeypatch, registry, clock, compiled_schemas):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.REGISTRY_RESOLUTION_MODE)
+
+    validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+    clock.now += SCHEMA_CACHE_TTL_SECONDS - 1
+
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is validator
+    assert len(registry.get_parameter_calls) == 2
+    assert len(registry.describe_schema_calls) == 1
+    assert len(compiled_schemas) == 1
+
+
+def test_unchanged_schema_version_is_not_recompiled_after_ttl(monkeypatch, registry, clock, compiled_schemas):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.REGISTRY_RESOLUTION_MODE)
+
+    validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+    clock.now += SCHEMA_CACHE_TTL_SECONDS
+
+    # The schema version is re-checked in SSM, but the schema is not downloaded or compiled again
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is validator
+    assert registry.get_parameter_calls == [
+        f"{SSM_SCHEMA_PATH}/{PACKAGED_PAYLOAD_VERSION}", SSM_REGISTRY_NAME,
+        f"{SSM_SCHEMA_PATH}/{PACKAGED_PAYLOAD_VERSION}",
+    ]
+    assert len(registry.describe_schema_calls) == 1
+    assert len(compiled_schemas) == 1
+
+    # The version check restarts the ttl
+    clock.now += SCHEMA_CACHE_TTL_SECONDS - 1
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is validator
+    assert len(registry.get_parameter_calls) == 3
+
+
+def test_changed_schema_version_is_recompiled_after_ttl(monkeypatch, registry, clock, compiled_schemas):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.REGISTRY_RESOLUTION_MODE)
+
+    validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+    registry.schema_version = "2"
+    registry.schema["required"] = ["inputs"]
+
+    # Not seen until the ttl has passed
+    clock.now += SCHEMA_CACHE_TTL_SECONDS - 1
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is validator
+
+    clock.now += 1
+    refreshed_validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+
+    assert refreshed_validator is not validator
+    assert refreshed_validator.schema["required"] == ["inputs"]
+    assert registry.describe_schema_calls[-1]["SchemaVersion"] == "2"
+    assert len(compiled_schemas) == 2
+
+
+def test_validators_are_cached_per_payload_version(monkeypatch, registry, clock, compiled_schemas):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.REGISTRY_RESOLUTION_MODE)
+
+    validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+    other_validator = schemas.get_draft_schema_validator("2025.01.01")
+
+    assert other_validator is not validator
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is validator
+    assert schemas.get_draft_schema_validator("2025.01.01") is other_validator
+    assert len(compiled_schemas) == 2
+
+
+def test_validation_mode_selects_the_cached_validator(monkeypatch, registry, clock, compiled_schemas):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.REGISTRY_RESOLUTION_MODE)
+
+    validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+    monkeypatch.setenv(schemas.SCHEMA_VALIDATION_MODE_ENV_VAR, schemas.INCREMENTAL_VALIDATION_MODE)
+    incremental_validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+
+    assert isinstance(incremental_validator, schemas.IncrementalPayloadValidator)
+    assert incremental_validator.validator is validator
+    assert len(compiled_schemas) == 1
+
+
+def test_packaged_schema_is_resolved_without_the_registry(monkeypatch, registry, clock, compiled_schemas):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.PACKAGED_RESOLUTION_MODE)
+
+    validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+
+    # Packaged schemas ship with the code, so are never refreshed
+    clock.now += 10 * SCHEMA_CACHE_TTL_SECONDS
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is validator
+    assert validator.schema == registry.schema
+    assert registry.get_parameter_calls == []
+    assert registry.describe_schema_calls == []
+    assert len(compiled_schemas) == 1
+
+
+def test_packaged_resolution_is_the_default(monkeypatch, registry, clock):
+    monkeypatch.delenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, raising=False)
+
+    schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+
+    assert registry.get_parameter_calls == []
+
+
+@pytest.mark.parametrize("payload_version", ["2025.01.01", "../2025.07.29", "2025.07.29/.."])
+def test_unpackaged_payload_version_falls_back_to_the_registry(monkeypatch, registry, clock, payload_version):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.PACKAGED_RESOLUTION_MODE)
+
+    schemas.get_draft_schema_validator(payload_version)
+
+    assert registry.get_parameter_calls[0] == str(Path(SSM_SCHEMA_PATH) / payload_version)
+    assert len(registry.describe_schema_calls) == 1
+
+
+def test_packaged_resolution_without_a_packaged_schemas_dir(monkeypatch, registry, clock):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.PACKAGED_RESOLUTION_MODE)
+    monkeypatch.delenv(schemas.PACKAGED_SCHEMAS_DIR_ENV_VAR)
+
+    schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+
+    assert len(registry.describe_schema_calls) == 1
+
+
+def test_registry_resolution_ignores_packaged_schemas(monkeypatch, registry, clock):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.REGISTRY_RESOLUTION_MODE)
+
+    schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+
+    assert registry.describe_schema_calls == [{
+        "RegistryName": REGISTRY_NAME,
+        "SchemaName": SCHEMA_NAME,
+        "SchemaVersion": "1",
+    }]
+
+
+def test_packaged_with_refresh_checks_the_registry_after_ttl(monkeypatch, registry, clock, compiled_schemas):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.PACKAGED_WITH_REFRESH_RESOLUTION_MODE)
+
+    validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+    clock.now += SCHEMA_CACHE_TTL_SECONDS - 1
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is validator
+    assert registry.get_parameter_calls == []
+
+    # After the ttl the registry schema replaces the packaged schema
+    registry.schema["required"] = ["inputs"]
+    clock.now += 1
+    refreshed_validator = schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+    assert refreshed_validator.schema["required"] == ["inputs"]
+    assert len(registry.describe_schema_calls) == 1
+
+    # From then on it is refreshed like any registry schema
+    clock.now += SCHEMA_CACHE_TTL_SECONDS
+    assert schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION) is refreshed_validator
+    assert len(registry.describe_schema_calls) == 1
+    assert len(compiled_schemas) == 2
+
+
+def test_unknown_schema_resolution_mode(monkeypatch, registry):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, "local")
+
+    with pytest.raises(ValueError, match="Unknown SCHEMA_RESOLUTION_MODE 'local'"):
+        schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION)
+
+
+def get_baseline_validation(schema, data):
+    """
+    The validity and first error of the baseline validate_draft_payload lambda (jsonschema.validate),
+    and the missing fields of the baseline get_missing_schema_fields lambda
+    """
+    try:
+        jsonschema.validate(instance=data, schema=schema)
+        first_error = None
+    except jsonschema.ValidationError as e:
+        first_error = e
+
+    errors = list(jsonschema.Draft202012Validator(schema).iter_errors(data))
+    missing_fields = []
+    for error in errors:
+        path = ".".join(str(p) for p in error.absolute_path) if error.absolute_path else ""
+        if error.validator == "required":
+            for missing_prop in error.validator_value:
+                if missing_prop not in error.instance:
+                    field_path = f"{path}.{missing_prop}" if path else missing_prop
+                    missing_fields.append(field_path)
+        else:
+            if path:
+                missing_fields.append(f"{path} ({error.message[:50]})")
+
+    return {
+        "isValid": first_error is None,
+        "firstErrorMessage": first_error.message if first_error is not None else None,
+        "firstErrorJsonPath": first_error.json_path if first_error is not None else None,
+        "missingFields": sorted(set(missing_fields)),
+    }
+
+
+def get_payload():
+    return {
+        "inputs": {
+            "sampleName": "L2401531",
+            "fastqListRows": [
+                {
+                    "rgid": f"CTGAAGCT+TCAGAGCC.{lane}.241024_A00130_0336_BHW7MVDSXC",
+                    "rglb": "L2401531",
+                    "rgsm": "L2401531",
+                    "lane": lane,
+                    "read1FileUri": f"s3://bucket/primary/L2401531_S7_L00{lane}_R1_001.fastq.gz",
+                    "read2FileUri": f"s3://bucket/primary/L2401531_S7_L00{lane}_R2_001.fastq.gz",
+                }
+                for lane in [1, 2]
+            ],
+        },
+        "tags": {
+            "libraryId": "L2401531",
+            "fastqRgidList": [
+                f"CTGAAGCT+TCAGAGCC.{lane}.241024_A00130_0336_BHW7MVDSXC"
+                for lane in [1, 2]
+            ],
+        },
+        "engineParameters": {
+            "projectId": "ea19a3f5-6c19-47e1-9a26-fb8d8d3f4d1b",
+            "pipelineId": "a7f4c1a6-6a0e-4f3b-9f6f-2e5c0d3b1a11",
+            "outputUri": "s3://bucket/analysis/cttsov2/20241024abcd1234/",
+            "cacheUri": "s3://bucket/cache/cttsov2/20241024abcd1234/",
+        },
+    }
+
+
+def get_draft_payload(payload_name):
+    payload = get_payload()
+    if payload_name == "missing-top-level":
+        del payload["engineParameters"]
+    elif payload_name == "missing-nested":
+        del payload["inputs"]["fastqListRows"][1]["read2FileUri"]
+        del payload["tags"]["libraryId"]
+    elif payload_name == "invalid-fields":
+        payload["inputs"]["fastqListRows"][0]["lane"] = "1"
+        payload["engineParameters"]["outputUri"] = "s3://bucket/analysis"
+    elif payload_name == "duplicate-errors":
+        # The same missing field is reported by each row
+        for fastq_list_row in payload["inputs"]["fastqListRows"]:
+            del fastq_list_row["rgid"]
+            fastq_list_row["lane"] = None
+    elif payload_name == "empty":
+        payload = {}
+    return payload
+
+
+@pytest.mark.parametrize("validation_mode", schemas.SCHEMA_VALIDATION_MODES)
+@pytest.mark.parametrize(
+    "payload_name",
+    ["valid", "missing-top-level", "missing-nested", "invalid-fields", "duplicate-errors", "empty"]
+)
+def test_validate_payload_matches_the_baseline_lambdas(monkeypatch, registry, validation_mode, payload_name):
+    monkeypatch.setenv(schemas.SCHEMA_RESOLUTION_MODE_ENV_VAR, schemas.PACKAGED_RESOLUTION_MODE)
+    monkeypatch.setenv(schemas.SCHEMA_VALIDATION_MODE_ENV_VAR, validation_mode)
+    draft_payload = get_draft_payload(payload_name)
+
+    validation_result = schemas.validate_payload(
+        schemas.get_draft_schema_validator(PACKAGED_PAYLOAD_VERSION), draft_payload
+    )
+
+    assert {
+        "isValid": validation_result["isValid"],
+        "firstErrorMessage": (
+            validation_result["firstError"].message if validation_result["firstError"] is not None else None
+        ),
+        "firstErrorJsonPath": (
+            validation_result["firstError"].json_path if validation_result["firstError"] is not None else None
+        ),
+        "missingFields": sorted(validation_result["missingFields"]),
+    } == get_baseline_validation(registry.schema, draft_payload)
+    # Deduplicated without the set, so the order is stable between runs
+    assert len(validation_result["missingFields"]) == len(set(validation_result["missingFields"]))
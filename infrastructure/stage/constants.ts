@@ -9,6 +9,7 @@ import {
 
 export const APP_ROOT = path.join(__dirname, '../../app');
 export const LAMBDA_DIR = path.join(APP_ROOT, 'lambdas');
+export const LAYERS_DIR = path.join(APP_ROOT, 'layers');
 export const STEP_FUNCTIONS_DIR = path.join(APP_ROOT, 'step-functions-templates');
 export const EVENT_SCHEMAS_DIR = path.join(APP_ROOT, 'event-schemas');
 export const ECS_DIR = path.join(APP_ROOT, 'ecs');
@@ -1,7 +1,9 @@
 import { LambdaInput, lambdaNameList, LambdaObject, lambdaRequirementsMap } from './interfaces';
 import { PythonUvFunction } from '@orcabus/platform-cdk-constructs/lambda';
 import {
+  EVENT_SCHEMAS_DIR,
   LAMBDA_DIR,
+  LAYERS_DIR,
   SCHEMA_REGISTRY_NAME,
   SSM_SCHEMA_ROOT,
   REFERENCE_DATA_BUCKET_NAME,
@@ -21,6 +23,33 @@ import * as path from 'path';
 import * as iam from 'aws-cdk-lib/aws-iam';
 import { SchemaNames } from '../event-schemas/interfaces';
 
+function buildTso500CtdnaToolsLayer(scope: Construct): lambda.LayerVersion {
+  /*
+    Shared python helpers for the lambdas in this stack,
+    the layer is pure python so the directory is packaged as is (python/tso500_ctdna_tools)
+  */
+  return new lambda.LayerVersion(scope, 'tso500CtdnaToolsLayer', {
+    code: lambda.Code.fromAsset(path.join(LAYERS_DIR, 'tso500_ctdna_tools')),
+    compatibleRuntimes: [lambda.Runtime.PYTHON_3_14],
+    compatibleArchitectures: [lambda.Architecture.ARM_64],
+    description: 'Shared python helpers for the dragen tso500 ctdna pipeline manager',
+  });
+}
+
+function buildEventSchemasLayer(scope: Construct): lambda.LayerVersion {
+  /*
+    The versioned event schemas (the same files deployed to the schema registry),
+    so the schema validation lambdas can resolve packaged payload versions without calling SSM or the registry.
+    Layer contents are extracted to /opt, i.e. /opt/complete-data-draft/<payload-version>/complete-data-draft-schema.json
+  */
+  return new lambda.LayerVersion(scope, 'eventSchemasLayer', {
+    code: lambda.Code.fromAsset(EVENT_SCHEMAS_DIR),
+    compatibleRuntimes: [lambda.Runtime.PYTHON_3_14],
+    compatibleArchitectures: [lambda.Architecture.ARM_64],
+    description: 'Packaged event schemas for the dragen tso500 ctdna pipeline manager',
+  });
+}
+
 function buildLambda(scope: Construct, props: LambdaInput): LambdaObject {
   const lambdaNameToSnakeCase = camelCaseToSnakeCase(props.lambdaName);
   const lambdaRequirements = lambdaRequirementsMap[props.lambdaName];
@@ -58,6 +87,13 @@ function buildLambda(scope: Construct, props: LambdaInput): LambdaObject {
     true
   );
 
+  /*
+    Add in the shared tso500 ctdna tools layer
+  */
+  if (lambdaRequirements.needsTso500CtdnaTools) {
+    lambdaFunction.addLayers(props.tso500CtdnaToolsLayer);
+  }
+
   /*
     Add in SSM permissions for the lambda function
     */
@@ -128,6 +164,13 @@ function buildLambda(scope: Construct, props: LambdaInput): LambdaObject {
     Add DEFAULT_PAYLOAD_VERSION env var too
     */
     lambdaFunction.addEnvironment('DEFAULT_PAYLOAD_VERSION', DEFAULT_PAYLOAD_VERSION);
+
+    /*
+    Resolve packaged schemas from disk first, the registry is only used for unknown payload versions
+    */
+    lambdaFunction.addLayers(props.eventSchemasLayer);
+    lambdaFunction.addEnvironment('PACKAGED_SCHEMAS_DIR', '/opt');
+    lambdaFunction.addEnvironment('SCHEMA_RESOLUTION_MODE', 'packaged');
   }
 
   /*
@@ -166,11 +209,15 @@ function buildLambda(scope: Construct, props: LambdaInput): LambdaObject {
 
 export function buildAllLambdas(scope: Construct): LambdaObject[] {
   // Iterate over lambdaNameList and create the lambda functions
+  const tso500CtdnaToolsLayer = buildTso500CtdnaToolsLayer(scope);
+  const eventSchemasLayer = buildEventSchemasLayer(scope);
   const lambdaObjects: LambdaObject[] = [];
   for (const lambdaName of lambdaNameList) {
     lambdaObjects.push(
       buildLambda(scope, {
         lambdaName: lambdaName,
+        tso500CtdnaToolsLayer: tso500CtdnaToolsLayer,
+        eventSchemasLayer: eventSchemasLayer,
       })
     );
   }
@@ -1,4 +1,5 @@
 import { PythonUvFunction } from '@orcabus/platform-cdk-constructs/lambda';
+import * as lambda from 'aws-cdk-lib/aws-lambda';
 
 /**
  * Lambda function interface.
@@ -12,9 +13,7 @@ export type LambdaNameList =
   | 'getFastqListRgidsFromLibrary'
   | 'getFastqListRowsFromFastqRgidList'
   | 'checkNtsmInternalPassing'
-  | 'comparePayload'
   | 'generateWruEventObjectWithMergedData'
-  | 'getMissingSchemaFields'
   | 'getWorkflowRunObject'
   | 'getQcSummaryStatsFromRgidList'
   // Validation functions
@@ -30,7 +29,6 @@ export type LambdaNameList =
   | 'generateIcav2DataCopyPayload'
   | 'getInstrumentRunIdFromFastqId'
   | 'generateMinimalSamplesheetFromFastqIdList'
-  | 'uploadSamplesheetToCacheDirectory'
   // Post submission
   | 'addWesFailureComment'
   | 'convertIcav2WesToWrscEvent'
@@ -49,9 +47,7 @@ export const lambdaNameList: LambdaNameList[] = [
   'getFastqListRgidsFromLibrary',
   'getFastqListRowsFromFastqRgidList',
   'checkNtsmInternalPassing',
-  'comparePayload',
   'generateWruEventObjectWithMergedData',
-  'getMissingSchemaFields',
   'getWorkflowRunObject',
   'getQcSummaryStatsFromRgidList',
   // Validation functions
@@ -67,7 +63,6 @@ export const lambdaNameList: LambdaNameList[] = [
   'generateIcav2DataCopyPayload',
   'getInstrumentRunIdFromFastqId',
   'generateMinimalSamplesheetFromFastqIdList',
-  'uploadSamplesheetToCacheDirectory',
   // Post submission
   'addWesFailureComment',
   'convertIcav2WesToWrscEvent',
@@ -88,6 +83,7 @@ export interface LambdaRequirements {
   needsExternalBucketInfo?: boolean;
   needsWorkflowInfo?: boolean;
   needsRepoUrl?: boolean;
+  needsTso500CtdnaTools?: boolean;
 }
 
 // Lambda requirements mapping
@@ -102,9 +98,11 @@ export const lambdaRequirementsMap: Record<LambdaNameList, LambdaRequirements> =
   getProjectBaseUriFromProjectId: {
     needsIcav2Tools: true,
     needsOrcabusApiTools: true,
+    needsTso500CtdnaTools: true,
   },
   getFastqIdListFromFastqRgidList: {
     needsOrcabusApiTools: true,
+    needsTso500CtdnaTools: true,
   },
   getFastqListRgidsFromLibrary: {
     needsOrcabusApiTools: true,
@@ -112,23 +110,22 @@ export const lambdaRequirementsMap: Record<LambdaNameList, LambdaRequirements> =
   getFastqListRowsFromFastqRgidList: {
     needsOrcabusApiTools: true,
     needsExternalBucketInfo: true,
+    needsTso500CtdnaTools: true,
   },
   checkNtsmInternalPassing: {
     needsOrcabusApiTools: true,
+    needsTso500CtdnaTools: true,
   },
-  comparePayload: {},
   generateWruEventObjectWithMergedData: {
     needsOrcabusApiTools: true,
-  },
-  getMissingSchemaFields: {
-    needsSchemaRegistryAccess: true,
-    needsSsmParametersAccess: true,
+    needsTso500CtdnaTools: true,
   },
   getWorkflowRunObject: {
     needsOrcabusApiTools: true,
   },
   getQcSummaryStatsFromRgidList: {
     needsOrcabusApiTools: true,
+    needsTso500CtdnaTools: true,
   },
   // Validation functions
   validateDraftPayload: {
@@ -136,50 +133,56 @@ export const lambdaRequirementsMap: Record<LambdaNameList, LambdaRequirements> =
     needsSsmParametersAccess: true,
     needsOrcabusApiTools: true,
     needsWorkflowInfo: true,
+    needsTso500CtdnaTools: true,
   },
   postSchemaValidation: {
     needsIcav2Tools: true,
     needsOrcabusApiTools: true,
     needsExternalBucketInfo: true,
     needsWorkflowInfo: true,
+    needsTso500CtdnaTools: true,
   },
   // Commentary Functions
   addPopulateDraftComment: {
     needsOrcabusApiTools: true,
     needsWorkflowInfo: true,
     needsRepoUrl: true,
+    needsTso500CtdnaTools: true,
   },
   // Ready-to-ICAv2 WES Request lambda functions
   addReadyDelayComment: {
     needsOrcabusApiTools: true,
     needsWorkflowInfo: true,
+    needsTso500CtdnaTools: true,
   },
   addUploadFailureComment: {
     needsOrcabusApiTools: true,
     needsWorkflowInfo: true,
+    needsTso500CtdnaTools: true,
   },
   determineCompressionType: {
     needsOrcabusApiTools: true,
   },
   generateFastqUriByFastqIdMap: {
     needsOrcabusApiTools: true,
+    needsTso500CtdnaTools: true,
   },
   generateIcav2DataCopyPayload: {
     needsOrcabusApiTools: true,
   },
   getInstrumentRunIdFromFastqId: {
     needsOrcabusApiTools: true,
+    needsTso500CtdnaTools: true,
   },
   generateMinimalSamplesheetFromFastqIdList: {
     needsIcav2Tools: true,
-  },
-  uploadSamplesheetToCacheDirectory: {
-    needsIcav2Tools: true,
+    needsTso500CtdnaTools: true,
   },
   // Post submission
   addWesFailureComment: {
     needsOrcabusApiTools: true,
     needsWorkflowInfo: true,
+    needsTso500CtdnaTools: true,
   },
   convertIcav2WesToWrscEvent: {
     needsOrcabusApiTools: true,
@@ -204,8 +207,11 @@ export const lambdaRequirementsMap: Record<LambdaNameList, LambdaRequirements> =
 
 export interface LambdaInput {
   lambdaName: LambdaNameList;
+  tso500CtdnaToolsLayer: lambda.ILayerVersion;
+  eventSchemasLayer: lambda.ILayerVersion;
 }
 
-export interface LambdaObject extends LambdaInput {
+export interface LambdaObject {
+  lambdaName: LambdaNameList;
   lambdaFunction: PythonUvFunction;
 }
@@ -78,9 +78,7 @@ export const stepFunctionToLambdasMap: Record<StateMachineName, LambdaNameList[]
     'getQcSummaryStatsFromRgidList',
     'checkNtsmInternalPassing',
     'getWorkflowRunObject',
-    'comparePayload',
     'generateWruEventObjectWithMergedData',
-    'getMissingSchemaFields',
     'addPopulateDraftComment',
   ],
   validateDraftDataAndPutReadyEvent: ['validateDraftPayload', 'postSchemaValidation'],
@@ -93,7 +91,6 @@ export const stepFunctionToLambdasMap: Record<StateMachineName, LambdaNameList[]
     'getFastqIdListFromFastqRgidList',
     'generateMinimalSamplesheetFromFastqIdList',
     'getInstrumentRunIdFromFastqId',
-    'uploadSamplesheetToCacheDirectory',
   ],
   icav2WesEventToWrscEvent: [
     'addWesFailureComment',